@@ -1,6 +1,8 @@
 import importlib.metadata
 import re
 
+from sphinx.ext import intersphinx
+
 project = "regret"
 author = "Julian Berman"
 copyright = f"2019, {author}"
@@ -36,8 +38,17 @@ _TYPE_ALIASES = dict(
     name_of=("data", "name_of"),
 )
 
+# Names imported from other projects only while type checking, which
+# autodoc therefore cannot qualify.
+_EXTERNAL_TYPE_ALIASES = dict(date="datetime.date")
+
 
 def _resolve_broken_refs(app, env, node, contnode):
+    external = _EXTERNAL_TYPE_ALIASES.get(node["reftarget"])
+    if external is not None:
+        node["reftarget"] = external
+        return intersphinx.missing_reference(app, env, node, contnode)
+
     kind, target = _TYPE_ALIASES.get(node["reftarget"], (None, None))
     if kind is not None:
         return app.env.get_domain("py").resolve_xref(
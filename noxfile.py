@@ -8,6 +8,7 @@ ROOT = Path(__file__).parent
 PYPROJECT = ROOT / "pyproject.toml"
 DOCS = ROOT / "docs"
 PACKAGE = ROOT / "regret"
+BENCHMARKS = PACKAGE / "benchmarks"
 CONTRIBUTING = ROOT / "CONTRIBUTING.rst"
 
 REQUIREMENTS = dict(
@@ -74,6 +75,24 @@ def pytest_tests(session):
     session.run("pytest", *session.posargs, PACKAGE)
 
 
+@session(tags=["perf"], default=False)
+@nox.parametrize(
+    "benchmark",
+    [
+        nox.param(each.stem, id=each.stem)
+        for each in BENCHMARKS.glob("[!_]*.py")
+    ],
+)
+def perf(session, benchmark):
+    """
+    Run a performance benchmark.
+    """
+    session.install("pyperf", ROOT)
+    tmpdir = Path(session.create_tmp())
+    output = tmpdir / f"bench-{benchmark}.json"
+    session.run("python", BENCHMARKS / f"{benchmark}.py", "--output", output)
+
+
 @session(tags=["build"])
 def build(session):
     """
@@ -113,7 +132,7 @@ def typing(session):
     """
     Check static typing.
     """
-    session.install("pyright", ROOT)
+    session.install("pyright", ROOT, "-r", REQUIREMENTS["tests"])
     session.run("pyright", *session.posargs, PACKAGE)
 
 
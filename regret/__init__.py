@@ -6,16 +6,48 @@ from regret._api import (
     _DEPRECATOR,  # type: ignore[reportPrivateUsage]
     Deprecator,
 )
+from regret._warnings import RegretWarning
 
+attribute = _DEPRECATOR.attribute
 callable = _DEPRECATOR.callable
+category = _DEPRECATOR.category
+changed_default = _DEPRECATOR.changed_default
+Class = _DEPRECATOR.Class
+enum_member = _DEPRECATOR.enum_member
 inheritance = _DEPRECATOR.inheritance
+keyword_only_parameter = _DEPRECATOR.keyword_only_parameter
+mapping_keys = _DEPRECATOR.mapping_keys
+module = _DEPRECATOR.module
+module_alias = _DEPRECATOR.module_alias
+module_attribute = _DEPRECATOR.module_attribute
+mutually_exclusive = _DEPRECATOR.mutually_exclusive
 parameter = _DEPRECATOR.parameter
+parameter_type = _DEPRECATOR.parameter_type
+parameter_value = _DEPRECATOR.parameter_value
 optional_parameter = _DEPRECATOR.optional_parameter
+renamed_parameter = _DEPRECATOR.renamed_parameter
+with_category = _DEPRECATOR.with_category
 
 __all__ = [
+    "Class",
     "Deprecator",
+    "RegretWarning",
+    "attribute",
     "callable",
+    "category",
+    "changed_default",
+    "enum_member",
     "inheritance",
+    "keyword_only_parameter",
+    "mapping_keys",
+    "module",
+    "module_alias",
+    "module_attribute",
+    "mutually_exclusive",
     "optional_parameter",
     "parameter",
+    "parameter_type",
+    "parameter_value",
+    "renamed_parameter",
+    "with_category",
 ]
@@ -0,0 +1,180 @@
+"""
+Command line tools for managing deprecations.
+
+Run ``python -m regret overdue PACKAGE...`` to list deprecations (made
+by any package) which are past their removal dates.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import TYPE_CHECKING, TextIO
+import argparse
+import importlib
+import multiprocessing
+import os
+import pkgutil
+import sys
+
+from regret import inventory
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+
+def _modules_in(packages: Iterable[str]) -> list[str]:
+    """
+    The names of the given packages and of all modules within them.
+
+    Finding subpackages requires importing their parents, which is done
+    here (in the parent process), whereas other modules are left for
+    the workers to import.
+    """
+    names: list[str] = []
+    for name in packages:
+        names.append(name)
+        package = importlib.import_module(name)
+        path = getattr(package, "__path__", None)
+        if path is None:
+            continue
+        names.extend(
+            module.name
+            for module in pkgutil.walk_packages(
+                path,
+                prefix=f"{name}.",
+                onerror=lambda _: None,
+            )
+        )
+    return list(dict.fromkeys(names))
+
+
+def _overdue_in(
+    modules: Sequence[str],
+    today: date,
+) -> tuple[list[inventory.Entry], list[tuple[str, str]]]:
+    """
+    Import the given modules, returning the overdue deprecations they made.
+
+    Modules which fail to import are returned (with their errors) rather
+    than stopping the others from being imported.
+    """
+    failed: list[tuple[str, str]] = []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception as error:  # noqa: BLE001
+            failed.append((name, f"{type(error).__name__}: {error}"))
+    return inventory.INVENTORY.overdue(today), failed
+
+
+def _describe(entry: inventory.Entry) -> str:
+    location = entry.filename or "<unknown>"
+    if entry.lineno is not None:
+        location += f":{entry.lineno}"
+    name = entry.name
+    if entry.module is not None and name != entry.module:
+        name = f"{entry.module}.{name}"
+    description = (
+        f"{location}: {name} ({entry.kind}) was deprecated in "
+        f"{entry.version} and was due for removal on {entry.removal_date}."
+    )
+    if entry.replacement is not None:
+        description += f" Use {entry.replacement} instead."
+    return description
+
+
+def overdue(
+    packages: Sequence[str],
+    today: date,
+    jobs: int,
+    stdout: TextIO,
+    stderr: TextIO,
+) -> int:
+    """
+    Report deprecations past their removal date within the given packages.
+
+    Modules are imported in (up to) ``jobs`` separate processes, each of
+    which reports back only the overdue deprecations it found. They are
+    spawned afresh (rather than forked) so that they start from an empty
+    inventory.
+    """
+    modules = _modules_in(packages)
+    jobs = max(1, min(jobs, len(modules)))
+    chunks = [modules[i::jobs] for i in range(jobs)]
+
+    found: set[inventory.Entry] = set()
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        results = executor.map(_overdue_in, chunks, [today] * jobs)
+        for entries, failed in results:
+            found.update(entries)
+            stderr.writelines(
+                f"Could not import {name}: {error}\n" for name, error in failed
+            )
+
+    ordered = sorted(
+        found,
+        key=lambda each: (
+            each.removal_date,
+            each.filename or "",
+            each.lineno or 0,
+            each.name,
+        ),
+    )
+    stdout.writelines(f"{_describe(entry)}\n" for entry in ordered)
+    return 1 if found else 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m regret")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    overdue = subparsers.add_parser(
+        "overdue",
+        help="list deprecations which are past their removal date",
+    )
+    overdue.add_argument(
+        "packages",
+        nargs="+",
+        metavar="PACKAGE",
+        help="a package (or module) to import, along with all its modules",
+    )
+    overdue.add_argument(
+        "--today",
+        type=date.fromisoformat,
+        default=date.today(),  # noqa: DTZ011
+        help="the date to consider as today (YYYY-MM-DD)",
+    )
+    overdue.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="the number of processes in which to import modules",
+    )
+    return parser
+
+
+def main(
+    argv: Sequence[str] | None = None,
+    stdout: TextIO = sys.stdout,
+    stderr: TextIO = sys.stderr,
+) -> int:
+    """
+    Run the command line interface.
+    """
+    arguments = _parser().parse_args(argv)
+    return overdue(
+        packages=arguments.packages,
+        today=arguments.today,
+        jobs=arguments.jobs,
+        stdout=stdout,
+        stderr=stderr,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,73 @@
 from __future__ import annotations
 
-from functools import wraps
-from typing import TYPE_CHECKING
-
-from attrs import field, frozen, mutable
-
-from regret import _inspect, _sphinx, _warnings, emitted
+from functools import cached_property, partial, update_wrapper, wraps
+from types import MethodType
+from typing import TYPE_CHECKING, Any
+import importlib.metadata
+import inspect
+import sys
+
+from attrs import evolve, field, fields, frozen, mutable
+
+from regret import (
+    _clock,
+    _descriptors,
+    _enums,
+    _inspect,
+    _mappings,
+    _modules,
+    _sphinx,
+    _versions,
+    _warnings,
+    emitted,
+    inventory,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-    from typing import Any
-    import datetime
+    from collections.abc import Callable, Iterable, Mapping
+    from datetime import date
+    from enum import Enum
 
     from regret.typing import Emitter, name_of, new_docstring
 
+if sys.version_info >= (3, 13):
+    from warnings import deprecated as _warnings_deprecated
+else:  # pragma: no cover
+    _warnings_deprecated = None
+
+
+_INIT = object.__init__
+
+
+def _unchanged(thing: Any) -> Any:
+    """
+    Deprecate nothing, as a deprecation is not yet in effect.
+    """
+    return thing
+
+
+class _CallEmitting(partial[Any]):
+    """
+    A generator or coroutine function which emits when called.
+
+    Generator and coroutine functions run no code until iterated over
+    (or awaited), so one cannot itself wrap another and emit when called.
+    Partials instead can, and `inspect.isgeneratorfunction` (as well as
+    `inspect.isasyncgenfunction` and `inspect.iscoroutinefunction`) look
+    through them to the function they wrap.
+    """
+
+    emit: Callable[[], None]
+
+    def __call__(self, /, *args: Any, **kwargs: Any) -> Any:
+        self.emit()
+        return super().__call__(*args, **kwargs)
+
+    def __get__(self, instance: Any, owner: type[Any] | None = None) -> Any:
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
 
 @frozen
 class Deprecator:
@@ -56,6 +110,81 @@ class Deprecator:
             suitable for `Sphinx <sphinx:index>`, via the `deprecated`
             directive.
 
+        category:
+
+            the category of warning to emit when using the default
+            ``emit``, which should be a subclass of `DeprecationWarning`.
+            Emitted warnings carry the `regret.emitted.Deprecation` they
+            were emitted for as a ``deprecation`` attribute. If
+            unprovided, a new subclass of `regret.RegretWarning` is
+            generated for each deprecator, such that warnings from it may
+            be filtered by category.
+
+        use_warnings_deprecated:
+
+            whether to delegate deprecating functions to the standard
+            library's `warnings.deprecated` (:pep:`702`) on Python 3.13
+            and newer, where its behavior matches. It is only used for
+            functions which are not generators, and only when using the
+            default ``emit`` with no possibility of escalating ``overdue``
+            deprecations. Warnings it emits do not carry a ``deprecation``
+            attribute.
+
+        overdue:
+
+            what to do when a deprecation is used after its
+            ``removal_date``. If unprovided, nothing changes. If a
+            subclass of `Warning` (e.g. `FutureWarning`, which is shown
+            by default), warnings of that category are emitted instead
+            (when using the default ``emit``). Otherwise, it should be an
+            exception type, which is raised (with the deprecation's
+            message) instead of emitting at all.
+
+            Whether the removal date has passed is checked only when
+            emitting, against a process-wide notion of today's date which
+            is recalculated at most once a day.
+
+        today:
+
+            a callable returning today's date, used to decide whether
+            deprecations are overdue. Useful mostly for testing.
+
+        current_version:
+
+            the version of the package whose objects are being
+            deprecated. If provided, deprecations whose ``version`` is
+            newer than it are not applied at all (and therefore cost
+            nothing) until the package reaches that version. Versions
+            are compared once, when deprecating, never when deprecated
+            objects are used.
+
+            Deprecations which change behavior -- of optional, renamed
+            or aliased parameters, modules, attributes and keys -- are
+            always applied, as code relies on their behavior regardless.
+
+        distribution:
+
+            the name of an installed distribution whose version (found
+            via `importlib.metadata`, once) should be used as the
+            ``current_version``
+
+        policy:
+
+            a callable which, given the version in which an object was
+            deprecated, returns the date on or after which it should be
+            removed (or `None`). It is used to choose removal dates for
+            deprecations made without one. See `regret.policies`.
+
+        inventory:
+
+            the `regret.inventory.Inventory` in which to record the
+            deprecations made, which by default is the process-wide
+            `regret.inventory.INVENTORY`
+
+    Regardless, deprecated callables and classes have their
+    ``__deprecated__`` attribute set to their deprecation message, as
+    `warnings.deprecated` does.
+
     """
 
     _emit: Emitter = field(default=_warnings.emit, alias="emit")
@@ -64,25 +193,234 @@ class Deprecator:
         default=_sphinx.doc_with_deprecated_directive,
         alias="new_docstring",
     )
+    _category: type[Warning] = field(
+        factory=_warnings.new_category,
+        eq=False,
+        alias="category",
+    )
+    _use_warnings_deprecated: bool = field(
+        default=False,
+        alias="use_warnings_deprecated",
+    )
+    _overdue: type[Exception] | None = field(default=None, alias="overdue")
+    _today: Callable[[], date] = field(
+        default=_clock.today,
+        alias="today",
+    )
+    _current_version: str | None = field(
+        default=None,
+        alias="current_version",
+    )
+    _distribution: str | None = field(default=None, alias="distribution")
+    _policy: Callable[[str], date | None] | None = field(
+        default=None,
+        alias="policy",
+    )
+    _inventory: inventory.Inventory = field(
+        default=inventory.INVENTORY,
+        alias="inventory",
+    )
+    _current: _versions.Version | None = field(
+        init=False,
+        repr=False,
+        eq=False,
+    )
+    _mapping_call_sites: set[tuple[str, int]] = field(
+        factory=set[tuple[str, int]],
+        init=False,
+        repr=False,
+        eq=False,
+    )
+
+    def __attrs_post_init__(self) -> None:
+        current_version = self._current_version
+        if self._distribution is not None:
+            if current_version is not None:
+                raise TypeError(
+                    "Provide only one of current_version or distribution.",
+                )
+            current_version = importlib.metadata.version(self._distribution)
+        current = None
+        if current_version is not None:
+            current = _versions.parse(current_version)
+        object.__setattr__(self, "_current", current)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Arguments left as their defaults (including generated categories,
+        # which can't be found by name) are regenerated when unpickling, so
+        # that e.g. the process-wide inventory isn't copied.
+        arguments = {
+            each.alias: getattr(self, each.name)
+            for each in fields(type(self))
+            if each.init and getattr(self, each.name) is not each.default
+        }
+        if _warnings.is_generated(self._category):
+            del arguments["category"]
+        return partial(type(self), **arguments), ()
+
+    @property
+    def category(self) -> type[Warning]:
+        """
+        The category of warning emitted for this deprecator's deprecations.
+        """
+        return self._category
+
+    def with_category(self, category: type[Warning]) -> Deprecator:
+        """
+        A deprecator like this one, but which emits the given category.
+
+        Useful for giving individual deprecations categories of their own.
+        """
+        return evolve(self, category=category)
+
+    def _emit_deprecation(
+        self,
+        extra_stacklevel: int = 0,
+        removal_date: date | None = None,
+        **kwargs: Any,
+    ):
+        category = self._category
+        overdue = self._overdue
+        if (
+            overdue is not None
+            and removal_date is not None
+            and removal_date < self._today()
+        ):
+            if not issubclass(overdue, Warning):
+                raise overdue(
+                    self._message(removal_date=removal_date, **kwargs),
+                )
+            category = overdue
 
-    def _emit_deprecation(self, extra_stacklevel: int = 0, **kwargs: Any):
         self._emit(
-            deprecation=emitted.Deprecation(name_of=self._name_of, **kwargs),
+            deprecation=emitted.Deprecation(
+                name_of=self._name_of,
+                category=category,
+                removal_date=removal_date,
+                **kwargs,
+            ),
             extra_stacklevel=extra_stacklevel,
         )
 
+    def _in_effect(self, version: str) -> bool:
+        """
+        Has the package reached the given version (as far as we know)?
+        """
+        current = self._current
+        return current is None or _versions.parse(version) <= current
+
+    def _removal_date_for(
+        self,
+        version: str,
+        removal_date: date | None,
+    ) -> date | None:
+        """
+        The removal date for a deprecation, chosen by our policy if needed.
+        """
+        if removal_date is None and self._policy is not None:
+            return self._policy(version)
+        return removal_date
+
+    def _register(
+        self,
+        *,
+        kind: str,
+        version: str,
+        object: Any = None,
+        name: str | None = None,
+        module: str | None = None,
+        replacement: Any = None,
+        removal_date: date | None = None,
+        addendum: str | None = None,
+        source: tuple[str | None, int | None] = (None, None),
+    ) -> None:
+        """
+        Record a deprecation in our inventory.
+        """
+        filename, lineno = source
+        if object is not None:
+            filename, lineno = inventory.source_of(object)
+            if name is None:
+                name = self._name_of(object)
+            if module is None:
+                module = getattr(object, "__module__", None)
+        if replacement is not None and not isinstance(replacement, str):
+            replacement = self._name_of(replacement)
+        self._inventory.add(
+            inventory.Entry(
+                name=name or "",
+                module=module,
+                kind=kind,
+                version=version,
+                replacement=replacement,
+                removal_date=removal_date,
+                addendum=addendum,
+                filename=filename,
+                lineno=lineno,
+            ),
+        )
+
+    def _message(self, **kwargs: Any) -> str:
+        """
+        The message which would be emitted for the given deprecation.
+        """
+        return emitted.Deprecation(name_of=self._name_of, **kwargs).message()
+
+    def _uses_stdlib(
+        self,
+        thing: Any,
+        removal_date: date | None,
+    ) -> bool:
+        """
+        Should the given object be deprecated via `warnings.deprecated`?
+
+        It never is when it may become overdue, as `warnings.deprecated`
+        knows nothing of escalating overdue deprecations.
+        """
+        return (
+            _warnings_deprecated is not None
+            and self._use_warnings_deprecated
+            and self._emit is _warnings.emit
+            and (self._overdue is None or removal_date is None)
+            and inspect.isfunction(thing)
+            and not inspect.isgeneratorfunction(thing)
+            and not inspect.isasyncgenfunction(thing)
+        )
+
     # -- Deprecatable objects --
 
     def callable(
         self,
         version: str,
         replacement: Any = None,
-        removal_date: datetime.date | None = None,
+        removal_date: date | None = None,
         addendum: str | None = None,
     ):
         """
         Deprecate a callable as of the given version.
 
+        Coroutine functions, generator functions and asynchronous
+        generator functions remain recognizable as such (e.g. by
+        `inspect.iscoroutinefunction`) once deprecated.
+
+        Deprecated coroutine functions emit as soon as they are called,
+        before their coroutine is created, and return the original
+        coroutine itself. Deprecated generator functions (synchronous or
+        asynchronous) similarly emit as soon as they are called,
+        returning the original generator.
+
+        Descriptors such as `classmethod`, `staticmethod`, `property`
+        and `functools.cached_property` may also be deprecated (by
+        placing this decorator above their own), in which case the
+        function(s) they wrap are deprecated, preserving the way they
+        are bound. Properties emit whenever they are retrieved, set or
+        deleted (to the extent they support doing so), whereas cached
+        properties emit only when computing their value. Each such use
+        costs a single additional (Python-level) call, to the deprecated
+        function; binding itself is left to the descriptor, so bound
+        methods are created (and not cached) exactly as they otherwise
+        would be.
+
         Arguments:
 
             version:
@@ -107,17 +445,87 @@ class Deprecator:
                 warnings emitted for this deprecation
 
         """
+        if not self._in_effect(version):
+            return _unchanged
+
+        removal_date = self._removal_date_for(version, removal_date)
+
+        def deprecate(thing: Callable[..., Any]) -> Any:
+            if isinstance(thing, (classmethod, staticmethod)):
+                return type(thing)(deprecate(thing.__func__))  # type: ignore[reportUnknownVariableType]
+            elif isinstance(thing, property):
+                fget, fset, fdel = (
+                    None if each is None else deprecate(each)
+                    for each in (thing.fget, thing.fset, thing.fdel)
+                )
+                # A docstring which is the getter's own is left for the
+                # (deprecated) getter to provide, whereas one passed
+                # explicitly is kept as is.
+                doc = thing.__doc__
+                if thing.fget is not None and doc == thing.fget.__doc__:
+                    doc = None
+                return type(thing)(fget, fset, fdel, doc)
+            elif isinstance(thing, cached_property):
+                return cached_property(deprecate(thing.func))
+
+            self._register(
+                kind="callable",
+                version=version,
+                object=thing,
+                replacement=replacement,
+                removal_date=removal_date,
+                addendum=addendum,
+            )
+            emit = partial(
+                self._emit_deprecation,
+                replacement=replacement,
+                removal_date=removal_date,
+                addendum=addendum,
+            )
+            message = self._message(
+                kind=emitted.Callable(object=thing),
+                replacement=replacement,
+                removal_date=removal_date,
+                addendum=addendum,
+            )
 
-        def deprecate(thing: Callable[..., Any]):
-            @wraps(thing)
-            def call_deprecated(*args: Any, **kwargs: Any):
-                self._emit_deprecation(
-                    kind=emitted.Callable(object=call_deprecated),
-                    replacement=replacement,
-                    removal_date=removal_date,
-                    addendum=addendum,
+            call_deprecated: Any
+            if _warnings_deprecated is not None and self._uses_stdlib(
+                thing,
+                removal_date=removal_date,
+            ):
+                call_deprecated = _warnings_deprecated(
+                    message,
+                    category=self._category,
+                )(thing)
+
+            elif (
+                inspect.isgeneratorfunction(thing)
+                or inspect.isasyncgenfunction(thing)
+                or inspect.iscoroutinefunction(thing)
+            ):
+                emitting = _CallEmitting(thing)
+                update_wrapper(emitting, thing)
+                emitting.emit = partial(
+                    emit,
+                    kind=emitted.Callable(object=emitting),
+                )
+                call_deprecated = emitting
+
+            else:
+
+                @wraps(thing)
+                def calling(*args: Any, **kwargs: Any) -> Any:
+                    emit_call()
+                    return thing(*args, **kwargs)
+
+                # This is the hot path (e.g. for deprecated properties
+                # read in loops), so the emitted kind is built up front.
+                emit_call = partial(
+                    emit,
+                    kind=emitted.Callable(object=calling),
                 )
-                return thing(*args, **kwargs)
+                call_deprecated = calling
 
             __doc__ = thing.__doc__
             if __doc__ is not None:
@@ -128,11 +536,128 @@ class Deprecator:
                     removal_date=removal_date,
                     version=version,
                 )
+            call_deprecated.__deprecated__ = message
 
             return call_deprecated
 
         return deprecate
 
+    def Class(
+        self,
+        version: str,
+        replacement: Any = None,
+        removal_date: date | None = None,
+        addendum: str | None = None,
+    ):
+        """
+        Deprecate a class as of the given version, whilst keeping it a class.
+
+        Unlike `Deprecator.callable`, the class itself is returned
+        (rather than a function which creates instances of it), and
+        therefore continues to work with `isinstance`, `issubclass` and
+        subclassing.
+
+        A deprecation is emitted whenever the class is directly
+        instantiated, via a ``__new__`` which is installed on the class
+        in place. Instantiating (non-deprecated) subclasses of the class
+        does not emit.
+
+        Arguments:
+
+            version:
+
+                the first version in which the deprecated class was
+                considered deprecated
+
+            replacement:
+
+                optionally, an object that is the (direct or indirect)
+                replacement for the functionality previously performed
+                by the deprecated class
+
+            removal_date (datetime.date):
+
+                optionally, a date when the class is expected to be
+                removed entirely
+
+            addendum (str):
+
+                an optional additional message to include at the end of
+                warnings emitted for this deprecation
+
+        """
+        if not self._in_effect(version):
+            return _unchanged
+
+        removal_date = self._removal_date_for(version, removal_date)
+
+        def deprecate(cls: type) -> type:
+            self._register(
+                kind="Class",
+                version=version,
+                object=cls,
+                replacement=replacement,
+                removal_date=removal_date,
+                addendum=addendum,
+            )
+            emit = partial(
+                self._emit_deprecation,
+                kind=emitted.Callable(object=cls),
+                replacement=replacement,
+                removal_date=removal_date,
+                addendum=addendum,
+            )
+
+            new: Callable[..., Any] = cls.__new__
+
+            def __new__(type: type, *args: Any, **kwargs: Any) -> Any:
+                if type is cls:
+                    emit()
+                # object.__new__ complains about arguments once it's been
+                # overridden, so don't pass them through (__init__ gets
+                # them). This is decided per call, as subclasses may define
+                # an __init__ even if cls doesn't.
+                if new is object.__new__ and type.__init__ is not _INIT:
+                    return new(type)
+                return new(type, *args, **kwargs)
+
+            try:
+                signature = inspect.signature(cls)
+            except (TypeError, ValueError):  # pragma: no cover
+                pass
+            else:
+                # Otherwise the signature of the class becomes __new__'s.
+                __new__.__signature__ = signature.replace(
+                    parameters=[
+                        inspect.Parameter(
+                            "type",
+                            inspect.Parameter.POSITIONAL_ONLY,
+                        ),
+                        *signature.parameters.values(),
+                    ],
+                )
+            cls.__new__ = staticmethod(__new__)
+
+            __doc__ = cls.__doc__
+            if __doc__ is not None:
+                cls.__doc__ = self._new_docstring(
+                    object=cls,
+                    name_of=self._name_of,
+                    replacement=replacement,
+                    removal_date=removal_date,
+                    version=version,
+                )
+            cls.__deprecated__ = self._message(
+                kind=emitted.Callable(object=cls),
+                replacement=replacement,
+                removal_date=removal_date,
+                addendum=addendum,
+            )
+
+            return cls
+
+        return deprecate
+
     def parameter(self, version: str, name: str):
         """
         Deprecate a parameter that was previously required and will be removed.
@@ -155,12 +680,21 @@ class Deprecator:
                 the parameter as retrieved from the keyword arguments.
 
         """
+        if not self._in_effect(version):
+            return _unchanged
 
         def deprecate(thing: Callable[..., Any]):
-            return Regretted.for_callable(thing).with_parameter(
+            wrapper = Regretted.for_callable(thing).with_parameter(
                 name=name,
                 emit=self._emit_deprecation,
             )
+            self._register(
+                kind="parameter",
+                version=version,
+                object=thing,
+                name=f"{self._name_of(thing)}({name})",
+            )
+            return wrapper
 
         return deprecate
 
@@ -198,88 +732,1073 @@ class Deprecator:
         """
 
         def deprecate(thing: Callable[..., Any]):
-            return Regretted.for_callable(thing).with_optional_parameter(
+            wrapper = Regretted.for_callable(thing).with_optional_parameter(
                 name=name,
                 emit=self._emit_deprecation,
                 default=default,
             )
+            self._register(
+                kind="optional_parameter",
+                version=version,
+                object=thing,
+                name=f"{self._name_of(thing)}({name})",
+            )
+            return wrapper
 
         return deprecate
 
-    def inheritance(self, version: str):
+    def parameter_value(
+        self,
+        version: str,
+        name: str,
+        values: Iterable[Any] = (),
+        predicate: Callable[[Any], bool] | None = None,
+    ):
         """
-        Deprecate allowing a class to be subclassed.
+        Deprecate passing particular values for a parameter.
+
+        Calls which do not pass the parameter at all are not bound to
+        the callable's signature, and incur only minimal overhead.
 
         Arguments:
 
             version:
 
-                the first version in which the deprecated object was
-                considered deprecated
+                the first version in which the values were considered
+                deprecated
+
+            name:
+
+                the name of the parameter as specified in the callable's
+                signature.
+
+                Parameters accepted only via arbitrary keyword arguments
+                ("``kwargs``") are also supported and should be
+                specified using the name of the parameter as retrieved
+                from the keyword arguments.
+
+            values:
+
+                the deprecated values, which will be compared with
+                values passed by callers for equality (by hashing them,
+                if they are hashable)
+
+            predicate:
+
+                optionally, a callable which will be called with values
+                which are not amongst the provided ones, and which
+                should return whether they are deprecated
 
         """
+        if not self._in_effect(version):
+            return _unchanged
 
-        def deprecate(cls: type) -> type:
-            @wraps(cls, updated=())
-            class DeprecatedForSubclassing(cls):  # type: ignore[reportUntypedBaseClass]
-                def __init_subclass__(Subclass, **kwargs: Any) -> None:  # type: ignore[reportSelfClsParameterName]
-                    self._emit_deprecation(
-                        kind=emitted.Inheritance(
-                            type=DeprecatedForSubclassing,  # type: ignore[reportGeneralTypeIssues]
-                        ),
-                    )
-                    super().__init_subclass__(**kwargs)  # type: ignore[reportUnknownMemberType]
+        deprecated = _inspect.DeprecatedValues.from_values(
+            values=values,
+            predicate=predicate,
+        )
 
-            return DeprecatedForSubclassing  # type: ignore[reportGeneralTypeIssues]
+        def deprecate(thing: Callable[..., Any]):
+            wrapper = Regretted.for_callable(thing).with_parameter_value(
+                name=name,
+                values=deprecated,
+                emit=self._emit_deprecation,
+            )
+            self._register(
+                kind="parameter_value",
+                version=version,
+                object=thing,
+                name=f"{self._name_of(thing)}({name})",
+            )
+            return wrapper
 
         return deprecate
 
+    def parameter_type(
+        self,
+        version: str,
+        name: str,
+        types: type | tuple[type, ...],
+    ):
+        """
+        Deprecate passing values of particular types for a parameter.
 
-@mutable
-class Regretted:
-    """
-    A partially regretted callable.
-    """
+        Whether each type of value passed is deprecated is remembered,
+        so that repeated calls with values of the same type need not
+        recheck it.
 
-    callable: Callable[..., Any]
-    signature: _inspect.SignatureWithRegret
+        Arguments:
 
-    @classmethod
-    def for_callable(
-        cls,
-        callable: Callable[..., Any],
-        **kwargs: Any,
-    ) -> Regretted:
-        regretted = getattr(callable, "__regretted__", None)
-        if regretted is not None:
-            return regretted
-        return cls(
-            callable=callable,
-            signature=_inspect.SignatureWithRegret.for_callable(callable),
-            **kwargs,
-        )
+            version:
 
-    def with_parameter(self, emit: Emitter, name: str):
-        self.signature = self.signature.with_parameter(name)
-        return self.wrapper(emit=emit)
+                the first version in which the types were considered
+                deprecated
 
-    def with_optional_parameter(self, emit: Emitter, name: str, default: Any):
-        self.signature = self.signature.with_optional_parameter(
-            name=name,
-            default=default,
+            name:
+
+                the name of the parameter as specified in the callable's
+                signature.
+
+                Parameters accepted only via arbitrary keyword arguments
+                ("``kwargs``") are also supported and should be
+                specified using the name of the parameter as retrieved
+                from the keyword arguments.
+
+            types:
+
+                the deprecated type (or a tuple of deprecated types).
+                Values which are instances of any of them (or of their
+                subclasses) will emit.
+
+        """
+        if not self._in_effect(version):
+            return _unchanged
+
+        deprecated = _inspect.DeprecatedTypes(
+            types=types if isinstance(types, tuple) else (types,),
         )
-        return self.wrapper(emit=emit)
 
-    def wrapper(self, emit: Emitter):
-        @wraps(self.callable)
-        def wrapper(*args: Any, **kwargs: Any):
-            bound = self.signature.bind(*args, **kwargs)
-            for each, optional in self.signature.misused(
+        def deprecate(thing: Callable[..., Any]):
+            wrapper = Regretted.for_callable(thing).with_parameter_value(
+                name=name,
+                values=deprecated,
+                emit=self._emit_deprecation,
+            )
+            self._register(
+                kind="parameter_type",
+                version=version,
+                object=thing,
+                name=f"{self._name_of(thing)}({name})",
+            )
+            return wrapper
+
+        return deprecate
+
+    def renamed_parameter(self, version: str, old: str, new: str):
+        """
+        Deprecate a parameter which has been renamed.
+
+        The callable should be written (only) in terms of the new name.
+        Keyword arguments passed using the old name are rewritten to
+        use the new one before the callable is called, and passing both
+        names is an error. Calls which do not use the old name pay only
+        for checking whether it was passed.
+
+        Arguments:
+
+            version:
+
+                the first version in which the old name was considered
+                deprecated
+
+            old:
+
+                the previous name of the parameter
+
+            new:
+
+                the name of the parameter as specified in the callable's
+                signature.
+
+                Parameters accepted only via arbitrary keyword arguments
+                ("``kwargs``") are also supported and should be
+                specified using the name of the parameter as retrieved
+                from the keyword arguments.
+
+        """
+
+        def deprecate(thing: Callable[..., Any]):
+            wrapper = Regretted.for_callable(thing).with_renamed_parameter(
+                old=old,
+                new=new,
+                emit=self._emit_deprecation,
+            )
+            self._register(
+                kind="renamed_parameter",
+                version=version,
+                object=thing,
+                name=f"{self._name_of(thing)}({old})",
+                replacement=new,
+            )
+            return wrapper
+
+        return deprecate
+
+    def changed_default(self, version: str, name: str, new_default: Any):
+        """
+        Deprecate relying on the current default value of a parameter.
+
+        Unlike `Deprecator.optional_parameter`, the parameter remains
+        optional, and the callable continues to receive its current
+        default until the change is made.
+
+        Whether the parameter was omitted is decided from the number
+        of positional arguments and the keyword arguments' names, so
+        calls which provide it need not bind their arguments.
+
+        Arguments:
+
+            version:
+
+                the first version in which relying on the current
+                default was considered deprecated
+
+            name:
+
+                the name of the parameter as specified in the callable's
+                signature, which must have a default
+
+            new_default:
+
+                the value which will become the parameter's default
+
+        """
+        if not self._in_effect(version):
+            return _unchanged
+
+        def deprecate(thing: Callable[..., Any]):
+            wrapper = Regretted.for_callable(thing).with_changed_default(
+                name=name,
+                new_default=new_default,
+                emit=self._emit_deprecation,
+            )
+            self._register(
+                kind="changed_default",
+                version=version,
+                object=thing,
+                name=f"{self._name_of(thing)}({name})",
+            )
+            return wrapper
+
+        return deprecate
+
+    def keyword_only_parameter(self, version: str, name: str):
+        """
+        Deprecate passing positionally a parameter becoming keyword-only.
+
+        Whether the parameter was passed positionally is decided from the
+        number of positional arguments alone, so calls passing it by
+        keyword (or not at all) need not bind their arguments.
+
+        Arguments:
+
+            version:
+
+                the first version in which passing the parameter
+                positionally was considered deprecated
+
+            name:
+
+                the name of the parameter as specified in the callable's
+                signature. It must currently be possible to pass it
+                positionally.
+
+        """
+        if not self._in_effect(version):
+            return _unchanged
+
+        def deprecate(thing: Callable[..., Any]):
+            wrapper = Regretted.for_callable(thing).with_keyword_only(
+                name=name,
+                emit=self._emit_deprecation,
+            )
+            self._register(
+                kind="keyword_only_parameter",
+                version=version,
+                object=thing,
+                name=f"{self._name_of(thing)}({name})",
+            )
+            return wrapper
+
+        return deprecate
+
+    def mutually_exclusive(self, version: str, names: Iterable[str]):
+        """
+        Deprecate passing some parameters of a callable together.
+
+        Which parameters are passed is tracked as a bitmask computed
+        from the number of positional arguments and the keyword
+        arguments' names, so calls which pass at most one of the
+        parameters need not bind their arguments.
+
+        Arguments:
+
+            version:
+
+                the first version in which passing the parameters
+                together was considered deprecated
+
+            names:
+
+                the names of (at least two of) the parameters as
+                specified in the callable's signature, any more than one
+                of which should no longer be passed in the same call.
+
+                Parameters accepted only via arbitrary keyword arguments
+                ("``kwargs``") are also supported and should be
+                specified using the name of the parameter as retrieved
+                from the keyword arguments.
+
+        """
+        names = tuple(dict.fromkeys(names))
+        if len(names) < 2:  # noqa: PLR2004
+            raise ValueError(
+                f"At least two parameters are needed, not {names!r}.",
+            )
+        if not self._in_effect(version):
+            return _unchanged
+
+        def deprecate(thing: Callable[..., Any]):
+            regretted = Regretted.for_callable(thing)
+            order_of = regretted.signature.order_of
+            wrapper = regretted.with_mutually_exclusive(
+                names=names,
+                emit=self._emit_deprecation,
+            )
+            group = ", ".join(sorted(names, key=order_of))
+            self._register(
+                kind="mutually_exclusive",
+                version=version,
+                object=thing,
+                name=f"{self._name_of(thing)}({group})",
+            )
+            return wrapper
+
+        return deprecate
+
+    def inheritance(self, version: str, in_place: bool = False):
+        """
+        Deprecate allowing a class to be subclassed.
+
+        Arguments:
+
+            version:
+
+                the first version in which the deprecated object was
+                considered deprecated
+
+            in_place:
+
+                whether to modify the class itself (by installing an
+                ``__init_subclass__`` on it, which calls any one it
+                previously had) rather than return a new subclass of
+                it. Doing so leaves the class's MRO (and that of its
+                instances) untouched.
+
+        """
+        if not self._in_effect(version):
+            return _unchanged
+
+        def deprecate_in_place(cls: type) -> type:
+            self._register(kind="inheritance", version=version, object=cls)
+
+            init_subclass = cls.__dict__.get("__init_subclass__")
+
+            def __init_subclass__(Subclass: type, **kwargs: Any) -> None:
+                self._emit_deprecation(kind=emitted.Inheritance(type=cls))
+                if init_subclass is None:
+                    super(cls, Subclass).__init_subclass__(**kwargs)
+                else:
+                    init_subclass.__get__(None, Subclass)(**kwargs)
+
+            cls.__init_subclass__ = classmethod(__init_subclass__)  # type: ignore[reportAttributeAccessIssue]
+            cls.__deprecated__ = self._message(
+                kind=emitted.Inheritance(type=cls),
+            )
+            return cls
+
+        if in_place:
+            return deprecate_in_place
+
+        def deprecate(cls: type) -> type:
+            self._register(kind="inheritance", version=version, object=cls)
+
+            @wraps(cls, updated=())
+            class DeprecatedForSubclassing(cls):  # type: ignore[reportUntypedBaseClass]
+                def __init_subclass__(Subclass, **kwargs: Any) -> None:  # type: ignore[reportSelfClsParameterName]
+                    self._emit_deprecation(
+                        kind=emitted.Inheritance(
+                            type=DeprecatedForSubclassing,  # type: ignore[reportGeneralTypeIssues]
+                        ),
+                    )
+                    super().__init_subclass__(**kwargs)  # type: ignore[reportUnknownMemberType]
+
+            DeprecatedForSubclassing.__deprecated__ = self._message(  # type: ignore[reportAttributeAccessIssue]
+                kind=emitted.Inheritance(type=DeprecatedForSubclassing),  # type: ignore[reportGeneralTypeIssues]
+            )
+            return DeprecatedForSubclassing  # type: ignore[reportGeneralTypeIssues]
+
+        return deprecate
+
+    def attribute(
+        self,
+        version: str,
+        name: str,
+        replacement: Any = None,
+        removal_date: date | None = None,
+        addendum: str | None = None,
+    ):
+        """
+        Deprecate an attribute (or method) of a class or of its instances.
+
+        The class is modified in place, with the attribute replaced by
+        a descriptor which emits when it is retrieved, e.g.:
+
+        .. code-block:: python
+
+            @regret.attribute(version="1.2.3", name="timeout")
+            class Connection:
+                __slots__ = ("host", "timeout")
+
+        Attributes which are (or are retrieved via) data descriptors
+        on the class, such as instance attributes, slots or properties,
+        emit only when retrieved from instances, and continue to store
+        their values as they did previously (in the instance's
+        ``__dict__`` or in the original descriptor). Setting them does
+        not emit, so that the class may continue to do so itself.
+
+        Other attributes, such as methods or constant class attributes,
+        emit whenever retrieved, whether from the class or an instance.
+
+        Arguments:
+
+            version:
+
+                the first version in which the attribute was considered
+                deprecated
+
+            name:
+
+                the name of the deprecated attribute
+
+            replacement:
+
+                optionally, an object that is the (direct or indirect)
+                replacement for the deprecated attribute
+
+            removal_date (datetime.date):
+
+                optionally, a date when the attribute is expected to be
+                removed entirely
+
+            addendum (str):
+
+                an optional additional message to include at the end of
+                warnings emitted for this deprecation
+
+        """
+        if not self._in_effect(version):
+            return _unchanged
+
+        removal_date = self._removal_date_for(version, removal_date)
+
+        def deprecate(cls: type) -> type:
+            self._register(
+                kind="attribute",
+                version=version,
+                object=cls,
+                name=f"{self._name_of(cls)}.{name}",
+                replacement=replacement,
+                removal_date=removal_date,
+                addendum=addendum,
+            )
+            emit = partial(
+                self._emit_deprecation,
+                kind=emitted.Attribute(type=cls, name=name),
+                replacement=replacement,
+                removal_date=removal_date,
+                addendum=addendum,
+            )
+
+            existing = next(
+                (vars(each) for each in cls.__mro__ if name in vars(each)),
+                None,
+            )
+            descriptor: Any
+            if existing is None:
+                descriptor = _descriptors.DeprecatedInstanceAttribute(
+                    name=name,
+                    wrapped=None,
+                    emit=emit,
+                )
+            elif inspect.isdatadescriptor(existing[name]):
+                descriptor = _descriptors.DeprecatedInstanceAttribute(
+                    name=name,
+                    wrapped=existing[name],
+                    emit=emit,
+                )
+            else:
+                descriptor = _descriptors.DeprecatedClassAttribute(
+                    wrapped=existing[name],
+                    emit=emit,
+                )
+            setattr(cls, name, descriptor)
+            return cls
+
+        return deprecate
+
+    def module(
+        self,
+        version: str,
+        name: str,
+        removal_date: date | None = None,
+        addendum: str | None = None,
+    ) -> None:
+        """
+        Deprecate an entire module.
+
+        A deprecation is emitted whenever the module is imported (i.e.
+        the first time it is imported, as it is subsequently retrieved
+        from `sys.modules`), via a finder installed on `sys.meta_path`.
+
+        This should be called before the module is imported, e.g. from
+        within its parent package:
+
+        .. code-block:: python
+
+            regret.module(version="1.2.3", name="mypackage.legacy")
+
+        Arguments:
+
+            version:
+
+                the first version in which the module was considered
+                deprecated
+
+            name:
+
+                the (fully qualified) name of the deprecated module
+
+            removal_date (datetime.date):
+
+                optionally, a date when the module is expected to be
+                removed entirely
+
+            addendum (str):
+
+                an optional additional message to include at the end of
+                warnings emitted for this deprecation, e.g. to indicate
+                which module should be used instead
+
+        """
+        if not self._in_effect(version):
+            return
+
+        removal_date = self._removal_date_for(version, removal_date)
+
+        self._register(
+            kind="module",
+            version=version,
+            name=name,
+            module=name,
+            removal_date=removal_date,
+            addendum=addendum,
+        )
+        _modules.DeprecatedModuleFinder.installed().add(
+            name=name,
+            emit=partial(
+                self._emit_deprecation,
+                kind=emitted.Module(name=name),
+                removal_date=removal_date,
+                addendum=addendum,
+            ),
+        )
+
+    def enum_member(
+        self,
+        version: str,
+        name: str,
+        replacement: Enum | None = None,
+        removal_date: date | None = None,
+        addendum: str | None = None,
+    ):
+        """
+        Deprecate a member of an `enum.Enum`.
+
+        The member emits when retrieved as an attribute (``Color.RED``),
+        by name (``Color["RED"]``) or by value (``Color("red")``), but
+        not when iterating over the enum. The enum is modified in place.
+
+        Retrieving any other member as an attribute remains an ordinary
+        class attribute lookup. The enum's metaclass is replaced by a
+        subclass of it which checks for deprecated members when looking
+        up members by name or value, which in both cases already
+        involves calling into the metaclass. The enum thus remains an
+        instance of its original metaclass, though no longer a direct
+        one.
+
+        A member which is an alias (i.e. which shares its value with an
+        earlier member) emits only when retrieved as an attribute or by
+        name, as lookup by value finds the earlier member.
+
+        Arguments:
+
+            version:
+
+                the first version in which the member was considered
+                deprecated
+
+            name:
+
+                the name of the deprecated member
+
+            replacement:
+
+                optionally, another member of the enum which replaces
+                the deprecated one
+
+            removal_date (datetime.date):
+
+                optionally, a date when the member is expected to be
+                removed entirely
+
+            addendum (str):
+
+                an optional additional message to include at the end of
+                warnings emitted for this deprecation
+
+        """
+        if not self._in_effect(version):
+            return _unchanged
+
+        removal_date = self._removal_date_for(version, removal_date)
+
+        def deprecate(enum: type[Enum]) -> type[Enum]:
+            self._register(
+                kind="enum_member",
+                version=version,
+                object=enum,
+                name=f"{self._name_of(enum)}.{name}",
+                replacement=(
+                    None
+                    if replacement is None
+                    else f"{self._name_of(enum)}.{replacement.name}"
+                ),
+                removal_date=removal_date,
+                addendum=addendum,
+            )
+            emit = partial(
+                self._emit_deprecation,
+                kind=emitted.EnumMember(
+                    type=enum,
+                    name=name,
+                    replacement=replacement,
+                ),
+                removal_date=removal_date,
+                addendum=addendum,
+            )
+            _enums.deprecate_member(enum=enum, name=name, emit=emit)
+            return enum
+
+        return deprecate
+
+    def mapping_keys(
+        self,
+        version: str,
+        mapping: Mapping[Any, Any],
+        *,
+        renamed: Mapping[Any, Any] | None = None,
+        removed: Iterable[Any] = (),
+        removal_date: date | None = None,
+        addendum: str | None = None,
+    ) -> dict[Any, Any]:
+        """
+        Deprecate some keys of a mapping, e.g. of configuration.
+
+        A new dictionary is returned containing the mapping's items,
+        which emits whenever a deprecated key is retrieved, checked for,
+        set or deleted (including via methods such as ``update`` or
+        ``pop``). Copying it does not emit. Renamed keys are
+        transparently redirected to their new names. Deprecated keys
+        present in the mapping itself are emitted for immediately.
+
+        Retrieving non-deprecated keys via subscripting remains an
+        ordinary (C-level) dictionary lookup.
+
+        Arguments:
+
+            version:
+
+                the first version in which the keys were considered
+                deprecated
+
+            mapping:
+
+                the mapping whose items should be contained in the
+                returned dictionary
+
+            renamed:
+
+                a mapping from each renamed key to its new name
+
+            removed:
+
+                keys which are deprecated without replacement. They will
+                continue to be stored, but will not appear when iterating
+                over the dictionary.
+
+            removal_date (datetime.date):
+
+                optionally, a date when the keys are expected to be
+                removed entirely
+
+            addendum (str):
+
+                an optional additional message to include at the end of
+                warnings emitted for this deprecation
+
+        """
+        removed = tuple(removed)
+        removal_date = self._removal_date_for(version, removal_date)
+        emit = partial(
+            self._emit_deprecation,
+            removal_date=removal_date,
+            addendum=addendum,
+        )
+        # Mappings are often created repeatedly at runtime, so their keys
+        # are recorded only the first time each call site creates one.
+        caller = sys._getframe(1)  # type: ignore[reportPrivateUsage]
+        call_site = caller.f_code.co_filename, caller.f_lineno
+        if call_site not in self._mapping_call_sites:
+            self._mapping_call_sites.add(call_site)
+            for key in [*(renamed or {}), *removed]:
+                self._register(
+                    kind="mapping_keys",
+                    version=version,
+                    name=repr(key),
+                    replacement=(
+                        None
+                        if renamed is None or key not in renamed
+                        else repr(renamed[key])
+                    ),
+                    removal_date=removal_date,
+                    addendum=addendum,
+                    source=call_site,
+                )
+        return _mappings.DeprecatedKeys(
+            data=mapping,
+            renamed=renamed or {},
+            removed=removed,
+            emit=emit,
+        )
+
+    def module_attribute(
+        self,
+        version: str,
+        module: str,
+        name: str,
+        value: Any,
+        *,
+        replacement: Any = None,
+        removal_date: date | None = None,
+        addendum: str | None = None,
+        promote: bool = False,
+    ) -> None:
+        """
+        Deprecate an attribute of a module.
+
+        The attribute is served by a module ``__getattr__`` (see
+        :pep:`562`), which is installed on the module if needed, and
+        which defers to any ``__getattr__`` the module previously
+        defined for attributes which are not deprecated.
+
+        Typically, this will be called from within the module whose
+        attribute is being deprecated, e.g.:
+
+        .. code-block:: python
+
+            regret.module_attribute(
+                version="1.2.3",
+                module=__name__,
+                name="DEFAULT_TIMEOUT",
+                value=30,
+            )
+
+        Arguments:
+
+            version:
+
+                the first version in which the attribute was considered
+                deprecated
+
+            module:
+
+                the (fully qualified) name of the module whose
+                attribute is deprecated, which must already be present
+                within `sys.modules`
+
+            name:
+
+                the name of the deprecated attribute
+
+            value:
+
+                the value of the deprecated attribute. Any value already
+                present in the module's namespace under the same name is
+                removed, as it otherwise would shadow the deprecation.
+
+            replacement:
+
+                optionally, an object that is the (direct or indirect)
+                replacement for the deprecated attribute
+
+            removal_date (datetime.date):
+
+                optionally, a date when the attribute is expected to be
+                removed entirely
+
+            addendum (str):
+
+                an optional additional message to include at the end of
+                warnings emitted for this deprecation
+
+            promote:
+
+                whether to emit only once, on first access, after
+                which the value is moved into the module's namespace,
+                making subsequent accesses ordinary (and fast) attribute
+                lookups.
+
+        """
+        removal_date = self._removal_date_for(version, removal_date)
+        namespace = sys.modules[module]
+        self._register(
+            kind="module_attribute",
+            version=version,
+            name=name,
+            module=module,
+            replacement=replacement,
+            removal_date=removal_date,
+            addendum=addendum,
+        )
+        _modules.DeprecatedAttributes.of(namespace).add(
+            name=name,
+            value=value,
+            emit=partial(
+                self._emit_deprecation,
+                kind=emitted.ModuleAttribute(module=namespace, name=name),
+                replacement=replacement,
+                removal_date=removal_date,
+                addendum=addendum,
+            ),
+            promote=promote,
+        )
+
+    def module_alias(
+        self,
+        version: str,
+        module: str,
+        target: str,
+        *,
+        name: str | None = None,
+        removal_date: date | None = None,
+        addendum: str | None = None,
+        promote: bool = False,
+    ) -> None:
+        """
+        Deprecate an attribute of a module which has moved elsewhere.
+
+        The object the attribute now refers to is specified as a string,
+        and is not imported until the deprecated attribute is first
+        accessed, so that importing the module containing the alias
+        does not import the object's new home.
+
+        Otherwise, this behaves as `Deprecator.module_attribute`, with
+        the object being considered the deprecated attribute's
+        replacement, e.g.:
+
+        .. code-block:: python
+
+            regret.module_alias(
+                version="1.2.3",
+                module=__name__,
+                target="mypackage.new:Thing",
+            )
+
+        Arguments:
+
+            version:
+
+                the first version in which the alias was considered
+                deprecated
+
+            module:
+
+                the (fully qualified) name of the module containing the
+                alias, which must already be present within `sys.modules`
+
+            target:
+
+                the object the alias refers to, in the format accepted
+                by `pkgutil.resolve_name`, i.e. ``"package.module:name"``
+
+            name:
+
+                the name of the alias within the module. If unprovided,
+                the last component of the target's name is used.
+
+            removal_date (datetime.date):
+
+                optionally, a date when the alias is expected to be
+                removed entirely
+
+            addendum (str):
+
+                an optional additional message to include at the end of
+                warnings emitted for this deprecation
+
+            promote:
+
+                whether to emit only once, on first access, after which
+                the object is moved into the module's namespace
+
+        """
+        removal_date = self._removal_date_for(version, removal_date)
+        if name is None:
+            name = target.rpartition(":")[2].rpartition(".")[2]
+        namespace = sys.modules[module]
+        self._register(
+            kind="module_alias",
+            version=version,
+            name=name,
+            module=module,
+            replacement=target,
+            removal_date=removal_date,
+            addendum=addendum,
+        )
+        _modules.DeprecatedAttributes.of(namespace).add_alias(
+            name=name,
+            target=target,
+            emit=partial(
+                self._emit_deprecation,
+                kind=emitted.ModuleAttribute(module=namespace, name=name),
+                removal_date=removal_date,
+                addendum=addendum,
+            ),
+            promote=promote,
+        )
+
+
+@mutable
+class Regretted:
+    """
+    A partially regretted callable.
+    """
+
+    callable: Callable[..., Any]
+    signature: _inspect.SignatureWithRegret
+
+    @classmethod
+    def for_callable(
+        cls,
+        callable: Callable[..., Any],
+        **kwargs: Any,
+    ) -> Regretted:
+        regretted = getattr(callable, "__regretted__", None)
+        if regretted is not None:
+            return regretted
+        return cls(
+            callable=callable,
+            signature=_inspect.SignatureWithRegret.for_callable(callable),
+            **kwargs,
+        )
+
+    def with_parameter(self, emit: Emitter, name: str):
+        self.signature = self.signature.with_parameter(name)
+        return self.wrapper(emit=emit)
+
+    def with_optional_parameter(self, emit: Emitter, name: str, default: Any):
+        self.signature = self.signature.with_optional_parameter(
+            name=name,
+            default=default,
+        )
+        return self.wrapper(emit=emit)
+
+    def with_parameter_value(
+        self,
+        emit: Emitter,
+        name: str,
+        values: _inspect.ValueCheck,
+    ):
+        self.signature = self.signature.with_deprecated_values(
+            name=name,
+            values=values,
+        )
+        return self.wrapper(emit=emit)
+
+    def with_renamed_parameter(self, emit: Emitter, old: str, new: str):
+        self.signature = self.signature.with_renamed_parameter(old, new)
+        return self.wrapper(emit=emit)
+
+    def with_changed_default(
+        self,
+        emit: Emitter,
+        name: str,
+        new_default: Any,
+    ):
+        self.signature = self.signature.with_changed_default(
+            name=name,
+            new_default=new_default,
+        )
+        return self.wrapper(emit=emit)
+
+    def with_keyword_only(self, emit: Emitter, name: str):
+        self.signature = self.signature.with_keyword_only(name)
+        return self.wrapper(emit=emit)
+
+    def with_mutually_exclusive(self, emit: Emitter, names: Iterable[str]):
+        self.signature = self.signature.with_mutually_exclusive(names=names)
+        return self.wrapper(emit=emit)
+
+    def wrapper(self, emit: Emitter):
+        @wraps(self.callable)
+        def wrapper(*args: Any, **kwargs: Any):
+            signature = self.signature
+            if signature.renames:
+                for old, parameter in signature.rename(args, kwargs):
+                    emit(
+                        kind=emitted.RenamedParameter(
+                            callable=wrapper,
+                            old=old,
+                            parameter=parameter,
+                        ),
+                    )
+            if signature.restricts_positional:
+                for parameter in signature.passed_positionally(args):
+                    emit(
+                        kind=emitted.PositionalParameter(
+                            callable=wrapper,
+                            parameter=parameter,
+                        ),
+                    )
+            if signature.changes_defaults:
+                for parameter, new in signature.omitted(args, kwargs):
+                    emit(
+                        kind=emitted.ChangedDefault(
+                            callable=wrapper,
+                            parameter=parameter,
+                            new_default=new,
+                        ),
+                    )
+            if signature.excludes:
+                for group, passed in signature.passed_together(args, kwargs):
+                    emit(
+                        kind=emitted.MutuallyExclusiveParameters(
+                            callable=wrapper,
+                            parameters=passed,
+                            group=group,
+                        ),
+                    )
+            if not signature.might_be_misused(args, kwargs):
+                return self.callable(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            for each, optional in signature.misused(
                 bound_arguments=bound,
                 callable=wrapper,
             ):
                 if optional:
-                    default = self.signature.set_default(bound, parameter=each)
+                    default = signature.set_default(bound, parameter=each)
                     kind = emitted.OptionalParameter(
                         callable=wrapper,
                         parameter=each,
@@ -288,6 +1807,9 @@ class Regretted:
                 else:
                     kind = emitted.Parameter(callable=wrapper, parameter=each)
                 emit(kind=kind)
+            misused_values = signature.misused_values(bound_arguments=bound)
+            for each, value, check in misused_values:
+                emit(kind=check.kind(wrapper, parameter=each, value=value))
             return self.callable(*bound.args, **bound.kwargs)
 
         wrapper.__regretted__ = self  # type: ignore[reportGeneralTypeIssues]
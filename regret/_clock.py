@@ -0,0 +1,48 @@
+"""
+A process-wide notion of today's date, which is cheap to check.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+import time as _time
+
+from attrs import field, mutable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@mutable
+class Today:
+    """
+    Today's date, recalculated only once the (local) day has changed.
+
+    Checking whether it needs recalculating costs a clock read, rather
+    than constructing a new `datetime.date` each time. The clock is the
+    wall clock (rather than a monotonic one), as monotonic clocks stop
+    while the system is suspended, which would leave the date stale.
+    """
+
+    _now: Callable[[], datetime] = field(default=datetime.now, alias="now")
+    _clock: Callable[[], float] = field(default=_time.time, alias="clock")
+    _today: date = field(default=date.min, init=False)
+    _refresh_at: float = field(default=float("-inf"), init=False)
+
+    def __call__(self) -> date:
+        clock = self._clock()
+        if clock >= self._refresh_at:
+            now = self._now()
+            tomorrow = datetime.combine(
+                now.date() + timedelta(days=1),
+                time(),
+                tzinfo=now.tzinfo,
+            )
+            self._today = now.date()
+            self._refresh_at = clock + (tomorrow - now).total_seconds()
+        return self._today
+
+
+#: Today, as shared by the whole process.
+today = Today()
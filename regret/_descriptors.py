@@ -0,0 +1,96 @@
+"""
+Descriptors which emit deprecations when accessed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+
+class DeprecatedClassAttribute:
+    """
+    A (non-data) descriptor wrapping a deprecated attribute of a class.
+
+    Methods are also deprecated in this way, as are any other non-data
+    descriptors, which are bound as usual once the deprecation has been
+    emitted.
+    """
+
+    __slots__ = ("_emit", "_get", "_wrapped")
+
+    def __init__(self, wrapped: object, emit: Callable[[], None]):
+        self._wrapped = wrapped
+        self._get = getattr(type(wrapped), "__get__", None)
+        self._emit = emit
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        self._emit()
+        if self._get is None:
+            return self._wrapped
+        return self._get(self._wrapped, instance, owner)
+
+
+class DeprecatedInstanceAttribute:
+    """
+    A data descriptor wrapping a deprecated attribute of instances.
+
+    Values are stored wherever they were before deprecation -- in the
+    instance's ``__dict__``, or in whichever data descriptor (such as a
+    slot) was previously present on the class -- so no additional
+    storage is used.
+
+    Only retrieving the attribute from an instance emits, such that the
+    class continuing to set the attribute itself (e.g. in ``__init__``)
+    does not. Retrieving an attribute which has no value raises an
+    `AttributeError` without emitting.
+    """
+
+    __slots__ = ("_emit", "_name", "_wrapped")
+
+    def __init__(
+        self,
+        name: str,
+        wrapped: Any | None,
+        emit: Callable[[], None],
+    ):
+        self._name = name
+        self._wrapped = wrapped
+        self._emit = emit
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        if self._wrapped is not None:
+            value = self._wrapped.__get__(instance, owner)
+        else:
+            try:
+                value = instance.__dict__[self._name]
+            except KeyError:
+                raise AttributeError(
+                    f"{type(instance).__name__!r} object has no attribute "
+                    f"{self._name!r}",
+                    name=self._name,
+                    obj=instance,
+                ) from None
+        self._emit()
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        if self._wrapped is not None:
+            self._wrapped.__set__(instance, value)
+        else:
+            instance.__dict__[self._name] = value
+
+    def __delete__(self, instance: Any) -> None:
+        if self._wrapped is not None:
+            self._wrapped.__delete__(instance)
+            return
+        try:
+            del instance.__dict__[self._name]
+        except KeyError:
+            raise AttributeError(self._name, name=self._name, obj=instance)
+
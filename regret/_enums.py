@@ -0,0 +1,95 @@
+"""
+Deprecation of individual members of enumerations.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from regret._descriptors import DeprecatedClassAttribute
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from enum import Enum, EnumType
+    from typing import Any
+
+#: Metaclasses of enums with deprecated members, by their original metaclass.
+_METACLASSES: dict[type[EnumType], type[EnumType]] = {}
+
+
+def _emitters(cls: type[Any]) -> dict[str, Callable[[], None]]:
+    """
+    The emitters of each deprecated member of the given enum, by name.
+    """
+    return cls.__dict__["__regret_deprecated_members__"]
+
+
+def _deprecating(metaclass: type[EnumType]) -> type[EnumType]:
+    """
+    A subclass of the given enum metaclass which knows of deprecated members.
+
+    Only lookups by name (``Color["RED"]``) and by value (``Color("red")``)
+    are affected, both of which already are Python-level calls. Attribute
+    access (``Color.RED``) remains an ordinary class attribute lookup, with
+    deprecated members alone being replaced by descriptors.
+
+    Enums using the subclass remain instances of the original metaclass.
+    The subclass is named after it and made a global of this module, so
+    that it may be pickled (by reference) like any other class.
+    """
+    deprecating = _METACLASSES.get(metaclass)
+    if deprecating is not None:
+        return deprecating
+
+    class DeprecatingEnumType(metaclass):
+        def __getitem__(cls, name: str) -> Any:
+            emit = _emitters(cls).get(name)
+            if emit is not None:
+                emit()
+            return super().__getitem__(name)
+
+        def __call__(cls, value: Any, *args: Any, **kwargs: Any) -> Any:
+            member = metaclass.__call__(cls, value, *args, **kwargs)
+            emit = _emitters(cls).get(getattr(member, "_name_", ""))
+            if emit is not None:
+                emit()
+            return member
+
+    name = f"Deprecating{metaclass.__name__}"
+    while name in globals():
+        name += "_"
+    DeprecatingEnumType.__name__ = DeprecatingEnumType.__qualname__ = name
+    globals()[name] = _METACLASSES[metaclass] = DeprecatingEnumType
+    return DeprecatingEnumType
+
+
+def deprecate_member(
+    enum: type[Enum],
+    name: str,
+    emit: Callable[[], None],
+) -> None:
+    """
+    Deprecate the given member of an enum in place.
+    """
+    member = enum._member_map_.get(name)
+    if member is None:
+        raise AttributeError(f"{enum.__qualname__} has no member {name!r}")
+
+    deprecated = enum.__dict__.get("__regret_deprecated_members__")
+    if deprecated is None:
+        deprecated = {}
+        type.__setattr__(enum, "__regret_deprecated_members__", deprecated)
+        enum.__class__ = _deprecating(type(enum))  # type: ignore[reportAttributeAccessIssue]
+    elif name in deprecated:
+        raise ValueError(f"{enum.__qualname__}.{name} is already deprecated.")
+    deprecated[name] = emit
+
+    # Bypass EnumType.__setattr__, which prevents reassigning members.
+    type.__setattr__(
+        enum,
+        name,
+        DeprecatedClassAttribute(
+            wrapped=enum.__dict__.get(name, member),
+            emit=emit,
+        ),
+    )
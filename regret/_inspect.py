@@ -10,8 +10,19 @@ import inspect
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
 
+    from regret.typing import Deprecatable
+
 from attrs import evolve, field, frozen
 
+from regret import emitted
+
+_POSITIONAL = frozenset(
+    [
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    ],
+)
+
 
 class AlreadyDeprecated(Exception):
     """
@@ -25,6 +36,112 @@ class NoSuchParameter(Exception):
     """
 
 
+@frozen
+class DeprecatedValues:
+    """
+    Values for a parameter which are deprecated.
+
+    Hashable values are checked via a (precomputed) `frozenset`, with
+    any unhashable ones compared in turn, followed by an (optional)
+    predicate.
+    """
+
+    _hashable: frozenset[Any] = field(alias="hashable")
+    _unhashable: tuple[Any, ...] = field(alias="unhashable")
+    _predicate: Callable[[Any], bool] | None = field(alias="predicate")
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Iterable[Any],
+        predicate: Callable[[Any], bool] | None = None,
+    ) -> DeprecatedValues:
+        hashable: set[Any] = set()
+        unhashable: list[Any] = []
+        for value in values:
+            try:
+                hashable.add(value)
+            except TypeError:
+                unhashable.append(value)
+        return cls(
+            hashable=frozenset(hashable),
+            unhashable=tuple(unhashable),
+            predicate=predicate,
+        )
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            if value in self._hashable:
+                return True
+        except TypeError:
+            pass
+        if any(value == each for each in self._unhashable):
+            return True
+        return self._predicate is not None and self._predicate(value)
+
+    def kind(
+        self,
+        callable: Callable[..., Any],
+        parameter: inspect.Parameter,
+        value: Any,
+    ) -> Deprecatable:
+        """
+        The kind of deprecation to emit for a deprecated value.
+        """
+        return emitted.ParameterValue(
+            callable=callable,
+            parameter=parameter,
+            value=value,
+        )
+
+
+@frozen
+class DeprecatedTypes:
+    """
+    Types of values for a parameter which are deprecated.
+
+    Whether a given type is deprecated is remembered (for a bounded
+    number of types), so that checking a value of a type seen previously
+    costs a single dictionary lookup, rather than a potentially
+    expensive `issubclass` check (e.g. against an abstract base class).
+    """
+
+    _types: tuple[type, ...] = field(alias="types")
+    _max_cached: int = field(default=256, alias="max_cached")
+    _verdicts: dict[type[Any], bool] = field(
+        factory=dict[type[Any], bool],
+        init=False,
+    )
+
+    def __contains__(self, value: object) -> bool:
+        cls = type(value)
+        verdict = self._verdicts.get(cls)
+        if verdict is None:
+            verdict = issubclass(cls, self._types)
+            if len(self._verdicts) < self._max_cached:
+                self._verdicts[cls] = verdict
+        return verdict
+
+    def kind(
+        self,
+        callable: Callable[..., Any],
+        parameter: inspect.Parameter,
+        value: object,
+    ) -> Deprecatable:
+        """
+        The kind of deprecation to emit for a value of a deprecated type.
+        """
+        return emitted.ParameterType(
+            callable=callable,
+            parameter=parameter,
+            type=type(value),
+        )
+
+
+#: Checks for deprecated values of a parameter.
+ValueCheck = DeprecatedValues | DeprecatedTypes
+
+
 @frozen
 class SignatureWithRegret:
     """
@@ -37,8 +154,46 @@ class SignatureWithRegret:
         factory=dict,
         alias="defaults_for_optional_parameters",
     )
+    _deprecated_values: dict[str, tuple[ValueCheck, ...]] = field(
+        factory=dict[str, tuple[ValueCheck, ...]],
+        alias="deprecated_values",
+    )
+    _mutually_exclusive: tuple[tuple[str, ...], ...] = field(
+        default=(),
+        alias="mutually_exclusive",
+    )
+    _renamed: dict[str, str] = field(
+        factory=dict[str, str],
+        alias="renamed",
+    )
+    _becoming_keyword_only: tuple[str, ...] = field(
+        default=(),
+        alias="becoming_keyword_only",
+    )
+    _changed_defaults: dict[str, Any] = field(
+        factory=dict[str, Any],
+        alias="changed_defaults",
+    )
     kwargs_parameter_name: str | None = field(init=False)
+    #: Whether calls may pass parameters under a previous name.
+    renames: bool = field(init=False)
+    #: Whether calls may pass parameters becoming keyword-only by position.
+    restricts_positional: bool = field(init=False)
+    #: Whether calls may omit parameters whose default is changing.
+    changes_defaults: bool = field(init=False)
+    #: Whether calls may pass mutually exclusive parameters together.
+    excludes: bool = field(init=False)
     _order: dict[str | None, int] = field(init=False)
+    _touched_by: tuple[tuple[str, int | None], ...] | None = field(
+        init=False,
+    )
+    _bits: dict[str, int] = field(init=False)
+    _bits_by_position: tuple[int, ...] = field(init=False)
+    _exclusive_masks: tuple[int, ...] = field(init=False)
+    _fewest_positional_misusing: int | None = field(init=False)
+    _omittable: tuple[tuple[inspect.Parameter, int | None, Any], ...] = field(
+        init=False,
+    )
 
     def __attrs_post_init__(self) -> None:
         object.__setattr__(
@@ -65,6 +220,63 @@ class SignatureWithRegret:
             },
         )
 
+        # Which parameters, if passed (by name or position), need checking.
+        # None means a call must always be bound, as something must be
+        # checked even for parameters which were *not* passed.
+        touched_by = None
+        if not self._defaults_for_optional_parameters:
+            touched_by = tuple(
+                (name, self.position_of(name))
+                for name in [*self._deprecated, *self._deprecated_values]
+            )
+        object.__setattr__(self, "_touched_by", touched_by)
+
+        # Mutually exclusive parameters are checked via bitmasks, with
+        # each parameter in any group assigned a bit, and each group a
+        # mask of its parameters' bits. _bits_by_position[n] is the mask of
+        # parameters passed when n arguments are passed positionally.
+        bits: dict[str, int] = {}
+        for group in self._mutually_exclusive:
+            for name in group:
+                bits.setdefault(name, 1 << len(bits))
+        object.__setattr__(self, "_bits", bits)
+
+        by_position = [0]
+        for name in self._signature.parameters:
+            if self.position_of(name) is None:
+                break
+            by_position.append(by_position[-1] | bits.get(name, 0))
+        object.__setattr__(self, "_bits_by_position", tuple(by_position))
+
+        masks = tuple(
+            sum(bits[name] for name in group)
+            for group in self._mutually_exclusive
+        )
+        object.__setattr__(self, "_exclusive_masks", masks)
+
+        # Parameters becoming keyword-only are misused whenever more
+        # positional arguments are passed than precede the first of them.
+        fewest = None
+        if self._becoming_keyword_only:
+            fewest = self._order[self._becoming_keyword_only[0]] + 1
+        object.__setattr__(self, "_fewest_positional_misusing", fewest)
+
+        # A parameter whose default is changing was omitted if it was not
+        # passed by keyword, nor were enough arguments passed positionally
+        # to reach it.
+        omittable = tuple(
+            (self._signature.parameters[name], self.position_of(name), new)
+            for name, new in self._changed_defaults.items()
+        )
+        object.__setattr__(self, "_omittable", omittable)
+
+        # Which of the checks made before binding are needed at all, such
+        # that calls need not pay for those which are not.
+        object.__setattr__(self, "renames", bool(self._renamed))
+        object.__setattr__(self, "restricts_positional", fewest is not None)
+        object.__setattr__(self, "changes_defaults", bool(omittable))
+        object.__setattr__(self, "excludes", bool(masks))
+
     @classmethod
     def for_callable(
         cls,
@@ -76,6 +288,42 @@ class SignatureWithRegret:
             **kwargs,
         )
 
+    def position_of(self, name: str) -> int | None:
+        """
+        The position at which the given parameter may be passed, if any.
+        """
+        parameter = self._signature.parameters.get(name)
+        if parameter is None or parameter.kind not in _POSITIONAL:
+            return None
+        return self._order[name]
+
+    def order_of(self, name: str) -> tuple[int, str]:
+        """
+        A key ordering parameters as they are defined.
+
+        Parameters accepted only via arbitrary keyword arguments are
+        ordered where the arbitrary keyword arguments are, by name.
+        """
+        return (
+            self._order.get(
+                name,
+                self._order.get(self.kwargs_parameter_name, -1),
+            ),
+            name,
+        )
+
+    def _parameter_named(self, name: str) -> inspect.Parameter:
+        """
+        The parameter with the given name, even if only accepted via kwargs.
+        """
+        parameter = self._signature.parameters.get(name)
+        if parameter is None:
+            parameter = inspect.Parameter(
+                name=name,
+                kind=inspect.Parameter.KEYWORD_ONLY,
+            )
+        return parameter
+
     def would_accept(self, name: str):
         """
         Does this signature know about a parameter with the given name?
@@ -94,16 +342,7 @@ class SignatureWithRegret:
         elif name in self._deprecated:
             raise AlreadyDeprecated(name)
 
-        deprecated = sorted(
-            [*self._deprecated, name],
-            key=lambda each: (
-                self._order.get(
-                    each,
-                    self._order.get(self.kwargs_parameter_name, -1),
-                ),
-                each,
-            ),
-        )
+        deprecated = sorted([*self._deprecated, name], key=self.order_of)
         return evolve(self, deprecated=deprecated, **kwargs)
 
     def with_optional_parameter(self, name: str, default: Any):
@@ -118,6 +357,247 @@ class SignatureWithRegret:
             },
         )
 
+    def with_deprecated_values(
+        self,
+        name: str,
+        values: ValueCheck,
+    ) -> SignatureWithRegret:
+        """
+        Evolve this signature to add deprecated values for a parameter.
+        """
+        if not self.would_accept(name):
+            raise NoSuchParameter(name)
+        existing = self._deprecated_values.get(name, ())
+        if any(type(each) is type(values) for each in existing):
+            raise AlreadyDeprecated(name)
+        return evolve(
+            self,
+            deprecated_values={
+                **self._deprecated_values,
+                name: (*existing, values),
+            },
+        )
+
+    def with_renamed_parameter(
+        self,
+        old: str,
+        new: str,
+    ) -> SignatureWithRegret:
+        """
+        Evolve this signature to accept a parameter under a previous name.
+        """
+        if not self.would_accept(new):
+            raise NoSuchParameter(new)
+        elif old in self._renamed:
+            raise AlreadyDeprecated(old)
+        elif old in self._signature.parameters:
+            raise ValueError(f"{old!r} is still a parameter of the callable.")
+        return evolve(self, renamed={**self._renamed, old: new})
+
+    def rename(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> list[tuple[str, inspect.Parameter]]:
+        """
+        Rewrite (in place) keyword arguments passed using a previous name.
+
+        Returns the previous names used, along with the parameter each
+        now refers to.
+        """
+        renamed: list[tuple[str, inspect.Parameter]] = []
+        for old, new in self._renamed.items():
+            if old not in kwargs:
+                continue
+            position = self.position_of(new)
+            positionally = position is not None and len(args) > position
+            if new in kwargs or positionally:
+                raise TypeError(
+                    f"Got values for both {old!r} and its new name {new!r}.",
+                )
+            kwargs[new] = kwargs.pop(old)
+            renamed.append((old, self._parameter_named(new)))
+        return renamed
+
+    def with_keyword_only(self, name: str) -> SignatureWithRegret:
+        """
+        Evolve this signature to deprecate passing a parameter positionally.
+        """
+        if name not in self._signature.parameters:
+            raise NoSuchParameter(name)
+        elif name in self._becoming_keyword_only:
+            raise AlreadyDeprecated(name)
+        elif self.position_of(name) is None:
+            raise ValueError(f"{name!r} cannot be passed positionally.")
+        return evolve(
+            self,
+            becoming_keyword_only=tuple(
+                sorted(
+                    [*self._becoming_keyword_only, name],
+                    key=self._order.__getitem__,
+                ),
+            ),
+        )
+
+    def passed_positionally(
+        self,
+        args: tuple[Any, ...],
+    ) -> list[inspect.Parameter]:
+        """
+        Collect parameters becoming keyword-only which were passed by position.
+
+        Answered from the number of positional arguments alone.
+        """
+        fewest = self._fewest_positional_misusing
+        if fewest is None or len(args) < fewest:
+            return []
+        return [
+            self._signature.parameters[name]
+            for name in self._becoming_keyword_only
+            if self._order[name] < len(args)
+        ]
+
+    def with_changed_default(
+        self,
+        name: str,
+        new_default: Any,
+    ) -> SignatureWithRegret:
+        """
+        Evolve this signature to deprecate relying on a parameter's default.
+        """
+        parameter = self._signature.parameters.get(name)
+        if parameter is None:
+            raise NoSuchParameter(name)
+        elif name in self._changed_defaults:
+            raise AlreadyDeprecated(name)
+        elif parameter.default is inspect.Parameter.empty:
+            raise ValueError(f"{name!r} has no default to change.")
+        return evolve(
+            self,
+            changed_defaults={**self._changed_defaults, name: new_default},
+        )
+
+    def omitted(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> list[tuple[inspect.Parameter, Any]]:
+        """
+        Collect parameters whose default is changing which were not passed.
+
+        Each is paired with its new default. Answered from the number of
+        positional arguments and the keyword arguments' names alone.
+        """
+        return [
+            (parameter, new_default)
+            for parameter, position, new_default in self._omittable
+            if parameter.name not in kwargs
+            and (position is None or len(args) <= position)
+        ]
+
+    def with_mutually_exclusive(
+        self,
+        names: Iterable[str],
+    ) -> SignatureWithRegret:
+        """
+        Evolve this signature to deprecate passing parameters together.
+        """
+        group = tuple(sorted(set(names), key=self.order_of))
+        if len(group) < 2:  # noqa: PLR2004
+            raise ValueError(
+                f"At least two parameters are needed, not {group!r}.",
+            )
+        for name in group:
+            if not self.would_accept(name):
+                raise NoSuchParameter(name)
+        if group in self._mutually_exclusive:
+            raise AlreadyDeprecated(group)
+        return evolve(
+            self,
+            mutually_exclusive=(*self._mutually_exclusive, group),
+        )
+
+    def passed_together(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> list[tuple[tuple[str, ...], tuple[inspect.Parameter, ...]]]:
+        """
+        Collect the groups of mutually exclusive parameters passed together.
+
+        Each group's names are paired with those of its parameters which
+        were passed. Answered without binding the arguments.
+        """
+        if not self._exclusive_masks:
+            return []
+
+        by_position = self._bits_by_position
+        passed = by_position[min(len(args), len(by_position) - 1)]
+        for name, bit in self._bits.items():
+            if name in kwargs:
+                passed |= bit
+
+        misused: list[tuple[tuple[str, ...], tuple[inspect.Parameter, ...]]]
+        misused = []
+        groups = zip(self._exclusive_masks, self._mutually_exclusive)
+        for mask, group in groups:
+            together = passed & mask
+            if together & (together - 1):  # i.e. more than one bit is set
+                parameters = tuple(
+                    self._parameter_named(name)
+                    for name in group
+                    if together & self._bits[name]
+                )
+                misused.append((group, parameters))
+        return misused
+
+    def might_be_misused(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> bool:
+        """
+        Could a call with the given arguments misuse any parameter?
+
+        Answered without binding the arguments, so that calls which
+        certainly do not misuse any parameter need not be bound at all.
+        """
+        if self._touched_by is None:
+            return True
+        count = len(args)
+        return any(
+            name in kwargs or (position is not None and count > position)
+            for name, position in self._touched_by
+        )
+
+    def misused_values(
+        self,
+        bound_arguments: inspect.BoundArguments,
+    ) -> Iterable[tuple[inspect.Parameter, Any, ValueCheck]]:
+        """
+        Collect the arguments which were passed deprecated values.
+        """
+        arguments = bound_arguments.arguments
+        kwargs: dict[str, Any] = {}
+        if self.kwargs_parameter_name is not None:
+            kwargs = arguments.get(self.kwargs_parameter_name, kwargs)
+
+        for name, checks in self._deprecated_values.items():
+            if name in arguments:
+                parameter = self._signature.parameters[name]
+                value = arguments[name]
+            elif name in kwargs:
+                parameter = inspect.Parameter(
+                    name=name,
+                    kind=inspect.Parameter.KEYWORD_ONLY,
+                )
+                value = kwargs[name]
+            else:
+                continue
+            for check in checks:
+                if value in check:
+                    yield parameter, value, check
+
     def misused(
         self,
         bound_arguments: inspect.BoundArguments,
@@ -0,0 +1,193 @@
+"""
+Mappings which emit deprecations when deprecated keys are used.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from regret import emitted
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from typing import Self
+
+_MISSING = object()
+
+
+class DeprecatedKeys(dict[Any, Any]):
+    """
+    A dictionary, some of whose keys are deprecated.
+
+    Renamed keys are redirected to their new names (and stored only under
+    them), whereas removed keys are stored separately, such that neither
+    appears when iterating over the dictionary.
+
+    Retrieving any other key via subscripting is an ordinary dictionary
+    lookup, as only ``__missing__`` is involved in finding deprecated
+    keys. Other methods which take keys (`get`, `pop`, `setdefault`,
+    `update`, containment checks and setting or deleting items) also know
+    about deprecated keys, at the cost of a Python-level call.
+    """
+
+    __slots__ = ("_emit", "_removed", "_renamed", "_values_of_removed")
+
+    def __init__(
+        self,
+        data: Mapping[Any, Any],
+        renamed: Mapping[Any, Any],
+        removed: Iterable[Any],
+        emit: Callable[..., None],
+    ):
+        super().__init__()
+        self._renamed = dict(renamed)
+        self._removed = frozenset(removed)
+        self._values_of_removed: dict[Any, Any] = {}
+        self._emit = emit
+
+        # Passing deprecated keys in the initial data is itself a use of
+        # them, so they're emitted for (on behalf of our caller's caller).
+        for key, value in data.items():
+            self._set(key, value, extra_stacklevel=3)
+
+    def _emit_for(self, key: Any, extra_stacklevel: int) -> None:
+        self._emit(
+            kind=emitted.MappingKey(key=key, new=self._renamed.get(key)),
+            extra_stacklevel=extra_stacklevel,
+        )
+
+    def _set(self, key: Any, value: Any, extra_stacklevel: int) -> None:
+        if key in self._renamed:
+            self._emit_for(key, extra_stacklevel=extra_stacklevel)
+            key = self._renamed[key]
+        elif key in self._removed:
+            self._emit_for(key, extra_stacklevel=extra_stacklevel)
+            self._values_of_removed[key] = value
+            return
+        super().__setitem__(key, value)
+
+    def __missing__(self, key: Any) -> Any:
+        if key in self._renamed:
+            self._emit_for(key, extra_stacklevel=1)
+            value = super().get(self._renamed[key], _MISSING)
+        elif key in self._removed:
+            self._emit_for(key, extra_stacklevel=1)
+            value = self._values_of_removed.get(key, _MISSING)
+        else:
+            value = _MISSING
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        if super().__contains__(key):
+            return True
+        elif key in self._renamed:
+            self._emit_for(key, extra_stacklevel=1)
+            return super().__contains__(self._renamed[key])
+        elif key in self._removed:
+            self._emit_for(key, extra_stacklevel=1)
+            return key in self._values_of_removed
+        return False
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = super().get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        elif key in self._renamed:
+            self._emit_for(key, extra_stacklevel=1)
+            return super().get(self._renamed[key], default)
+        elif key in self._removed:
+            self._emit_for(key, extra_stacklevel=1)
+            return self._values_of_removed.get(key, default)
+        return default
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        if key in self._renamed:
+            self._emit_for(key, extra_stacklevel=1)
+            key = self._renamed[key]
+        elif key in self._removed:
+            self._emit_for(key, extra_stacklevel=1)
+            if default is _MISSING:
+                return self._values_of_removed.pop(key)
+            return self._values_of_removed.pop(key, default)
+        if default is _MISSING:
+            return super().pop(key)
+        return super().pop(key, default)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self._renamed:
+            self._emit_for(key, extra_stacklevel=1)
+            key = self._renamed[key]
+        elif key in self._removed:
+            self._emit_for(key, extra_stacklevel=1)
+            return self._values_of_removed.setdefault(key, default)
+        return super().setdefault(key, default)
+
+    def update(self, other: Any = (), /, **kwargs: Any) -> None:
+        items: Iterable[tuple[Any, Any]]
+        if hasattr(other, "keys"):  # as dict.update itself checks
+            items = ((key, other[key]) for key in other.keys())  # noqa: SIM118
+        else:
+            items = other
+        for key, value in items:
+            self._set(key, value, extra_stacklevel=2)
+        for key, value in kwargs.items():
+            self._set(key, value, extra_stacklevel=2)
+
+    def __ior__(self, other: Any) -> Self:
+        self.update(other)
+        return self
+
+    @classmethod
+    def _rebuilt(
+        cls,
+        data: Mapping[Any, Any],
+        renamed: Mapping[Any, Any],
+        removed: Iterable[Any],
+        emit: Callable[..., None],
+        values_of_removed: Mapping[Any, Any],
+    ) -> DeprecatedKeys:
+        """
+        Recreate a dictionary with deprecated keys, without emitting.
+        """
+        rebuilt = cls(data={}, renamed=renamed, removed=removed, emit=emit)
+        super(DeprecatedKeys, rebuilt).update(data)
+        rebuilt._values_of_removed.update(values_of_removed)
+        return rebuilt
+
+    def copy(self) -> DeprecatedKeys:
+        return self._rebuilt(
+            dict(self),
+            self._renamed,
+            self._removed,
+            self._emit,
+            self._values_of_removed,
+        )
+
+    __copy__ = copy
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The default reduction would replay items through __setitem__
+        # before our attributes are restored.
+        return self._rebuilt, (
+            dict(self),
+            self._renamed,
+            self._removed,
+            self._emit,
+            self._values_of_removed,
+        )
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._set(key, value, extra_stacklevel=2)
+
+    def __delitem__(self, key: Any) -> None:
+        if key in self._renamed:
+            self._emit_for(key, extra_stacklevel=1)
+            key = self._renamed[key]
+        elif key in self._removed:
+            self._emit_for(key, extra_stacklevel=1)
+            del self._values_of_removed[key]
+            return
+        super().__delitem__(key)
+
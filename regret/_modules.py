@@ -0,0 +1,214 @@
+"""
+Helpers for deprecating (parts of) modules.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+from importlib.abc import Loader
+from pkgutil import resolve_name
+from typing import TYPE_CHECKING
+import sys
+
+from attrs import field, frozen, mutable
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from importlib.machinery import ModuleSpec
+    from types import ModuleType
+    from typing import Any
+
+
+@mutable
+class _Attribute:
+    """
+    A deprecated attribute of a module.
+    """
+
+    emit: Callable[..., None]
+    promote: bool
+    value: Any = None
+    target: str | None = None
+
+    def resolve(self) -> Any:
+        """
+        Retrieve the attribute's value, importing it first if needed.
+        """
+        if self.target is not None:
+            self.value = resolve_name(self.target)
+            self.emit = partial(self.emit, replacement=self.value)
+            self.target = None
+        return self.value
+
+
+@mutable
+class DeprecatedAttributes:
+    """
+    A module ``__getattr__`` (see :pep:`562`) serving deprecated attributes.
+
+    Only attributes missing from the module's ``__dict__`` are looked up
+    here, so non-deprecated attributes are unaffected.
+    """
+
+    _module: ModuleType = field(alias="module")
+    _fallback: Callable[[str], Any] | None = field(alias="fallback")
+    _attributes: dict[str, _Attribute] = field(
+        factory=dict[str, _Attribute],
+        init=False,
+    )
+
+    @classmethod
+    def of(cls, module: ModuleType) -> DeprecatedAttributes:
+        """
+        Retrieve (or install) the deprecated attributes of a module.
+
+        Any ``__getattr__`` the module already has is used for attributes
+        which are not deprecated.
+        """
+        existing = vars(module).get("__getattr__")
+        if isinstance(existing, cls):
+            return existing
+        attributes = cls(module=module, fallback=existing)
+        module.__getattr__ = attributes
+        return attributes
+
+    def add(
+        self,
+        name: str,
+        value: Any,
+        emit: Callable[[], None],
+        promote: bool,
+    ) -> None:
+        """
+        Deprecate an attribute of our module.
+        """
+        vars(self._module).pop(name, None)
+        self._attributes[name] = _Attribute(
+            value=value,
+            emit=emit,
+            promote=promote,
+        )
+
+    def add_alias(
+        self,
+        name: str,
+        target: str,
+        emit: Callable[..., None],
+        promote: bool,
+    ) -> None:
+        """
+        Deprecate an attribute of our module which has moved elsewhere.
+
+        The target is only imported once the attribute is first accessed.
+        """
+        vars(self._module).pop(name, None)
+        self._attributes[name] = _Attribute(
+            target=target,
+            emit=emit,
+            promote=promote,
+        )
+
+    def __call__(self, name: str) -> Any:
+        attribute = self._attributes.get(name)
+        if attribute is None:
+            if self._fallback is None:
+                raise AttributeError(
+                    f"module {self._module.__name__!r} has no attribute "
+                    f"{name!r}",
+                    name=name,
+                    obj=self._module,
+                )
+            return self._fallback(name)
+
+        value = attribute.resolve()
+        attribute.emit()
+        if attribute.promote:
+            self._attributes.pop(name, None)
+            vars(self._module)[name] = value
+        return value
+
+
+@frozen
+class _DeprecatedLoader(Loader):
+    """
+    A loader which emits as the (deprecated) module it loads is executed.
+
+    Everything else is deferred to the loader which would otherwise have
+    loaded the module.
+    """
+
+    _loader: Loader = field(alias="loader")
+    _emit: Callable[[], None] = field(alias="emit")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._emit()
+        self._loader.exec_module(module)
+
+
+@frozen
+class DeprecatedModuleFinder:
+    """
+    A `sys.meta_path` finder which emits when deprecated modules are imported.
+
+    It never itself finds any module, deferring to the remainder of
+    `sys.meta_path` to do so, and for modules which are not deprecated
+    costs only a single dictionary lookup. Deprecated modules are found
+    by the remaining finders, but are loaded (and emit) via a wrapper
+    around their loader, so that merely finding them (e.g. via
+    `importlib.util.find_spec`), or failing to, does not emit.
+    """
+
+    _deprecated: dict[str, Callable[[], None]] = field(
+        factory=dict[str, Callable[[], None]],
+    )
+
+    @classmethod
+    def installed(cls) -> DeprecatedModuleFinder:
+        """
+        Retrieve the finder from `sys.meta_path`, installing it if needed.
+        """
+        for each in sys.meta_path:
+            if isinstance(each, cls):
+                return each
+        finder = cls()
+        sys.meta_path.insert(0, finder)
+        return finder
+
+    def add(self, name: str, emit: Callable[[], None]) -> None:
+        """
+        Deprecate the module with the given (fully qualified) name.
+        """
+        self._deprecated[name] = emit
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        """
+        Find deprecated modules via the rest of `sys.meta_path`.
+        """
+        emit = self._deprecated.get(fullname)
+        if emit is None:
+            return None
+
+        finders = sys.meta_path[sys.meta_path.index(self) + 1 :]
+        for finder in finders:
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec: ModuleSpec | None = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None:
+                spec.loader = _DeprecatedLoader(loader=spec.loader, emit=emit)
+            return spec
+        return None
@@ -0,0 +1,55 @@
+"""
+Comparison of version strings, to decide whether deprecations are in effect.
+
+Only as much of :pep:`440` as is needed to order release versions is
+supported -- release segments, optionally preceded by ``v`` and followed
+by pre-release, post-release or development release segments. Local
+version labels are ignored.
+"""
+
+from __future__ import annotations
+
+import re
+
+_VERSION = re.compile(
+    r"""
+    ^\s*v?
+    (?P<release>\d+(?:\.\d+)*)
+    (?:[-_.]?(?P<pre>a|alpha|b|beta|c|rc|pre|preview)[-_.]?(?P<pre_n>\d*))?
+    (?:[-_.]?(?P<post>post|rev|r)[-_.]?(?P<post_n>\d*))?
+    (?:[-_.]?dev[-_.]?(?P<dev_n>\d*))?
+    (?:\+[a-z0-9]+(?:[-_.][a-z0-9]+)*)?
+    \s*$
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+
+_PRE = {"a": 0, "alpha": 0, "b": 1, "beta": 1}  # anything else is a "rc"
+
+#: A sortable representation of a version.
+Version = tuple[tuple[int, ...], tuple[int, int], int, tuple[int, int]]
+
+
+def parse(version: str) -> Version:
+    """
+    Parse a version into something which may be compared with others.
+    """
+    match = _VERSION.match(version)
+    if match is None:
+        raise ValueError(f"{version!r} is not a valid version.")
+
+    release = [int(each) for each in match["release"].split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+
+    pre, post, dev = match["pre"], match["post"], match["dev_n"]
+    is_dev = dev is not None
+    if pre is not None:
+        pre_key = (_PRE.get(pre.lower(), 2), int(match["pre_n"] or 0))
+    elif is_dev and post is None:
+        pre_key = (-1, 0)  # i.e. 1.0.dev0 sorts before 1.0a0
+    else:
+        pre_key = (3, 0)
+    post_key = -1 if post is None else int(match["post_n"] or 0)
+    dev_key = (1, 0) if not is_dev else (0, int(dev or 0))
+    return tuple(release), pre_key, post_key, dev_key
@@ -2,6 +2,7 @@
 Integration with the standard library's `warnings` module.
 """
 
+from typing import Any
 import warnings
 
 from regret.emitted import Deprecation
@@ -9,9 +10,53 @@ from regret.emitted import Deprecation
 _STACKLEVELS_UNTIL_EMIT_IS_CALLED = 4
 
 
+class RegretWarning(DeprecationWarning):
+    """
+    A warning emitted for a deprecation.
+
+    Each `regret.Deprecator` emits warnings of its own (generated)
+    subclass of this category, so that filters may match the
+    deprecations of a particular deprecator by category, rather than by
+    matching a regular expression against each message.
+    """
+
+    #: The `regret.emitted.Deprecation` this warning was emitted for.
+    deprecation: Deprecation
+
+    def __reduce__(self) -> str | tuple[Any, ...]:
+        # Generated categories cannot be found by name when unpickling, so
+        # their warnings (e.g. raised under -W error and sent between
+        # processes) are unpickled as plain RegretWarnings.
+        if is_generated(type(self)):
+            return RegretWarning, self.args
+        return super().__reduce__()
+
+
+def new_category() -> type[RegretWarning]:
+    """
+    Generate a new subclass of `RegretWarning`.
+
+    It is named ``DeprecationWarning``, so that warnings continue to be
+    shown just as they would be were they the standard library's.
+    """
+    return type(
+        "DeprecationWarning",
+        (RegretWarning,),
+        dict(__module__=RegretWarning.__module__, _generated=True),
+    )
+
+
+def is_generated(category: type[Warning]) -> bool:
+    """
+    Whether the given category was generated by `new_category`.
+    """
+    return category.__dict__.get("_generated", False)
+
+
 def emit(deprecation: Deprecation, extra_stacklevel: int):
+    warning = deprecation.category(deprecation.message())
+    warning.deprecation = deprecation  # type: ignore[reportAttributeAccessIssue]
     warnings.warn(
-        deprecation.message(),
-        DeprecationWarning,
+        warning,
         stacklevel=_STACKLEVELS_UNTIL_EMIT_IS_CALLED + extra_stacklevel,
     )
@@ -0,0 +1,5 @@
+"""
+Benchmarks for the overhead of deprecated objects.
+
+This package is *not* public API.
+"""
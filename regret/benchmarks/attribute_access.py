@@ -0,0 +1,51 @@
+"""
+A benchmark for attribute access on an object with a deprecated attribute.
+
+The object has many ordinary attributes alongside the deprecated one,
+to show that access to the ordinary attributes is unaffected.
+
+Emission itself is replaced by a no-op, so that what's measured is the
+overhead of the deprecation machinery rather than of `warnings`.
+"""
+
+from pyperf import Runner
+
+from regret import Deprecator
+
+ATTRIBUTES = [f"attribute{i}" for i in range(50)]
+
+
+class Plain:
+    __slots__ = (*ATTRIBUTES, "deprecated")
+
+    def __init__(self):
+        for each in Plain.__slots__:
+            setattr(self, each, 12)
+
+
+regret = Deprecator(emit=lambda **kwargs: None)
+
+
+@regret.attribute(version="1.0.0", name="deprecated")
+class WithDeprecated(Plain):
+    __slots__ = ()
+
+
+plain, with_deprecated = Plain(), WithDeprecated()
+
+
+if __name__ == "__main__":
+    runner = Runner()
+    runner.bench_func("Ordinary Attribute", lambda: plain.attribute25)
+    runner.bench_func(
+        "Ordinary Attribute Alongside Deprecated",
+        lambda: with_deprecated.attribute25,
+    )
+    runner.bench_func(
+        "Attribute Before Deprecation",
+        lambda: plain.deprecated,
+    )
+    runner.bench_func(
+        "Deprecated Attribute",
+        lambda: with_deprecated.deprecated,
+    )
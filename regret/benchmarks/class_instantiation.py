@@ -0,0 +1,36 @@
+"""
+A benchmark for instantiating a deprecated class many times.
+
+Emission itself is replaced by a no-op, so that what's measured is the
+overhead of the deprecation machinery rather than of `warnings`.
+"""
+
+from pyperf import Runner
+
+from regret import Deprecator
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+regret = Deprecator(emit=lambda **kwargs: None)
+
+
+@regret.callable(version="1.0.0")
+class ViaCallable(Point):
+    pass
+
+
+@regret.Class(version="1.0.0")
+class ViaClass(Point):
+    pass
+
+
+if __name__ == "__main__":
+    runner = Runner()
+    runner.bench_func("Undeprecated Class", lambda: Point(1, 2))
+    runner.bench_func("Deprecator.callable", lambda: ViaCallable(1, 2))
+    runner.bench_func("Deprecator.Class", lambda: ViaClass(1, 2))
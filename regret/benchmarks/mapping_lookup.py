@@ -0,0 +1,41 @@
+"""
+A benchmark for lookups in a mapping with deprecated keys.
+
+The mapping has many ordinary keys alongside the deprecated ones, to
+show that lookups of the ordinary keys are unaffected.
+
+Emission itself is replaced by a no-op, so that what's measured is the
+overhead of the deprecation machinery rather than of `warnings`.
+"""
+
+from pyperf import Runner
+
+from regret import Deprecator
+
+KEYS = [f"key{i}" for i in range(50)]
+
+regret = Deprecator(emit=lambda **kwargs: None)
+
+plain = dict.fromkeys([*KEYS, "timeout"], 12)
+with_deprecated = regret.mapping_keys(
+    version="1.0.0",
+    mapping=plain,
+    renamed=dict(timeout_ms="timeout"),
+)
+
+
+if __name__ == "__main__":
+    runner = Runner()
+    runner.bench_func("Ordinary Key", lambda: plain["key25"])
+    runner.bench_func(
+        "Ordinary Key Alongside Deprecated",
+        lambda: with_deprecated["key25"],
+    )
+    runner.bench_func(
+        "Key Before Deprecation",
+        lambda: plain["timeout"],
+    )
+    runner.bench_func(
+        "Renamed Key",
+        lambda: with_deprecated["timeout_ms"],
+    )
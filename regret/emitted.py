@@ -11,6 +11,7 @@ from attrs import field, frozen
 if TYPE_CHECKING:
     from collections.abc import Callable as _Callable
     from datetime import date
+    from types import ModuleType
     from typing import Any
     import inspect
 
@@ -43,6 +44,36 @@ class Deprecation:
         alias="removal_date",
     )
     _addendum: str | None = field(default=None, repr=False, alias="addendum")
+    _category: type[Warning] = field(
+        default=DeprecationWarning,
+        eq=False,
+        repr=False,
+        alias="category",
+    )
+
+    @property
+    def category(self) -> type[Warning]:
+        """
+        The category of warning to use when emitting via `warnings`.
+        """
+        return self._category
+
+    def subject(self) -> tuple[str | None, str, tuple[str, ...]] | None:
+        """
+        The module, name and kinds under which this deprecation is inventoried.
+
+        A kind of deprecation may be inventoried as more than one kind of
+        entry (e.g. `Callable` is emitted both for deprecated callables
+        and for deprecated classes), so each possible entry kind is
+        included.
+
+        `None` is returned for kinds of deprecations which do not know.
+        """
+        subject = getattr(self._kind, "subject", None)
+        if subject is None:
+            return None
+        module, name = subject(name_of=self._name_of)
+        return module, name, _INVENTORIED_AS.get(type(self._kind), ())
 
     def message(self) -> str:
         """
@@ -79,6 +110,64 @@ class Callable:
         """
         return f"{name_of(self._object)} is deprecated."
 
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return self._object.__module__, name_of(self._object)
+
+
+@frozen
+class Attribute:
+    """
+    An attribute (or method) of a particular type or its instances.
+    """
+
+    _type: type[Any] = field(alias="type")
+    _name: str = field(alias="name")
+
+    def message(self, name_of: name_of) -> str:
+        """
+        Express this deprecation as a comprehensible message.
+        """
+        return f"{name_of(self._type)}.{self._name} is deprecated."
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return self._type.__module__, f"{name_of(self._type)}.{self._name}"
+
+
+@frozen
+class EnumMember:
+    """
+    A member of a particular enum.
+    """
+
+    _type: type[Any] = field(alias="type")
+    _name: str = field(alias="name")
+    _replacement: Any = field(default=None, alias="replacement")
+
+    def message(self, name_of: name_of) -> str:
+        """
+        Express this deprecation as a comprehensible message.
+        """
+        message = f"{name_of(self._type)}.{self._name} is deprecated."
+        if self._replacement is not None:
+            replacement = self._replacement
+            message += (
+                f" Please use {name_of(type(replacement))}.{replacement.name} "
+                "instead."
+            )
+        return message
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return self._type.__module__, f"{name_of(self._type)}.{self._name}"
+
 
 @frozen
 class Inheritance:
@@ -94,6 +183,80 @@ class Inheritance:
         """
         return f"Subclassing from {name_of(self._type)} is deprecated."
 
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return self._type.__module__, name_of(self._type)
+
+
+@frozen
+class Module:
+    """
+    An entire module.
+    """
+
+    _name: str = field(alias="name")
+
+    def message(self, name_of: name_of) -> str:
+        """
+        Express this deprecation as a comprehensible message.
+        """
+        return f"The {self._name} module is deprecated."
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return self._name, self._name
+
+
+@frozen
+class ModuleAttribute:
+    """
+    An attribute of a module.
+    """
+
+    _module: ModuleType = field(alias="module")
+    _name: str = field(alias="name")
+
+    def message(self, name_of: name_of) -> str:
+        """
+        Express this deprecation as a comprehensible message.
+        """
+        return f"{self._module.__name__}.{self._name} is deprecated."
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return self._module.__name__, self._name
+
+
+@frozen
+class MappingKey:
+    """
+    A key of a particular mapping, which may have been renamed.
+    """
+
+    _key: Any = field(alias="key")
+    _new: Any = field(default=None, alias="new")
+
+    def message(self, name_of: name_of) -> str:
+        """
+        Express this deprecation as a comprehensible message.
+        """
+        message = f"The {self._key!r} key is deprecated."
+        if self._new is not None:
+            message += f" Please use {self._new!r} instead."
+        return message
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return None, repr(self._key)
+
 
 @frozen
 class Parameter:
@@ -110,6 +273,163 @@ class Parameter:
         """
         return f"The {self._parameter.name!r} parameter is deprecated."
 
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return (
+            self._callable.__module__,
+            f"{name_of(self._callable)}({self._parameter.name})",
+        )
+
+
+@frozen
+class PositionalParameter:
+    """
+    A parameter for a particular callable which will become keyword-only.
+    """
+
+    _callable: _Callable[..., Any] = field(alias="callable")
+    _parameter: inspect.Parameter = field(alias="parameter")
+
+    def message(self, name_of: name_of) -> str:
+        """
+        Express this deprecation as a comprehensible message.
+        """
+        return (
+            f"Passing the {self._parameter.name!r} parameter of "
+            f"{name_of(self._callable)} positionally is deprecated. "
+            "It will become keyword-only."
+        )
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return (
+            self._callable.__module__,
+            f"{name_of(self._callable)}({self._parameter.name})",
+        )
+
+
+@frozen
+class ChangedDefault:
+    """
+    A default value for a parameter of a particular callable which will change.
+    """
+
+    _callable: _Callable[..., Any] = field(alias="callable")
+    _parameter: inspect.Parameter = field(alias="parameter")
+    _new_default: Any = field(alias="new_default")
+
+    def message(self, name_of: name_of) -> str:
+        """
+        Express this deprecation as a comprehensible message.
+        """
+        return (
+            f"Relying on the default value of the {self._parameter.name!r} "
+            f"parameter of {name_of(self._callable)} is deprecated. It will "
+            f"change from {self._parameter.default!r} to "
+            f"{self._new_default!r}."
+        )
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return (
+            self._callable.__module__,
+            f"{name_of(self._callable)}({self._parameter.name})",
+        )
+
+
+@frozen
+class RenamedParameter:
+    """
+    A parameter for a particular callable which has been renamed.
+    """
+
+    _callable: _Callable[..., Any] = field(alias="callable")
+    _old: str = field(alias="old")
+    _parameter: inspect.Parameter = field(alias="parameter")
+
+    def message(self, name_of: name_of) -> str:
+        """
+        Express this deprecation as a comprehensible message.
+        """
+        return (
+            f"The {self._old!r} parameter of {name_of(self._callable)} "
+            f"is deprecated. Please use {self._parameter.name!r} instead."
+        )
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return (
+            self._callable.__module__,
+            f"{name_of(self._callable)}({self._old})",
+        )
+
+
+@frozen
+class ParameterValue:
+    """
+    A value for a parameter of a particular callable which is deprecated.
+    """
+
+    _callable: _Callable[..., Any] = field(alias="callable")
+    _parameter: inspect.Parameter = field(alias="parameter")
+    _value: Any = field(alias="value")
+
+    def message(self, name_of: name_of) -> str:
+        """
+        Express this deprecation as a comprehensible message.
+        """
+        return (
+            f"Passing {self._value!r} for the {self._parameter.name!r} "
+            f"parameter of {name_of(self._callable)} is deprecated."
+        )
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return (
+            self._callable.__module__,
+            f"{name_of(self._callable)}({self._parameter.name})",
+        )
+
+
+@frozen
+class ParameterType:
+    """
+    A deprecated type of value for a parameter of a particular callable.
+    """
+
+    _callable: _Callable[..., Any] = field(alias="callable")
+    _parameter: inspect.Parameter = field(alias="parameter")
+    _type: type[Any] = field(alias="type")
+
+    def message(self, name_of: name_of) -> str:
+        """
+        Express this deprecation as a comprehensible message.
+        """
+        return (
+            f"Passing {name_of(self._type)} objects for the "
+            f"{self._parameter.name!r} parameter of {name_of(self._callable)} "
+            "is deprecated."
+        )
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return (
+            self._callable.__module__,
+            f"{name_of(self._callable)}({self._parameter.name})",
+        )
+
 
 @frozen
 class OptionalParameter:
@@ -130,3 +450,67 @@ class OptionalParameter:
             f"{self._parameter.name!r} parameter is deprecated. Using "
             f"{self._default!r} as a default."
         )
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        return (
+            self._callable.__module__,
+            f"{name_of(self._callable)}({self._parameter.name})",
+        )
+
+
+@frozen
+class MutuallyExclusiveParameters:
+    """
+    Parameters for a particular callable which should not be passed together.
+    """
+
+    _callable: _Callable[..., Any] = field(alias="callable")
+    _parameters: tuple[inspect.Parameter, ...] = field(alias="parameters")
+    #: The names of every parameter in the mutually exclusive group, of
+    #: which only some may have been passed. If unprovided, the group is
+    #: just the parameters passed.
+    _group: tuple[str, ...] | None = field(default=None, alias="group")
+
+    def message(self, name_of: name_of) -> str:
+        """
+        Express this deprecation as a comprehensible message.
+        """
+        *rest, last = (repr(each.name) for each in self._parameters)
+        names = f"{', '.join(rest)} and {last}"
+        return (
+            f"Passing the {names} parameters of {name_of(self._callable)} "
+            "together is deprecated."
+        )
+
+    def subject(self, name_of: name_of) -> tuple[str | None, str]:
+        """
+        The module and name under which this deprecation is inventoried.
+        """
+        group = self._group
+        if group is None:
+            group = tuple(each.name for each in self._parameters)
+        names = ", ".join(group)
+        return self._callable.__module__, f"{name_of(self._callable)}({names})"
+
+
+#: The kinds of inventory entries each kind of deprecation may match.
+_INVENTORIED_AS: dict[type[Any], tuple[str, ...]] = {
+    Callable: ("callable", "Class"),
+    Attribute: ("attribute",),
+    EnumMember: ("enum_member",),
+    Inheritance: ("inheritance",),
+    Module: ("module",),
+    ModuleAttribute: ("module_attribute", "module_alias"),
+    MappingKey: ("mapping_keys",),
+    Parameter: ("parameter",),
+    PositionalParameter: ("keyword_only_parameter",),
+    ChangedDefault: ("changed_default",),
+    RenamedParameter: ("renamed_parameter",),
+    ParameterValue: ("parameter_value",),
+    ParameterType: ("parameter_type",),
+    OptionalParameter: ("optional_parameter",),
+    MutuallyExclusiveParameters: ("mutually_exclusive",),
+}
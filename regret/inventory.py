@@ -0,0 +1,360 @@
+"""
+An inventory of the deprecations which have been made.
+
+Every `regret.Deprecator` records each deprecation it makes in an
+`Inventory` (by default, the process-wide `INVENTORY`), so that
+deprecations may be listed (or exported) without having to be used.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING
+import inspect
+import json
+import os
+import sqlite3
+import stat
+import sys
+import tempfile
+
+from attrs import field, frozen, mutable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import date
+    from typing import Any
+
+    from regret.emitted import Deprecation
+
+#: The columns of exported inventories, in order.
+_COLUMNS = (
+    "module",
+    "name",
+    "kind",
+    "version",
+    "replacement",
+    "removal_date",
+    "addendum",
+    "filename",
+    "lineno",
+)
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS deprecations (
+    module TEXT NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    version TEXT NOT NULL,
+    replacement TEXT,
+    removal_date TEXT,
+    addendum TEXT,
+    filename TEXT,
+    lineno INTEGER,
+    usage INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (module, name, kind)
+)
+"""
+
+# Rows which are unchanged are left alone, rather than rewritten.
+_UPSERT = """
+INSERT INTO deprecations (
+    module, name, kind, version, replacement, removal_date, addendum,
+    filename, lineno
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (module, name, kind) DO UPDATE SET
+    version = excluded.version,
+    replacement = excluded.replacement,
+    removal_date = excluded.removal_date,
+    addendum = excluded.addendum,
+    filename = excluded.filename,
+    lineno = excluded.lineno
+WHERE
+    (version, replacement, removal_date, addendum, filename, lineno)
+    IS NOT (
+        excluded.version,
+        excluded.replacement,
+        excluded.removal_date,
+        excluded.addendum,
+        excluded.filename,
+        excluded.lineno
+    )
+"""
+
+_ADD_USAGE = """
+UPDATE deprecations SET usage = usage + ?
+WHERE module = ? AND name = ? AND kind = ?
+"""
+
+
+@frozen
+class Entry:
+    """
+    A single deprecation which has been made.
+    """
+
+    #: The (non-fully-)qualified name of the deprecated object.
+    name: str
+    #: The name of the module containing the deprecated object, if known.
+    module: str | None
+    #: The kind of deprecation, named as the `regret.Deprecator` method.
+    kind: str
+    #: The first version in which the object was considered deprecated.
+    version: str
+    #: The name of the object's replacement, if any.
+    replacement: str | None = None
+    #: A date after which the object is expected to be removed, if any.
+    removal_date: date | None = None
+    #: An additional message included with the deprecation, if any.
+    addendum: str | None = None
+    #: The file containing the deprecated object's source, if known.
+    filename: str | None = None
+    #: The line of that file on which the object is defined, if known.
+    lineno: int | None = None
+
+    def is_overdue(self, today: date) -> bool:
+        """
+        Is this deprecation past its removal date as of the given date?
+        """
+        return self.removal_date is not None and self.removal_date < today
+
+
+@mutable
+class Inventory:
+    """
+    A collection of deprecations which have been made.
+
+    Each deprecation is recorded once, by the module and name of what was
+    deprecated and the kind of deprecation, however many times it is made
+    (e.g. by repeatedly importing or calling the code which makes it).
+    """
+
+    _entries: dict[tuple[str | None, str, str], Entry] = field(
+        factory=dict[tuple[str | None, str, str], Entry],
+        init=False,
+    )
+    #: The key of each entry added or replaced, in order.
+    _changes: list[tuple[str | None, str, str]] = field(
+        factory=list[tuple[str | None, str, str]],
+        init=False,
+        repr=False,
+        eq=False,
+    )
+
+    def __iter__(self) -> Iterator[Entry]:
+        return iter(self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entry: Entry) -> None:
+        """
+        Record a deprecation, replacing any earlier record of it.
+        """
+        key = entry.module, entry.name, entry.kind
+        if self._entries.get(key) == entry:
+            return
+        self._entries[key] = entry
+        self._changes.append(key)
+
+    def changed_since(self, position: int) -> tuple[list[Entry], int]:
+        """
+        The deprecations recorded or replaced since a previous position.
+
+        Positions start at 0 (before anything was recorded) and the
+        current position is returned alongside the deprecations, so
+        that callers may keep up with an inventory as it changes
+        without reexamining what they have already seen.
+        """
+        changed = dict.fromkeys(self._changes[position:])
+        return [self._entries[key] for key in changed], len(self._changes)
+
+    def overdue(self, today: date) -> list[Entry]:
+        """
+        The deprecations due for removal by the given date.
+        """
+        return [each for each in self if each.is_overdue(today)]
+
+    def to_sqlite(
+        self,
+        path: str | os.PathLike[str],
+        usage: Iterable[tuple[Deprecation, int]] | None = None,
+    ) -> None:
+        """
+        Export this inventory to a SQLite database.
+
+        The database (which is created if needed) contains a single
+        ``deprecations`` table, with a row per deprecation. Exporting is
+        incremental -- deprecations already present are updated only if
+        they have changed, such that many inventories (e.g. one per
+        package) may be exported to the same database -- and happens
+        within a single transaction.
+
+        Arguments:
+
+            path:
+
+                the path to the database
+
+            usage:
+
+                pairs of deprecations and the number of times each was
+                emitted (e.g. `regret.testing.CountingRecorder.counts`),
+                which will be
+                added to the ``usage`` column of matching rows
+
+        """
+        connection = sqlite3.connect(path)
+        try:
+            with connection:
+                connection.execute(_CREATE_TABLE)
+                connection.executemany(
+                    _UPSERT,
+                    (_row(entry) for entry in self),
+                )
+                connection.executemany(
+                    _ADD_USAGE,
+                    (
+                        (count, module or "", name, kind)
+                        for (module, name, kind), count in _usage_of(
+                            usage,
+                        ).items()
+                    ),
+                )
+        finally:
+            connection.close()
+
+    def to_json(
+        self,
+        path: str | os.PathLike[str],
+        usage: Iterable[tuple[Deprecation, int]] | None = None,
+    ) -> None:
+        """
+        Export this inventory to a JSON document.
+
+        The document contains a ``deprecations`` array of objects, one
+        per deprecation. Should it already exist, deprecations within it
+        are updated (and usage counts added to) rather than replaced, as
+        with `Inventory.to_sqlite`. The document is replaced atomically.
+
+        Arguments:
+
+            path:
+
+                the path to the document
+
+            usage:
+
+                pairs of deprecations and the number of times each was
+                emitted (e.g. `regret.testing.CountingRecorder.counts`),
+                which will be
+                added to the ``usage`` of matching deprecations
+
+        """
+        path = Path(path)
+        existing: list[dict[str, Any]] = []
+        if path.exists():
+            existing = json.loads(path.read_text())["deprecations"]
+        by_key = {
+            (each["module"], each["name"], each["kind"]): each
+            for each in existing
+        }
+
+        for entry in self:
+            row: dict[str, Any] = dict(zip(_COLUMNS, _row(entry), strict=True))
+            row["module"] = entry.module
+            key = row["module"], row["name"], row["kind"]
+            row["usage"] = by_key.get(key, {}).get("usage", 0)
+            by_key[key] = row
+
+        counts = _usage_of(usage)
+        for key, row in by_key.items():
+            row["usage"] += counts.get(key, 0)
+
+        document = json.dumps(
+            {"deprecations": list(by_key.values())},
+            indent=2,
+        )
+        fd, name = tempfile.mkstemp(dir=path.parent, suffix=".json")
+        temporary = Path(name)
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(document)
+            # mkstemp creates files readable only by their owner, whereas
+            # the document should have the mode it would if written to
+            # directly.
+            temporary.chmod(_mode_of(path))
+            temporary.replace(path)
+        finally:
+            temporary.unlink(missing_ok=True)
+
+
+def _row(entry: Entry) -> tuple[Any, ...]:
+    """
+    An entry, as a row for exporting (with ``None`` modules as ``""``).
+    """
+    removal_date = entry.removal_date
+    return (
+        entry.module or "",
+        entry.name,
+        entry.kind,
+        entry.version,
+        entry.replacement,
+        None if removal_date is None else removal_date.isoformat(),
+        entry.addendum,
+        entry.filename,
+        entry.lineno,
+    )
+
+
+def _usage_of(
+    usage: Iterable[tuple[Deprecation, int]] | None,
+) -> Counter[tuple[str | None, str, str]]:
+    """
+    Total usage counts by the module, name and kind of what was deprecated.
+    """
+    counts: Counter[tuple[str | None, str, str]] = Counter()
+    for deprecation, count in usage or ():
+        subject = deprecation.subject()
+        if subject is None:
+            continue
+        module, name, kinds = subject
+        for kind in kinds:
+            counts[module, name, kind] += count
+    return counts
+
+
+def _mode_of(path: Path) -> int:
+    """
+    The mode a file would have if written (or rewritten) at the given path.
+    """
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def source_of(object: Any) -> tuple[str | None, int | None]:
+    """
+    Find (cheaply) where the given object is defined.
+
+    Functions have their own code objects to consult, whereas for any
+    other object, only its module's file is looked up (along with the
+    line on which it is defined, for classes on Python 3.13 and newer).
+    """
+    code = getattr(inspect.unwrap(object), "__code__", None)
+    if code is not None:
+        return code.co_filename, code.co_firstlineno
+    module = sys.modules.get(getattr(object, "__module__", None) or "")
+    return (
+        getattr(module, "__file__", None),
+        getattr(object, "__firstlineno__", None),
+    )
+
+
+#: The inventory of deprecations made by deprecators (by default).
+INVENTORY = Inventory()
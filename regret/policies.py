@@ -0,0 +1,116 @@
+"""
+Policies which choose when deprecated objects should be removed.
+
+A policy is any callable which, given the version in which an object
+was deprecated, returns the date on or after which it is expected to be
+removed (or `None` if it cannot yet say). Pass one to a
+`regret.Deprecator` to have it used for any deprecation made without an
+explicit ``removal_date``.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from attrs import field, frozen
+
+from regret import _versions
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import date
+
+
+def _by_version(released: Mapping[str, date]) -> dict[_versions.Version, date]:
+    return {_versions.parse(version): on for version, on in released.items()}
+
+
+@frozen
+class DaysAfterRelease:
+    """
+    Remove deprecated objects some number of days after their deprecation.
+
+    Arguments:
+
+        days:
+
+            the number of days after the release deprecating an object
+            after which it may be removed
+
+        released:
+
+            a mapping from versions to the dates on which they were (or
+            are expected to be) released. Deprecations made in versions
+            which are not present get no removal date.
+
+    """
+
+    _days: int = field(alias="days")
+    _released: dict[_versions.Version, date] = field(
+        alias="released",
+        converter=_by_version,
+    )
+
+    def __call__(self, version: str) -> date | None:
+        """
+        Choose a removal date for an object deprecated in the given version.
+        """
+        released = self._released.get(_versions.parse(version))
+        if released is None:
+            return None
+        return released + timedelta(days=self._days)
+
+
+@frozen
+class MinorReleases:
+    """
+    Remove deprecated objects after some number of further minor releases.
+
+    Arguments:
+
+        count:
+
+            the number of minor releases following the one deprecating
+            an object after which it may be removed (e.g. ``2`` means
+            an object deprecated in ``1.2`` may be removed in ``1.4``)
+
+        released:
+
+            a mapping from versions to the dates on which they were (or
+            are expected to be) released
+
+        cadence:
+
+            how often minor releases are expected, used to estimate
+            when the removing release will happen should it not yet
+            be present in ``released``. Deprecations made in versions
+            which are not present get no removal date.
+
+    """
+
+    _count: int = field(alias="count")
+    _released: dict[_versions.Version, date] = field(
+        alias="released",
+        converter=_by_version,
+    )
+    _cadence: timedelta = field(alias="cadence")
+
+    def __call__(self, version: str) -> date | None:
+        """
+        Choose a removal date for an object deprecated in the given version.
+        """
+        parsed = _versions.parse(version)
+        released = self._released.get(parsed)
+        if released is None:
+            return None
+
+        major, minor, *_ = (*parsed[0], 0)
+        removing = [
+            on
+            for each, on in self._released.items()
+            if (*each[0], 0)[:2] >= (major, minor + self._count)
+        ]
+        if removing:
+            return min(removing)
+        return released + self._cadence * self._count
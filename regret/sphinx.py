@@ -0,0 +1,312 @@
+"""
+A Sphinx extension which builds an index of deprecated objects.
+
+Add ``regret.sphinx`` to your ``extensions`` and place the
+``regret-deprecations`` directive on a page, which will then contain
+each deprecation of any object documented via `sphinx.ext.autodoc`,
+grouped by the version which deprecated it and the date it will be
+removed on.
+
+Deprecations are collected (from `regret.inventory.INVENTORY`) as
+documents are read, and are stored in the build environment alongside
+the document which documents them, such that incremental builds reread
+only documents which changed, and such that reading in parallel (via
+``sphinx-build -j``) is supported. Pages containing the index are
+themselves rebuilt whenever any other document changes.
+"""
+
+from __future__ import annotations
+
+from itertools import groupby
+from typing import TYPE_CHECKING, Any
+
+from attrs import field, frozen, mutable
+from docutils import nodes
+from sphinx import addnodes
+from sphinx.transforms.post_transforms import SphinxPostTransform
+from sphinx.util.docutils import SphinxDirective
+
+from regret import _versions, inventory
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+#: The kinds of deprecations shown as part of the module they are in.
+_MODULE_KINDS = frozenset({"module", "module_attribute", "module_alias"})
+
+#: The kinds of deprecations shown as part of the class they are in.
+_MEMBER_KINDS = frozenset({"attribute", "enum_member"})
+
+
+@frozen
+class Documented:
+    """
+    A deprecation of an object which is documented somewhere.
+    """
+
+    entry: inventory.Entry
+    #: The full name under which the object is documented.
+    target: str
+
+
+@mutable
+class _Index:
+    """
+    The entries of an inventory, indexed by what they deprecate.
+
+    Entries are indexed as they are recorded (or replaced) in the
+    inventory, which happens as autodoc imports the modules being
+    documented.
+    """
+
+    _inventory: inventory.Inventory = field(alias="inventory")
+    _position: int = field(default=0, init=False)
+    _by_subject: dict[tuple[str | None, str], dict[Any, inventory.Entry]] = (
+        field(
+            factory=dict[tuple[str | None, str], dict[Any, inventory.Entry]],
+            init=False,
+        )
+    )
+
+    def _update(self) -> None:
+        changed, self._position = self._inventory.changed_since(
+            self._position,
+        )
+        for entry in changed:
+            name = entry.name.partition("(")[0]
+            if entry.kind in _MEMBER_KINDS:
+                name = name.rpartition(".")[0]
+            elif entry.kind in _MODULE_KINDS:
+                name = ""
+            subject = entry.module, name
+            # Replaced entries replace their earlier versions in place.
+            entries = self._by_subject.setdefault(subject, {})
+            entries[entry.kind, entry.name] = entry
+
+    def entries_for(
+        self,
+        what: str,
+        name: str,
+        object: Any,
+    ) -> list[inventory.Entry]:
+        """
+        The deprecations of an object, or of its parameters or members.
+        """
+        self._update()
+        if what == "module":
+            return list(self._by_subject.get((name, ""), {}).values())
+
+        qualname = getattr(object, "__qualname__", None)
+        if isinstance(qualname, str):
+            module = getattr(object, "__module__", None)
+            found = self._by_subject.get((module, qualname))
+            if found:
+                return list(found.values())
+        module, _, qualname = name.rpartition(".")
+        while module:
+            found = self._by_subject.get((module, qualname))
+            if found:
+                return list(found.values())
+            module, _, parent = module.rpartition(".")
+            qualname = f"{parent}.{qualname}"
+        return []
+
+
+_INDEX = _Index(inventory=inventory.INVENTORY)
+
+
+class deprecation_index(nodes.General, nodes.Element):
+    """
+    A placeholder for an index of deprecations.
+    """
+
+
+class DeprecationIndex(SphinxDirective):
+    """
+    Show every deprecation of a documented object.
+    """
+
+    def run(self) -> list[nodes.Node]:
+        """
+        Note that this document contains an index, which is filled later.
+        """
+        _indexes(self.env).add(self.env.docname)
+        return [deprecation_index()]
+
+
+class FillDeprecationIndexes(SphinxPostTransform):
+    """
+    Replace deprecation index placeholders, once all documents are read.
+
+    This runs before cross-references are resolved, such that the
+    references it creates are resolved as usual.
+    """
+
+    default_priority = 5
+
+    def run(self, **kwargs: Any) -> None:
+        """
+        Fill in any indexes in this document.
+        """
+        placeholders = list(self.document.findall(deprecation_index))
+        if not placeholders:
+            return
+
+        documented = {
+            each.entry: each
+            for docname in sorted(_documented(self.env))
+            for each in _documented(self.env)[docname]
+        }
+        for placeholder in placeholders:
+            placeholder.replace_self(self._render(documented.values()))
+
+    def _render(self, documented: Iterable[Documented]) -> list[nodes.Node]:
+        rendered: list[nodes.Node] = []
+        ordered = sorted(documented, key=_ordering)
+        for version, in_version in groupby(ordered, _version_of):
+            rendered.append(nodes.rubric("", f"Deprecated in {version}"))
+            by_date = nodes.definition_list()
+            for removal_date, on_date in groupby(
+                in_version,
+                lambda each: each.entry.removal_date,
+            ):
+                if removal_date is None:
+                    term = "With no removal date"
+                else:
+                    term = f"To be removed on or after {removal_date}"
+                items = nodes.bullet_list()
+                items.extend(self._item(each) for each in on_date)
+                by_date += nodes.definition_list_item(
+                    "",
+                    nodes.term("", term),
+                    nodes.definition("", items),
+                )
+            rendered.append(by_date)
+        return rendered
+
+    def _item(self, documented: Documented) -> nodes.list_item:
+        entry = documented.entry
+        reference = addnodes.pending_xref(
+            "",
+            nodes.literal("", entry.name),
+            refdomain="py",
+            reftype="obj",
+            reftarget=documented.target,
+            refexplicit=True,
+            refdoc=self.env.docname,
+        )
+        paragraph = nodes.paragraph("", "", reference)
+        paragraph += nodes.Text(f" ({entry.kind})")
+        if entry.replacement is not None:
+            paragraph += nodes.Text(f", replaced by {entry.replacement}")
+        return nodes.list_item("", paragraph)
+
+
+def _version_of(documented: Documented) -> str:
+    return documented.entry.version
+
+
+def _ordering(documented: Documented) -> tuple[Any, ...]:
+    entry = documented.entry
+    try:
+        version = (0, _versions.parse(entry.version))
+    except ValueError:
+        version = (1, entry.version)
+    return (
+        version,
+        entry.version,
+        entry.removal_date is None,
+        entry.removal_date,
+        documented.target,
+        entry.name,
+    )
+
+
+def _documented(env: BuildEnvironment) -> dict[str, list[Documented]]:
+    """
+    The deprecations documented within each document.
+    """
+    if not hasattr(env, "regret_deprecations"):
+        env.regret_deprecations = {}  # type: ignore[reportAttributeAccessIssue]
+    return env.regret_deprecations  # type: ignore[reportAttributeAccessIssue]
+
+
+def _indexes(env: BuildEnvironment) -> set[str]:
+    """
+    The documents which contain an index of deprecations.
+    """
+    if not hasattr(env, "regret_deprecation_indexes"):
+        env.regret_deprecation_indexes = set()  # type: ignore[reportAttributeAccessIssue]
+    return env.regret_deprecation_indexes  # type: ignore[reportAttributeAccessIssue]
+
+
+def _collect(  # noqa: PLR0917
+    app: Sphinx,
+    what: str,
+    name: str,
+    obj: Any,
+    options: Any,
+    lines: list[str],
+) -> None:
+    entries = _INDEX.entries_for(what=what, name=name, object=obj)
+    if not entries:
+        return
+    documented = _documented(app.env).setdefault(app.env.docname, [])
+    for entry in entries:
+        each = Documented(entry=entry, target=name)
+        if each not in documented:
+            documented.append(each)
+
+
+def _purge(app: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    _documented(env).pop(docname, None)
+    _indexes(env).discard(docname)
+
+
+def _merge(
+    app: Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    documented = _documented(other)
+    _documented(env).update(
+        (docname, documented[docname])
+        for docname in docnames
+        if docname in documented
+    )
+    _indexes(env).update(_indexes(other) & docnames)
+
+
+def _outdated(
+    app: Sphinx,
+    env: BuildEnvironment,
+    added: set[str],
+    changed: set[str],
+    removed: set[str],
+) -> list[str]:
+    if added or changed or removed:
+        return sorted(_indexes(env))
+    return []
+
+
+def setup(app: Sphinx) -> dict[str, Any]:
+    """
+    Set up the extension.
+    """
+    app.setup_extension("sphinx.ext.autodoc")
+    app.add_node(deprecation_index)
+    app.add_directive("regret-deprecations", DeprecationIndex)
+    app.add_post_transform(FillDeprecationIndexes)
+    app.connect("autodoc-process-docstring", _collect)
+    app.connect("env-purge-doc", _purge)
+    app.connect("env-merge-info", _merge)
+    app.connect("env-get-outdated", _outdated)
+    return {
+        "env_version": 1,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
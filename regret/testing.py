@@ -4,19 +4,20 @@ Helpers for testing your regret.
 
 from __future__ import annotations
 
+from collections import Counter, deque
+from contextvars import ContextVar
+from itertools import islice
 from typing import TYPE_CHECKING
 import contextlib
 
-from attrs import field, frozen
+from attrs import field, frozen, mutable
 
 from regret.emitted import Deprecation
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Generator, MutableSequence
     from typing import Any
 
-    from regret.typing import Deprecatable
-
 
 class ExpectedDifferentDeprecations(AssertionError):
     """
@@ -24,24 +25,54 @@ class ExpectedDifferentDeprecations(AssertionError):
     """
 
 
-@frozen
+@mutable
 class Recorder:
     """
     Recorders keep track of deprecations as they are emitted.
 
     They provide helper methods for asserting about the deprecations
     afterwards.
+
+    Expectations only ever examine the deprecations emitted while they
+    are active, so their cost does not grow with the number of
+    deprecations previously recorded.
     """
 
-    _saw: list[Deprecatable] = field(factory=list, alias="saw")
+    _saw: MutableSequence[Deprecation] = field(
+        factory=list[Deprecation],
+        alias="saw",
+    )
+    _emitted: int = field(default=0, init=False)
+
+    @classmethod
+    def ring_buffer(cls, size: int) -> Recorder:
+        """
+        A recorder which only retains the most recent deprecations.
+
+        Useful for long-running tests which emit many deprecations, where
+        keeping every deprecation ever emitted would consume unbounded
+        memory.
+
+        Arguments:
+
+            size:
+
+                the number of deprecations to retain. Expectations
+                whose blocks emit more deprecations than this will
+                still check how many were emitted, but can only compare
+                the most recent ``size`` of them.
+
+        """
+        return cls(saw=deque(maxlen=size))
 
-    def emit(self, deprecation: Deprecatable, extra_stacklevel: int) -> None:
+    def emit(self, deprecation: Deprecation, extra_stacklevel: int) -> None:
         """
         "Emit" a deprecation by simply storing it.
 
         An emitter suitable for passing to `regret.Deprecator` instances.
         """
         self._saw.append(deprecation)
+        self._emitted += 1
 
     def expect(self, **kwargs: Any) -> contextlib.AbstractContextManager[None]:
         """
@@ -53,14 +84,189 @@ class Recorder:
     def expect_deprecations(
         self,
         *deprecations: Deprecation,
-    ) -> Iterator[None]:
+    ) -> Generator[None, None, None]:
         """
         Expect a given set of deprecations to be emitted.
         """
-        expected = self._saw + list(deprecations)
+        start = self._emitted
         yield
-        if self._saw != expected:
-            raise ExpectedDifferentDeprecations((self._saw, expected))
+        count = self._emitted - start
+        retained = islice(reversed(self._saw), count)
+        seen = list(retained)[::-1]
+        if count != len(deprecations):
+            raise ExpectedDifferentDeprecations((seen, list(deprecations)))
+        expected = list(deprecations[len(deprecations) - len(seen) :])
+        if seen != expected:
+            raise ExpectedDifferentDeprecations((seen, expected))
+
+    def expect_clean(self) -> contextlib.AbstractContextManager[None]:
+        """
+        Expect no deprecations to be emitted.
+        """
+        return self.expect_deprecations()
+
+
+#: What deprecations are counted by, as they may not themselves be hashable.
+_Key = tuple[tuple[str | None, str, tuple[str, ...]] | None, str]
+
+
+def _key(deprecation: Deprecation) -> _Key:
+    return deprecation.subject(), deprecation.message()
+
+
+@frozen
+class CountingRecorder:
+    """
+    Recorders which count deprecations as they are emitted.
+
+    Rather than storing each deprecation, only the number of times each
+    distinct deprecation has been emitted is kept, such that memory use
+    does not grow with the number of deprecations emitted. Deprecations
+    are distinguished by what they deprecate and by their message, so
+    they need not be hashable.
+
+    The order in which deprecations are emitted is not tracked, and is
+    therefore ignored by expectations.
+    """
+
+    _counts: Counter[_Key] = field(factory=Counter[_Key], init=False)
+    _deprecations: dict[_Key, Deprecation] = field(
+        factory=dict[_Key, Deprecation],
+        init=False,
+    )
+    _expectations: list[Counter[_Key]] = field(
+        factory=list[Counter[_Key]],
+        init=False,
+    )
+
+    def emit(self, deprecation: Deprecation, extra_stacklevel: int) -> None:
+        """
+        "Emit" a deprecation by simply counting it.
+
+        An emitter suitable for passing to `regret.Deprecator` instances.
+        """
+        key = _key(deprecation)
+        self._deprecations.setdefault(key, deprecation)
+        self._counts[key] += 1
+        for each in self._expectations:
+            each[key] += 1
+
+    @property
+    def counts(self) -> list[tuple[Deprecation, int]]:
+        """
+        Each distinct deprecation, along with the number of times emitted.
+
+        Suitable for passing as the ``usage`` of an exported
+        `regret.inventory.Inventory`.
+        """
+        return [
+            (self._deprecations[key], count)
+            for key, count in self._counts.items()
+        ]
+
+    def count(self, **kwargs: Any) -> int:
+        """
+        The number of times a given deprecation has been emitted.
+        """
+        return self._counts[_key(Deprecation(**kwargs))]
+
+    def expect(self, **kwargs: Any) -> contextlib.AbstractContextManager[None]:
+        """
+        Expect a given deprecation to be emitted.
+        """
+        return self.expect_deprecations(Deprecation(**kwargs))
+
+    @contextlib.contextmanager
+    def expect_deprecations(
+        self,
+        *deprecations: Deprecation,
+    ) -> Generator[None, None, None]:
+        """
+        Expect a given set of deprecations to be emitted, in any order.
+        """
+        seen: Counter[_Key] = Counter()
+        self._expectations.append(seen)
+        try:
+            yield
+        finally:
+            self._expectations.remove(seen)
+
+        expected = Counter(_key(each) for each in deprecations)
+        if seen != expected:
+            examples = {_key(each): each for each in deprecations}
+            examples.update(self._deprecations)
+            raise ExpectedDifferentDeprecations(
+                (
+                    [(examples[key], count) for key, count in seen.items()],
+                    [(examples[key], n) for key, n in expected.items()],
+                ),
+            )
+
+    def expect_clean(self) -> contextlib.AbstractContextManager[None]:
+        """
+        Expect no deprecations to be emitted.
+        """
+        return self.expect_deprecations()
+
+
+@frozen
+class ContextRecorder:
+    """
+    Recorders which keep track of deprecations separately per context.
+
+    Each expectation records into its own buffer, held in a
+    `contextvars.ContextVar`, so that deprecations emitted concurrently
+    by other threads or `asyncio` tasks are not seen by it, making
+    expectations safe to use from tests which run in parallel.
+
+    Threads or tasks started from within an expectation which copy its
+    context (as `asyncio` tasks do) record into its buffer. Deprecations
+    seen by a nested expectation are also seen by the expectation
+    enclosing it. Deprecations emitted outside of any expectation are
+    discarded.
+    """
+
+    _buffer: ContextVar[list[Deprecation] | None] = field(
+        factory=lambda: ContextVar("regret.testing.ContextRecorder"),
+        init=False,
+    )
+
+    def emit(self, deprecation: Deprecation, extra_stacklevel: int) -> None:
+        """
+        "Emit" a deprecation by storing it for the current context.
+
+        An emitter suitable for passing to `regret.Deprecator` instances.
+        """
+        buffer = self._buffer.get(None)
+        if buffer is not None:
+            buffer.append(deprecation)
+
+    def expect(self, **kwargs: Any) -> contextlib.AbstractContextManager[None]:
+        """
+        Expect a given set of deprecations to be emitted.
+        """
+        return self.expect_deprecations(Deprecation(**kwargs))
+
+    @contextlib.contextmanager
+    def expect_deprecations(
+        self,
+        *deprecations: Deprecation,
+    ) -> Generator[None, None, None]:
+        """
+        Expect a given set of deprecations to be emitted.
+        """
+        parent = self._buffer.get(None)
+        saw: list[Deprecation] = []
+        token = self._buffer.set(saw)
+        try:
+            yield
+        finally:
+            self._buffer.reset(token)
+            if parent is not None:
+                parent.extend(saw)
+        expected = list(deprecations)
+        if saw != expected:
+            raise ExpectedDifferentDeprecations((saw, expected))
 
     def expect_clean(self) -> contextlib.AbstractContextManager[None]:
         """
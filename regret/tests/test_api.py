@@ -1,18 +1,52 @@
-from datetime import date
-from functools import wraps
+from datetime import UTC, date, datetime, timedelta
+from functools import cached_property, wraps
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from textwrap import dedent
-from unittest import TestCase, skipIf
+from types import ModuleType
+from unittest import TestCase, mock, skipIf
+import asyncio
+import copy
+import enum
+import importlib
+import importlib.metadata
+import importlib.util
 import inspect
-
-from regret._inspect import AlreadyDeprecated, NoSuchParameter
+import json
+import os
+import pickle
+import sqlite3
+import stat
+import sys
+
+from regret import _modules, _versions
+from regret._clock import Today
+from regret._inspect import (
+    AlreadyDeprecated,
+    NoSuchParameter,
+    SignatureWithRegret,
+)
 from regret.emitted import (
+    Attribute,
     Callable,
+    ChangedDefault,
     Deprecation,
+    EnumMember,
     Inheritance,
+    MappingKey,
+    Module,
+    ModuleAttribute,
+    MutuallyExclusiveParameters,
     OptionalParameter,
     Parameter,
+    ParameterType,
+    ParameterValue,
+    PositionalParameter,
+    RenamedParameter,
 )
-from regret.testing import Recorder
+from regret.inventory import Entry, Inventory
+from regret.policies import DaysAfterRelease, MinorReleases
+from regret.testing import CountingRecorder, Recorder
 import regret
 
 try:  # pragma: no cover
@@ -460,6 +494,371 @@ class TestDeprecator(TestCase):
             ),
         )
 
+    def test_class(self):
+        class Original(Adder):
+            pass
+
+        Deprecated = self.regret.Class(version="1.2.3")(Original)
+        with self.recorder.expect(kind=Callable(object=Original)):
+            self.assertEqual(Deprecated(9, y=2), Adder(11))
+
+    def test_class_is_preserved(self):
+        class Original:
+            pass
+
+        Deprecated = self.regret.Class(version="1.2.3")(Original)
+        with self.recorder.expect(kind=Callable(object=Original)):
+            instance = Deprecated()
+
+        self.assertEqual(
+            (Deprecated, type(instance), isinstance(instance, Original)),
+            (Original, Original, True),
+        )
+
+    def test_class_subclasses_do_not_emit(self):
+        @self.regret.Class(version="1.2.3")
+        class Deprecated:
+            def __init__(self, x):
+                self.x = x
+
+        class Subclass(Deprecated):
+            pass
+
+        with self.recorder.expect_clean():
+            self.assertEqual(Subclass(x=12).x, 12)
+
+    def test_class_subclasses_with_init(self):
+        @self.regret.Class(version="1.2.3")
+        class Deprecated:
+            pass
+
+        class Subclass(Deprecated):
+            def __init__(self, x):
+                self.x = x
+
+        with self.recorder.expect_clean():
+            self.assertEqual(Subclass(12).x, 12)
+
+    def test_class_with_dunder_new(self):
+        @self.regret.Class(version="1.2.3")
+        class Deprecated:
+            def __new__(cls, x):
+                instance = super().__new__(cls)
+                instance.x = x
+                return instance
+
+        with self.recorder.expect(kind=Callable(object=Deprecated)):
+            self.assertEqual(Deprecated(x=12).x, 12)
+
+    def test_class_with_builtin_base(self):
+        @self.regret.Class(version="1.2.3")
+        class Deprecated(int):
+            pass
+
+        with self.recorder.expect(kind=Callable(object=Deprecated)):
+            self.assertEqual(Deprecated("12"), 12)
+
+    def test_class_without_init_still_rejects_arguments(self):
+        @self.regret.Class(version="1.2.3")
+        class Deprecated:
+            pass
+
+        with self.assertRaises(TypeError):
+            Deprecated(12)
+
+    def test_class_keeps_its_signature(self):
+        class Original:
+            def __init__(self, x, *, y=2):  # pragma: no cover
+                pass
+
+        expected = inspect.signature(Original)
+        Deprecated = self.regret.Class(version="1.2.3")(Original)
+        self.assertEqual(inspect.signature(Deprecated), expected)
+
+    def test_class_with_replacement_and_removal_date(self):
+        removal_date = date(year=2012, month=12, day=12)
+
+        @self.regret.Class(
+            version="1.2.3",
+            replacement=Calculator,
+            removal_date=removal_date,
+        )
+        class Deprecated:
+            pass
+
+        with self.recorder.expect(
+            kind=Callable(object=Deprecated),
+            replacement=Calculator,
+            removal_date=removal_date,
+        ):
+            Deprecated()
+
+    def test_class_gets_deprecation_notice_in_docstring(self):
+        @self.regret.Class(version="v2.3.4")
+        class Deprecated:
+            """
+            Add things.
+            """
+
+        self.assertEqual(
+            Deprecated.__doc__,
+            dedent(
+                """
+                Add things.
+
+                .. deprecated:: v2.3.4
+                """,
+            ),
+        )
+
+    def test_class_with_no_docstring_does_not_get_notice(self):
+        @self.regret.Class(version="v2.3.4")
+        class Lazy:
+            pass
+
+        self.assertIsNone(Lazy.__doc__)
+
+    def test_classmethod(self):
+        class Thing:
+            @self.regret.callable(version="1.2.3")
+            @classmethod
+            def create(cls):
+                return cls
+
+        class Subthing(Thing):
+            pass
+
+        deprecated = vars(Thing)["create"].__func__
+        with self.recorder.expect_deprecations(
+            Deprecation(kind=Callable(object=deprecated)),
+            Deprecation(kind=Callable(object=deprecated)),
+        ):
+            self.assertEqual(
+                (Thing.create(), Subthing().create()),
+                (Thing, Subthing),
+            )
+
+    def test_staticmethod(self):
+        class Thing:
+            @self.regret.callable(version="1.2.3")
+            @staticmethod
+            def calculate(x):
+                return x
+
+        deprecated = vars(Thing)["calculate"].__func__
+        with self.recorder.expect_deprecations(
+            Deprecation(kind=Callable(object=deprecated)),
+            Deprecation(kind=Callable(object=deprecated)),
+        ):
+            self.assertEqual(
+                (Thing.calculate(12), Thing().calculate(13)),
+                (12, 13),
+            )
+
+    def test_property(self):
+        class Thing:
+            @self.regret.callable(version="1.2.3")
+            @property
+            def value(self):
+                return 12
+
+        deprecated = Thing.value.fget
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            self.assertEqual(Thing().value, 12)
+
+    def test_property_setter_and_deleter(self):
+        class Thing:
+            def _get(self):
+                return self._value
+
+            def _set(self, value):
+                self._value = value
+
+            def _delete(self):
+                del self._value
+
+            value = self.regret.callable(version="1.2.3")(
+                property(_get, _set, _delete),
+            )
+
+        thing = Thing()
+        with self.recorder.expect_deprecations(
+            Deprecation(kind=Callable(object=Thing.value.fset)),
+            Deprecation(kind=Callable(object=Thing.value.fget)),
+            Deprecation(kind=Callable(object=Thing.value.fdel)),
+        ):
+            thing.value = 37
+            self.assertEqual(thing.value, 37)
+            del thing.value
+        self.assertFalse(hasattr(thing, "_value"))
+
+    def test_property_gets_deprecation_notice_in_docstring(self):
+        class Thing:
+            @self.regret.callable(version="v2.3.4")
+            @property
+            def value(self):  # pragma: no cover
+                """
+                A value.
+                """
+
+        self.assertEqual(
+            Thing.value.__doc__,
+            dedent(
+                """
+                A value.
+
+                .. deprecated:: v2.3.4
+                """,
+            ),
+        )
+
+    def test_property_keeps_explicit_docstring(self):
+        class Thing:
+            value = self.regret.callable(version="1.2.3")(
+                property(lambda self: 12, doc="A value."),
+            )
+
+        self.assertEqual(Thing.value.__doc__, "A value.")
+
+    def test_cached_property(self):
+        class Thing:
+            @self.regret.callable(version="1.2.3")
+            @cached_property
+            def value(self):
+                return object()
+
+        thing = Thing()
+        deprecated = Thing.value.func
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            value = thing.value
+        with self.recorder.expect_clean():
+            self.assertIs(thing.value, value)
+
+    def test_coroutine_function(self):
+        async def calculate():
+            return 12
+
+        deprecated = self.regret.callable(version="1.2.3")(calculate)
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            self.assertEqual(asyncio.run(deprecated()), 12)
+
+    def test_coroutine_function_is_still_a_coroutine_function(self):
+        async def calculate():  # pragma: no cover
+            return 12
+
+        deprecated = self.regret.callable(version="1.2.3")(calculate)
+        self.assertTrue(inspect.iscoroutinefunction(deprecated))
+
+    def test_coroutine_function_emits_before_awaiting(self):
+        async def calculate():
+            return 12
+
+        deprecated = self.regret.callable(version="1.2.3")(calculate)
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            coroutine = deprecated()
+        self.assertEqual(coroutine.cr_code, calculate.__code__)
+        with self.recorder.expect_clean():
+            self.assertEqual(asyncio.run(coroutine), 12)
+
+    def test_coroutine_method(self):
+        class Calculator:
+            @self.regret.callable(version="1.2.3")
+            async def calculate(self):
+                return 12
+
+        with self.recorder.expect(kind=Callable(object=Calculator.calculate)):
+            self.assertEqual(asyncio.run(Calculator().calculate()), 12)
+
+    def test_generator_function(self):
+        def count(n):
+            sent = yield 0
+            while sent < n:
+                sent = yield sent + 1
+            return "done"
+
+        deprecated = self.regret.callable(version="1.2.3")(count)
+        self.assertTrue(inspect.isgeneratorfunction(deprecated))
+
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            generator = deprecated(3)
+        self.assertEqual(generator.gi_code, count.__code__)
+        with self.recorder.expect_clean():
+            self.assertEqual(
+                [next(generator), generator.send(1), generator.send(2)],
+                [0, 2, 3],
+            )
+            with self.assertRaises(StopIteration) as e:
+                generator.send(3)
+        self.assertEqual(e.exception.value, "done")
+
+    def test_generator_method(self):
+        class Counter:
+            @self.regret.callable(version="1.2.3")
+            def count(self, n):
+                yield from range(n)
+
+            @self.regret.callable(version="1.2.3")
+            @classmethod
+            def count_class(cls, n):
+                yield from range(n)
+
+        self.assertTrue(inspect.isgeneratorfunction(Counter().count))
+        with self.recorder.expect(kind=Callable(object=Counter.count)):
+            generator = Counter().count(2)
+        self.assertEqual(list(generator), [0, 1])
+        with self.recorder.expect(
+            kind=Callable(object=Counter.count_class.__func__),
+        ):
+            generator = Counter.count_class(2)
+        self.assertEqual(list(generator), [0, 1])
+
+    def test_async_generator_function(self):
+        async def count(n):
+            sent = yield 0
+            while sent < n:
+                try:
+                    sent = yield sent + 1
+                except ValueError:
+                    sent = yield -1
+
+        deprecated = self.regret.callable(version="1.2.3")(count)
+        self.assertTrue(inspect.isasyncgenfunction(deprecated))
+
+        async def consume(generator):
+            seen = [await anext(generator), await generator.asend(1)]
+            seen.append(await generator.athrow(ValueError))
+            seen.append(await generator.asend(2))
+            with self.assertRaises(StopAsyncIteration):
+                await generator.asend(3)
+            return seen
+
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            generator = deprecated(3)
+        self.assertEqual(generator.ag_code, count.__code__)
+        with self.recorder.expect_clean():
+            self.assertEqual(asyncio.run(consume(generator)), [0, 2, -1, 3])
+
+    def test_async_generator_function_closes_original(self):
+        closed = []
+
+        async def count():
+            try:
+                yield 1
+                yield 2  # pragma: no cover
+            finally:
+                closed.append(True)
+
+        deprecated = self.regret.callable(version="1.2.3")(count)
+
+        async def consume():
+            generator = deprecated()
+            await anext(generator)
+            await generator.aclose()
+
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            asyncio.run(consume())
+        self.assertEqual(closed, [True])
+
     def test_dunder_call(self):
         class Calculator:
             @self.regret.callable(version="1.2.3")
@@ -1813,6 +2212,83 @@ class TestDeprecator(TestCase):
             ),
         )
 
+    def test_inheritance_in_place(self):
+        class Original:
+            pass
+
+        Uninheritable = self.regret.inheritance(
+            version="1.2.3",
+            in_place=True,
+        )(Original)
+
+        with self.recorder.expect(kind=Inheritance(type=Original)):
+
+            class Subclass(Uninheritable):
+                pass
+
+        self.assertEqual(
+            (Uninheritable, Subclass.__mro__),
+            (Original, (Subclass, Original, object)),
+        )
+
+    def test_inheritance_in_place_instances_are_unchanged(self):
+        @self.regret.inheritance(version="1.2.3", in_place=True)
+        class Original:
+            pass
+
+        with self.recorder.expect_clean():
+            instance = Original()
+        self.assertIs(type(instance), Original)
+
+    def test_inheritance_in_place_subclasses_of_subclasses(self):
+        @self.regret.inheritance(version="1.2.3", in_place=True)
+        class Original:
+            pass
+
+        with self.recorder.expect_deprecations(
+            Deprecation(kind=Inheritance(type=Original)),
+            Deprecation(kind=Inheritance(type=Original)),
+        ):
+
+            class Subclass(Original):
+                pass
+
+            class SubSubclass(Subclass):
+                pass
+
+    def test_inheritance_in_place_chains_init_subclass(self):
+        class Inheritable:
+            def __init_subclass__(Subclass, **kwargs):
+                Subclass.init = kwargs
+
+        Uninheritable = self.regret.inheritance(
+            version="2.3.4",
+            in_place=True,
+        )(Inheritable)
+
+        with self.recorder.expect(kind=Inheritance(type=Inheritable)):
+
+            class Subclass(Uninheritable, baz="quux"):
+                pass
+
+        self.assertEqual(Subclass.init, dict(baz="quux"))
+
+    def test_inheritance_in_place_chains_parent_init_subclass(self):
+        class Parent:
+            def __init_subclass__(Subclass, **kwargs):
+                Subclass.init = kwargs
+
+        @self.regret.inheritance(version="2.3.4", in_place=True)
+        class Child(Parent):
+            pass
+
+        with self.recorder.expect(kind=Inheritance(type=Child)):
+
+            class Grandchild(Child, foo="bar"):
+                pass
+
+        self.assertEqual(Grandchild.init, dict(foo="bar"))
+
     def test_original_classes_are_not_mutated_via_inheritance(self):
         """
         Deprecating inheritance in one spot does not mutate the original class.
@@ -1853,6 +2329,2795 @@ class TestDeprecator(TestCase):
         )
 
 
+class TestDunderDeprecated(TestCase):
+    """
+    Deprecated objects carry PEP 702's ``__deprecated__`` attribute.
+    """
+
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+
+    def test_callable(self):
+        deprecated = self.regret.callable(
+            version="1.2.3",
+            removal_date=date(year=2012, month=12, day=12),
+            replacement=add,
+        )(calculate)
+        self.assertEqual(
+            deprecated.__deprecated__,
+            "calculate is deprecated. "
+            "It will be removed on or after 2012-12-12. "
+            "Please use add instead.",
+        )
+
+    def test_original_is_unchanged(self):
+        self.regret.callable(version="1.2.3")(calculate)
+        self.assertFalse(hasattr(calculate, "__deprecated__"))
+
+    def test_method(self):
+        class Calculator:
+            @self.regret.callable(version="1.2.3")
+            def calculate(self):  # pragma: no cover
+                return 12
+
+        self.assertEqual(
+            Calculator.calculate.__deprecated__,
+            f"{Calculator.calculate.__qualname__} is deprecated.",
+        )
+
+    def test_Class(self):
+        class Calculator:
+            pass
+
+        self.regret.Class(version="1.2.3")(Calculator)
+        self.assertEqual(
+            Calculator.__deprecated__,
+            f"{Calculator.__qualname__} is deprecated.",
+        )
+
+    def test_inheritance(self):
+        class Calculator:
+            pass
+
+        Uninheritable = self.regret.inheritance(version="1.2.3")(Calculator)
+        self.assertEqual(
+            Uninheritable.__deprecated__,
+            f"Subclassing from {Calculator.__qualname__} is deprecated.",
+        )
+
+    def test_inheritance_in_place(self):
+        class Calculator:
+            pass
+
+        self.regret.inheritance(version="1.2.3", in_place=True)(Calculator)
+        self.assertEqual(
+            Calculator.__deprecated__,
+            f"Subclassing from {Calculator.__qualname__} is deprecated.",
+        )
+
+    @skipIf(sys.version_info < (3, 13), "warnings.deprecated is new in 3.13")
+    def test_use_warnings_deprecated(self):
+        deprecator = regret.Deprecator(use_warnings_deprecated=True)
+        deprecated = deprecator.callable(version="1.2.3")(calculate)
+        with self.assertWarns(deprecator.category) as caught:
+            self.assertEqual(deprecated(), 12)
+        self.assertEqual(str(caught.warning), "calculate is deprecated.")
+        self.assertEqual(deprecated.__deprecated__, "calculate is deprecated.")
+        self.assertFalse(hasattr(caught.warning, "deprecation"))
+
+    def test_use_warnings_deprecated_overdue(self):
+        deprecator = regret.Deprecator(
+            use_warnings_deprecated=True,
+            overdue=RuntimeError,
+            today=lambda: date(2013, 1, 1),
+        )
+        deprecated = deprecator.callable(
+            version="1.2.3",
+            removal_date=date(2012, 12, 12),
+        )(calculate)
+        with self.assertRaises(RuntimeError):
+            deprecated()
+
+    def test_use_warnings_deprecated_custom_emit(self):
+        deprecator = regret.Deprecator(
+            emit=self.recorder.emit,
+            use_warnings_deprecated=True,
+        )
+        deprecated = deprecator.callable(version="1.2.3")(calculate)
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            self.assertEqual(deprecated(), 12)
+
+
+class TestCurrentVersion(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(
+            emit=self.recorder.emit,
+            current_version="1.2.3",
+        )
+
+    def test_in_effect(self):
+        deprecated = self.regret.callable(version="1.2.3")(calculate)
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            self.assertEqual(deprecated(), 12)
+
+    def test_in_effect_for_older_versions(self):
+        deprecated = self.regret.callable(version="v1.2")(calculate)
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            self.assertEqual(deprecated(), 12)
+
+    def test_future_versions_are_not_applied(self):
+        deprecate = self.regret.callable(version="1.3.0")
+        self.assertIs(deprecate(calculate), calculate)
+
+    def test_future_prerelease(self):
+        regret_ = regret.Deprecator(current_version="2.0.0rc1")
+        self.assertIs(regret_.callable(version="2.0.0")(calculate), calculate)
+
+    def test_future_Class(self):
+        class Calculator:
+            pass
+
+        self.regret.Class(version="1.3.0")(Calculator)
+        with self.recorder.expect_clean():
+            Calculator()
+
+    def test_future_parameter(self):
+        def add(x, y):
+            return x + y
+
+        self.assertIs(self.regret.parameter(version="2", name="y")(add), add)
+
+    def test_future_attribute(self):
+        class Calculator:
+            value = 12
+
+        self.regret.attribute(version="2", name="value")(Calculator)
+        with self.recorder.expect_clean():
+            self.assertEqual(Calculator.value, 12)
+
+    def test_future_module(self):
+        meta_path = list(sys.meta_path)
+        self.addCleanup(sys.meta_path.__setitem__, slice(None), meta_path)
+        self.regret.module(version="2", name="regret.tests.nonexistent")
+        self.assertNotIn(
+            "regret.tests.nonexistent",
+            _modules.DeprecatedModuleFinder.installed()._deprecated,
+        )
+
+    def test_future_renamed_parameter_still_renames(self):
+        @self.regret.renamed_parameter(version="2", old="y_", new="y")
+        def add(x, y):
+            return x + y
+
+        with self.recorder.expect(
+            kind=RenamedParameter(
+                callable=add,
+                old="y_",
+                parameter=inspect.Parameter(
+                    name="y",
+                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                ),
+            ),
+        ):
+            self.assertEqual(add(1, y_=2), 3)
+
+    def test_version_is_parsed_once_per_deprecation(self):
+        deprecate = self.regret.callable(version="1.0")
+        with mock.patch.object(
+            _versions,
+            "parse",
+            side_effect=AssertionError("Should not parse."),
+        ):
+            deprecated = deprecate(calculate)
+            with self.recorder.expect(kind=Callable(object=deprecated)):
+                deprecated()
+
+    def test_no_current_version(self):
+        regret_ = regret.Deprecator(emit=self.recorder.emit)
+        deprecated = regret_.callable(version="999")(calculate)
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            deprecated()
+
+    def test_distribution(self):
+        installed = importlib.metadata.version("attrs")
+        regret_ = regret.Deprecator(distribution="attrs")
+        self.assertEqual(
+            regret_,
+            regret.Deprecator(current_version=None, distribution="attrs"),
+        )
+        self.assertIsNot(
+            regret_.callable(version=installed)(calculate),
+            calculate,
+        )
+        self.assertIs(regret_.callable(version="99999")(calculate), calculate)
+
+    def test_both_current_version_and_distribution(self):
+        with self.assertRaises(TypeError):
+            regret.Deprecator(current_version="1.2.3", distribution="attrs")
+
+    def test_invalid_current_version(self):
+        with self.assertRaises(ValueError):
+            regret.Deprecator(current_version="banana")
+
+
+class TestVersions(TestCase):
+    def test_ordering(self):
+        versions = [
+            "1.0.dev0",
+            "1.0a1.dev1",
+            "1.0a1",
+            "1.0b2",
+            "1.0rc1",
+            "1.0",
+            "1.0.post1.dev0",
+            "1.0.post1",
+            "1.1",
+            "v2",
+        ]
+        parsed = [_versions.parse(each) for each in versions]
+        self.assertEqual(parsed, sorted(parsed))
+
+    def test_trailing_zeros(self):
+        self.assertEqual(_versions.parse("1.2"), _versions.parse("1.2.0"))
+
+    def test_v_prefix_and_local_version(self):
+        self.assertEqual(
+            _versions.parse("v1.2.3+local.7"),
+            _versions.parse("1.2.3"),
+        )
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            _versions.parse("banana")
+
+
+class TestOverdue(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+
+    def test_error(self):
+        regret_ = regret.Deprecator(
+            emit=self.recorder.emit,
+            overdue=RuntimeError,
+            today=lambda: date(2012, 12, 13),
+        )
+        deprecated = regret_.callable(
+            version="1.2.3",
+            removal_date=date(2012, 12, 12),
+        )(calculate)
+        with (
+            self.recorder.expect_clean(),
+            self.assertRaises(RuntimeError) as e,
+        ):
+            deprecated()
+        self.assertEqual(
+            str(e.exception),
+            "calculate is deprecated. "
+            "It will be removed on or after 2012-12-12.",
+        )
+
+    def test_not_yet_overdue(self):
+        regret_ = regret.Deprecator(
+            emit=self.recorder.emit,
+            overdue=RuntimeError,
+            today=lambda: date(2012, 12, 12),
+        )
+        deprecated = regret_.callable(
+            version="1.2.3",
+            removal_date=date(2012, 12, 12),
+        )(calculate)
+        with self.recorder.expect(
+            kind=Callable(object=deprecated),
+            removal_date=date(2012, 12, 12),
+        ):
+            self.assertEqual(deprecated(), 12)
+
+    def test_no_removal_date(self):
+        regret_ = regret.Deprecator(
+            emit=self.recorder.emit,
+            overdue=RuntimeError,
+            today=lambda: date.max,
+        )
+        deprecated = regret_.callable(version="1.2.3")(calculate)
+        with self.recorder.expect(kind=Callable(object=deprecated)):
+            self.assertEqual(deprecated(), 12)
+
+    def test_no_policy(self):
+        regret_ = regret.Deprecator(
+            emit=self.recorder.emit,
+            today=lambda: date.max,
+        )
+        deprecated = regret_.callable(
+            version="1.2.3",
+            removal_date=date(2012, 12, 12),
+        )(calculate)
+        with self.recorder.expect(
+            kind=Callable(object=deprecated),
+            removal_date=date(2012, 12, 12),
+        ):
+            self.assertEqual(deprecated(), 12)
+
+    def test_louder_category(self):
+        seen = []
+        regret_ = regret.Deprecator(
+            emit=lambda deprecation, **_: seen.append(deprecation),
+            overdue=FutureWarning,
+            today=lambda: date(2013, 1, 1),
+        )
+        deprecated = regret_.callable(
+            version="1.2.3",
+            removal_date=date(2012, 12, 12),
+        )(calculate)
+        deprecated()
+        [deprecation] = seen
+        self.assertIs(deprecation.category, FutureWarning)
+
+    def test_louder_category_not_yet_overdue(self):
+        seen = []
+        regret_ = regret.Deprecator(
+            emit=lambda deprecation, **_: seen.append(deprecation),
+            overdue=FutureWarning,
+            today=lambda: date(2012, 1, 1),
+        )
+        deprecated = regret_.callable(
+            version="1.2.3",
+            removal_date=date(2012, 12, 12),
+        )(calculate)
+        deprecated()
+        [deprecation] = seen
+        self.assertIs(deprecation.category, regret_.category)
+
+    def test_other_deprecatables(self):
+        regret_ = regret.Deprecator(
+            emit=self.recorder.emit,
+            overdue=RuntimeError,
+            today=lambda: date.max,
+        )
+
+        @regret_.attribute(
+            version="1.2.3",
+            name="value",
+            removal_date=date(2012, 12, 12),
+        )
+        class Calculator:
+            value = 12
+
+        with self.assertRaises(RuntimeError):
+            Calculator.value  # noqa: B018
+
+
+class TestPolicies(TestCase):
+    def test_days_after_release(self):
+        policy = DaysAfterRelease(
+            days=180,
+            released={"1.2.0": date(2012, 12, 12)},
+        )
+        self.assertEqual(policy("1.2"), date(2013, 6, 10))
+
+    def test_days_after_release_unreleased(self):
+        policy = DaysAfterRelease(days=180, released={})
+        self.assertIsNone(policy("1.2.3"))
+
+    def test_minor_releases(self):
+        policy = MinorReleases(
+            count=2,
+            released={
+                "1.2.0": date(2012, 1, 1),
+                "1.3.0": date(2012, 3, 1),
+                "1.4.0": date(2012, 5, 1),
+                "1.4.1": date(2012, 5, 15),
+            },
+            cadence=timedelta(days=90),
+        )
+        self.assertEqual(policy("1.2.0"), date(2012, 5, 1))
+
+    def test_minor_releases_major_release(self):
+        policy = MinorReleases(
+            count=2,
+            released={
+                "1.2.0": date(2012, 1, 1),
+                "2.0.0": date(2012, 3, 1),
+            },
+            cadence=timedelta(days=90),
+        )
+        self.assertEqual(policy("1.2.0"), date(2012, 3, 1))
+
+    def test_minor_releases_estimated(self):
+        policy = MinorReleases(
+            count=2,
+            released={"1.2.0": date(2012, 1, 1)},
+            cadence=timedelta(days=90),
+        )
+        self.assertEqual(policy("1.2.0"), date(2012, 6, 29))
+
+    def test_minor_releases_unreleased(self):
+        policy = MinorReleases(
+            count=2,
+            released={},
+            cadence=timedelta(days=90),
+        )
+        self.assertIsNone(policy("1.2.0"))
+
+    def test_policy_chooses_removal_dates(self):
+        recorder = Recorder()
+        regret_ = regret.Deprecator(
+            emit=recorder.emit,
+            policy=lambda version: date(2012, 12, 12),
+        )
+        deprecated = regret_.callable(version="1.2.3")(calculate)
+        with recorder.expect(
+            kind=Callable(object=deprecated),
+            removal_date=date(2012, 12, 12),
+        ):
+            deprecated()
+
+    def test_explicit_removal_dates_win(self):
+        recorder = Recorder()
+        regret_ = regret.Deprecator(
+            emit=recorder.emit,
+            policy=lambda version: date(2012, 12, 12),
+        )
+        deprecated = regret_.callable(
+            version="1.2.3",
+            removal_date=date(2013, 1, 1),
+        )(calculate)
+        with recorder.expect(
+            kind=Callable(object=deprecated),
+            removal_date=date(2013, 1, 1),
+        ):
+            deprecated()
+
+    def test_policy_for_attributes(self):
+        recorder = Recorder()
+        regret_ = regret.Deprecator(
+            emit=recorder.emit,
+            policy=lambda version: date(2012, 12, 12),
+        )
+
+        class Point:
+            x = 1
+
+        regret_.attribute(version="1.2.3", name="x")(Point)
+        with recorder.expect(
+            kind=Attribute(type=Point, name="x"),
+            removal_date=date(2012, 12, 12),
+        ):
+            self.assertEqual(Point().x, 1)
+
+
+class TestInventory(TestCase):
+    def setUp(self):
+        self.inventory = Inventory()
+        self.regret = regret.Deprecator(
+            emit=Recorder().emit,
+            inventory=self.inventory,
+        )
+
+    def test_callable(self):
+        self.regret.callable(
+            version="1.2.3",
+            replacement=add,
+            removal_date=date(2012, 12, 12),
+            addendum="Stop it.",
+        )(calculate)
+        self.assertEqual(
+            list(self.inventory),
+            [
+                Entry(
+                    name="calculate",
+                    module=__name__,
+                    kind="callable",
+                    version="1.2.3",
+                    replacement="add",
+                    removal_date=date(2012, 12, 12),
+                    addendum="Stop it.",
+                    filename=__file__,
+                    lineno=calculate.__code__.co_firstlineno,
+                ),
+            ],
+        )
+
+    def test_parameter(self):
+        self.regret.parameter(version="1.2.3", name="y")(add)
+        (entry,) = self.inventory
+        self.assertEqual(
+            (entry.name, entry.kind),
+            ("add(y)", "parameter"),
+        )
+
+    def test_mutually_exclusive(self):
+        self.regret.mutually_exclusive(
+            version="1.2.3",
+            names=(name for name in ["y", "x"]),
+        )(add)
+        (entry,) = self.inventory
+        self.assertEqual(
+            (entry.name, entry.kind),
+            ("add(x, y)", "mutually_exclusive"),
+        )
+
+    def test_module_attribute(self):
+        module = ModuleType("_regret_test_inventory")
+        sys.modules[module.__name__] = module
+        self.addCleanup(sys.modules.pop, module.__name__)
+
+        self.regret.module_attribute(
+            version="1.2.3",
+            module=module.__name__,
+            name="VALUE",
+            value=12,
+            removal_date=date(2012, 12, 12),
+        )
+        (entry,) = self.inventory
+        self.assertEqual(
+            (entry.name, entry.module, entry.kind, entry.removal_date),
+            ("VALUE", module.__name__, "module_attribute", date(2012, 12, 12)),
+        )
+
+    def test_skipped_deprecations_are_not_recorded(self):
+        regret_ = regret.Deprecator(
+            emit=Recorder().emit,
+            inventory=self.inventory,
+            current_version="1.0",
+        )
+        regret_.callable(version="1.2.3")(calculate)
+        self.assertEqual(len(self.inventory), 0)
+
+    def test_policy_removal_dates_are_recorded(self):
+        regret_ = regret.Deprecator(
+            emit=Recorder().emit,
+            inventory=self.inventory,
+            policy=lambda version: date(2012, 12, 12),
+        )
+        regret_.callable(version="1.2.3")(calculate)
+        (entry,) = self.inventory
+        self.assertEqual(entry.removal_date, date(2012, 12, 12))
+
+    def test_overdue(self):
+        for day in 11, 12, 13:
+            self.inventory.add(
+                Entry(
+                    name=f"calculate{day}",
+                    module=__name__,
+                    kind="callable",
+                    version="1.2.3",
+                    removal_date=date(2012, 12, day),
+                ),
+            )
+        self.regret.callable(version="1.2.3")(add)
+        overdue = self.inventory.overdue(date(2012, 12, 12))
+        self.assertEqual(
+            [each.removal_date for each in overdue],
+            [date(2012, 12, 11)],
+        )
+
+    def test_deprecations_are_recorded_once(self):
+        for day in 11, 12:
+            self.regret.callable(
+                version="1.2.3",
+                removal_date=date(2012, 12, day),
+            )(calculate)
+        (entry,) = self.inventory
+        self.assertEqual(entry.removal_date, date(2012, 12, 12))
+
+    def test_changed_since(self):
+        first, second, replacement = (
+            Entry(name=name, module=__name__, kind="callable", version=version)
+            for name, version in [
+                ("calculate", "1"),
+                ("add", "1"),
+                ("calculate", "2"),
+            ]
+        )
+        self.inventory.add(first)
+        self.assertEqual(self.inventory.changed_since(0), ([first], 1))
+
+        self.inventory.add(second)
+        self.inventory.add(first)
+        self.assertEqual(self.inventory.changed_since(1), ([second], 2))
+
+        self.inventory.add(replacement)
+        self.assertEqual(self.inventory.changed_since(2), ([replacement], 3))
+        self.assertEqual(self.inventory.changed_since(3), ([], 3))
+
+    def test_mapping_keys_are_recorded_once_per_call_site(self):
+        def configure():
+            return self.regret.mapping_keys(
+                version="1.2.3",
+                mapping={},
+                renamed=dict(timeout_ms="timeout"),
+            )
+
+        for _ in range(10):
+            configure()
+        (entry,) = self.inventory
+        self.assertEqual(
+            (entry.name, entry.filename, entry.lineno),
+            (
+                "'timeout_ms'",
+                __file__,
+                configure.__code__.co_firstlineno + 1,
+            ),
+        )
+
+    def test_default_inventory(self):
+        regret.callable(version="1.2.3")(calculate)
+        self.assertIn(
+            "calculate",
+            [each.name for each in regret.inventory.INVENTORY],
+        )
+
+
+class TestExport(TestCase):
+    def setUp(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name)
+
+        self.inventory = Inventory()
+        self.recorder = CountingRecorder()
+        self.regret = regret.Deprecator(
+            emit=self.recorder.emit,
+            inventory=self.inventory,
+        )
+
+    def rows(self, path):
+        connection = sqlite3.connect(path)
+        self.addCleanup(connection.close)
+        return connection.execute(
+            """
+            SELECT module, name, kind, version, removal_date, usage
+            FROM deprecations ORDER BY name, kind
+            """,
+        ).fetchall()
+
+    def test_sqlite(self):
+        deprecated = self.regret.callable(
+            version="1.2.3",
+            removal_date=date(2012, 12, 12),
+        )(calculate)
+        self.regret.parameter(version="1.2.3", name="y")(add)
+
+        path = self.path / "inventory.sqlite"
+        self.inventory.to_sqlite(path)
+        self.assertEqual(
+            self.rows(path),
+            [
+                (__name__, "add(y)", "parameter", "1.2.3", None, 0),
+                (__name__, "calculate", "callable", "1.2.3", "2012-12-12", 0),
+            ],
+        )
+
+        deprecated()
+        deprecated()
+        self.inventory.to_sqlite(path, usage=self.recorder.counts)
+        self.assertEqual(
+            self.rows(path),
+            [
+                (__name__, "add(y)", "parameter", "1.2.3", None, 0),
+                (__name__, "calculate", "callable", "1.2.3", "2012-12-12", 2),
+            ],
+        )
+
+    def test_sqlite_incremental(self):
+        path = self.path / "inventory.sqlite"
+        self.regret.callable(version="1.2.3")(calculate)
+        self.inventory.to_sqlite(path)
+
+        other = Inventory()
+        regret_ = regret.Deprecator(inventory=other)
+        regret_.callable(version="2.0.0")(calculate)
+        regret_.parameter(version="2.0.0", name="y")(add)
+        other.to_sqlite(path)
+
+        self.assertEqual(
+            self.rows(path),
+            [
+                (__name__, "add(y)", "parameter", "2.0.0", None, 0),
+                (__name__, "calculate", "callable", "2.0.0", None, 0),
+            ],
+        )
+
+    def test_json(self):
+        deprecated = self.regret.callable(
+            version="1.2.3",
+            removal_date=date(2012, 12, 12),
+        )(calculate)
+        deprecated()
+
+        path = self.path / "inventory.json"
+        self.inventory.to_json(path, usage=self.recorder.counts)
+        self.inventory.to_json(path, usage=self.recorder.counts)
+        self.assertEqual(
+            json.loads(path.read_text()),
+            {
+                "deprecations": [
+                    {
+                        "module": __name__,
+                        "name": "calculate",
+                        "kind": "callable",
+                        "version": "1.2.3",
+                        "replacement": None,
+                        "removal_date": "2012-12-12",
+                        "addendum": None,
+                        "filename": __file__,
+                        "lineno": calculate.__code__.co_firstlineno,
+                        "usage": 2,
+                    },
+                ],
+            },
+        )
+
+    def test_json_mode(self):
+        path = self.path / "inventory.json"
+        self.regret.callable(version="1.2.3")(calculate)
+
+        umask = os.umask(0o022)
+        self.addCleanup(os.umask, umask)
+        self.inventory.to_json(path)
+        self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o644)
+
+        path.chmod(0o664)
+        self.inventory.to_json(path)
+        self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o664)
+
+        self.assertEqual(list(self.path.iterdir()), [path])
+
+    def test_json_failure_leaves_no_temporary_file(self):
+        path = self.path / "inventory.json"
+        self.regret.callable(version="1.2.3")(calculate)
+        with (
+            mock.patch.object(Path, "replace", side_effect=OSError),
+            self.assertRaises(OSError),
+        ):
+            self.inventory.to_json(path)
+        self.assertEqual(list(self.path.iterdir()), [])
+
+    def test_usage_is_per_kind(self):
+        class Point:
+            pass
+
+        Point = self.regret.inheritance(version="1.2.3")(Point)
+        Point = self.regret.Class(version="1.2.3")(Point)
+        Point()
+
+        path = self.path / "inventory.sqlite"
+        self.inventory.to_sqlite(path, usage=self.recorder.counts)
+        name = Point.__qualname__
+        self.assertEqual(
+            self.rows(path),
+            [
+                (__name__, name, "Class", "1.2.3", None, 1),
+                (__name__, name, "inheritance", "1.2.3", None, 0),
+            ],
+        )
+
+        path = self.path / "inventory.json"
+        self.inventory.to_json(path, usage=self.recorder.counts)
+        deprecations = json.loads(path.read_text())["deprecations"]
+        self.assertEqual(
+            [(each["kind"], each["usage"]) for each in deprecations],
+            [("inheritance", 0), ("Class", 1)],
+        )
+
+    def test_usage_of_parameters(self):
+        deprecated = self.regret.mutually_exclusive(
+            version="1.2.3",
+            names=["y", "x"],
+        )(add)
+        deprecated(x=1, y=2)
+
+        path = self.path / "inventory.sqlite"
+        self.inventory.to_sqlite(path, usage=self.recorder.counts)
+        self.assertEqual(
+            self.rows(path),
+            [(__name__, "add(x, y)", "mutually_exclusive", "1.2.3", None, 1)],
+        )
+
+    def test_usage_of_some_mutually_exclusive_parameters(self):
+        def move(x=0, y=0, z=0):
+            return x, y, z
+
+        deprecated = self.regret.mutually_exclusive(
+            version="1.2.3",
+            names=["x", "y", "z"],
+        )(move)
+        deprecated(x=1, y=2)
+
+        path = self.path / "inventory.sqlite"
+        self.inventory.to_sqlite(path, usage=self.recorder.counts)
+        self.assertEqual(
+            self.rows(path),
+            [
+                (
+                    __name__,
+                    f"{move.__qualname__}(x, y, z)",
+                    "mutually_exclusive",
+                    "1.2.3",
+                    None,
+                    1,
+                ),
+            ],
+        )
+
+    def test_usage_of_mapping_keys(self):
+        mapping = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping=dict(timeout=30),
+            renamed=dict(timeout_ms="timeout"),
+        )
+        self.assertEqual(mapping["timeout_ms"], 30)
+
+        path = self.path / "inventory.sqlite"
+        self.inventory.to_sqlite(path, usage=self.recorder.counts)
+        self.assertEqual(
+            self.rows(path),
+            [("", "'timeout_ms'", "mapping_keys", "1.2.3", None, 1)],
+        )
+
+
+class TestToday(TestCase):
+    def test_today(self):
+        today = Today(
+            now=lambda: datetime(2012, 12, 12, 12, tzinfo=UTC),
+            clock=lambda: 0,
+        )
+        self.assertEqual(today(), date(2012, 12, 12))
+
+    def test_recalculated_after_midnight(self):
+        now, clock = [datetime(2012, 12, 12, 23, tzinfo=UTC)], [100.0]
+        today = Today(now=lambda: now[0], clock=lambda: clock[0])
+        self.assertEqual(today(), date(2012, 12, 12))
+
+        # An hour minus a second later, it's still the same day.
+        now[0] = datetime(2012, 12, 12, 23, 59, 59, tzinfo=UTC)
+        clock[0] = 3699.0
+        self.assertEqual(today(), date(2012, 12, 12))
+
+        now[0], clock[0] = datetime(2012, 12, 13, tzinfo=UTC), 3700
+        self.assertEqual(today(), date(2012, 12, 13))
+
+    def test_now_is_not_called_until_then(self):
+        calls = []
+
+        def now():
+            calls.append(None)
+            return datetime(2012, 12, 12, 12, tzinfo=UTC)
+
+        clock = [0.0]
+        today = Today(now=now, clock=lambda: clock[0])
+        for each in range(100):
+            clock[0] = float(each)
+            today()
+        self.assertEqual(len(calls), 1)
+
+
+class TestParameterValue(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+
+    def test_keyword(self):
+        @self.regret.parameter_value(
+            version="1.2.3",
+            name="mode",
+            values={"legacy"},
+        )
+        def load(path, mode="modern"):
+            return path, mode
+
+        with self.recorder.expect(
+            kind=ParameterValue(
+                callable=load,
+                parameter=inspect.Parameter(
+                    name="mode",
+                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    default="modern",
+                ),
+                value="legacy",
+            ),
+        ):
+            self.assertEqual(load("foo", mode="legacy"), ("foo", "legacy"))
+
+    def test_positionally(self):
+        @self.regret.parameter_value(
+            version="1.2.3",
+            name="mode",
+            values={"legacy"},
+        )
+        def load(path, mode="modern"):
+            return path, mode
+
+        with self.recorder.expect(
+            kind=ParameterValue(
+                callable=load,
+                parameter=inspect.Parameter(
+                    name="mode",
+                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    default="modern",
+                ),
+                value="legacy",
+            ),
+        ):
+            self.assertEqual(load("foo", "legacy"), ("foo", "legacy"))
+
+    def test_via_kwargs(self):
+        @self.regret.parameter_value(
+            version="1.2.3",
+            name="mode",
+            values={"legacy"},
+        )
+        def load(path, **kwargs):
+            return path, kwargs
+
+        with self.recorder.expect(
+            kind=ParameterValue(
+                callable=load,
+                parameter=inspect.Parameter(
+                    name="mode",
+                    kind=inspect.Parameter.KEYWORD_ONLY,
+                ),
+                value="legacy",
+            ),
+        ):
+            self.assertEqual(
+                load("foo", mode="legacy"),
+                ("foo", dict(mode="legacy")),
+            )
+
+    def test_other_values_do_not_warn(self):
+        @self.regret.parameter_value(
+            version="1.2.3",
+            name="mode",
+            values={"legacy"},
+        )
+        def load(path, mode="modern"):
+            return path, mode
+
+        with self.recorder.expect_clean():
+            self.assertEqual(load("foo", "other"), ("foo", "other"))
+            self.assertEqual(load("foo", mode=[]), ("foo", []))
+
+    def test_unprovided_does_not_bind(self):
+        @self.regret.parameter_value(
+            version="1.2.3",
+            name="mode",
+            values={"legacy"},
+        )
+        def load(path, mode="modern"):
+            return path, mode
+
+        with (
+            self.recorder.expect_clean(),
+            mock.patch.object(
+                SignatureWithRegret,
+                "bind",
+                side_effect=AssertionError("Should not bind."),
+            ),
+        ):
+            self.assertEqual(load("foo"), ("foo", "modern"))
+            self.assertEqual(load(path="foo"), ("foo", "modern"))
+
+    def test_unconfigured_checks_are_skipped(self):
+        @self.regret.parameter_value(
+            version="1.2.3",
+            name="mode",
+            values={"legacy"},
+        )
+        def load(path, mode="modern"):
+            return path, mode
+
+        unexpected = AssertionError("Should not check.")
+        with (
+            self.recorder.expect_clean(),
+            mock.patch.multiple(
+                SignatureWithRegret,
+                rename=mock.Mock(side_effect=unexpected),
+                passed_positionally=mock.Mock(side_effect=unexpected),
+                omitted=mock.Mock(side_effect=unexpected),
+                passed_together=mock.Mock(side_effect=unexpected),
+            ),
+        ):
+            self.assertEqual(load("foo"), ("foo", "modern"))
+
+    def test_unhashable_values(self):
+        @self.regret.parameter_value(
+            version="1.2.3",
+            name="mode",
+            values=["legacy", ["old"]],
+        )
+        def load(mode):
+            return mode
+
+        kind = ParameterValue(
+            callable=load,
+            parameter=inspect.Parameter(
+                name="mode",
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ),
+            value=["old"],
+        )
+        with self.recorder.expect(kind=kind):
+            self.assertEqual(load(["old"]), ["old"])
+        with self.recorder.expect_clean():
+            self.assertEqual(load(["new"]), ["new"])
+
+    def test_predicate(self):
+        @self.regret.parameter_value(
+            version="1.2.3",
+            name="count",
+            predicate=lambda value: value < 0,
+        )
+        def repeat(count):
+            return count
+
+        kind = ParameterValue(
+            callable=repeat,
+            parameter=inspect.Parameter(
+                name="count",
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ),
+            value=-1,
+        )
+        with self.recorder.expect(kind=kind):
+            self.assertEqual(repeat(-1), -1)
+        with self.recorder.expect_clean():
+            self.assertEqual(repeat(1), 1)
+
+    def test_with_deprecated_parameter(self):
+        @self.regret.parameter(version="1.2.3", name="encoding")
+        @self.regret.parameter_value(
+            version="1.2.3",
+            name="mode",
+            values={"legacy"},
+        )
+        def load(mode, encoding=None):
+            return mode
+
+        with self.recorder.expect_deprecations(
+            Deprecation(
+                kind=Parameter(
+                    callable=load,
+                    parameter=inspect.Parameter(
+                        name="encoding",
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=None,
+                    ),
+                ),
+            ),
+            Deprecation(
+                kind=ParameterValue(
+                    callable=load,
+                    parameter=inspect.Parameter(
+                        name="mode",
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    ),
+                    value="legacy",
+                ),
+            ),
+        ):
+            self.assertEqual(load("legacy", encoding="utf-8"), "legacy")
+
+    def test_cannot_be_deprecated_twice(self):
+        deprecate = self.regret.parameter_value(
+            version="1.2.3",
+            name="mode",
+            values={"legacy"},
+        )
+
+        @deprecate
+        def load(mode):  # pragma: no cover
+            return mode
+
+        with self.assertRaises(AlreadyDeprecated):
+            deprecate(load)
+
+    def test_non_existent_parameter(self):
+        with self.assertRaises(NoSuchParameter):
+            self.regret.parameter_value(
+                version="1.2.3",
+                name="mode",
+                values={"legacy"},
+            )(add)
+
+    def test_unwraps(self):
+        deprecated = self.regret.parameter_value(
+            version="1.2.3",
+            name="y",
+            values={0},
+        )(add)
+        self.assertIs(inspect.unwrap(deprecated), add)
+
+
+class TestParameterType(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+
+    def test_parameter_type(self):
+        @self.regret.parameter_type(version="1.2.3", name="path", types=str)
+        def load(path):
+            return Path(path)
+
+        with self.recorder.expect(
+            kind=ParameterType(
+                callable=load,
+                parameter=inspect.Parameter(
+                    name="path",
+                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                ),
+                type=str,
+            ),
+        ):
+            self.assertEqual(load("foo"), Path("foo"))
+        with self.recorder.expect_clean():
+            self.assertEqual(load(Path("foo")), Path("foo"))
+
+    def test_subclasses(self):
+        class Path(str):
+            __slots__ = ()
+
+        @self.regret.parameter_type(version="1.2.3", name="path", types=str)
+        def load(path):
+            return path
+
+        with self.recorder.expect(
+            kind=ParameterType(
+                callable=load,
+                parameter=inspect.Parameter(
+                    name="path",
+                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                ),
+                type=Path,
+            ),
+        ):
+            load(path=Path("foo"))
+
+    def test_multiple_types(self):
+        @self.regret.parameter_type(
+            version="1.2.3",
+            name="path",
+            types=(str, bytes),
+        )
+        def load(path):
+            return path
+
+        parameter = inspect.Parameter(
+            name="path",
+            kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+        with self.recorder.expect_deprecations(
+            Deprecation(
+                kind=ParameterType(
+                    callable=load,
+                    parameter=parameter,
+                    type=bytes,
+                ),
+            ),
+            Deprecation(
+                kind=ParameterType(
+                    callable=load,
+                    parameter=parameter,
+                    type=str,
+                ),
+            ),
+        ):
+            load(b"foo")
+            load("foo")
+
+    def test_via_kwargs(self):
+        @self.regret.parameter_type(version="1.2.3", name="path", types=str)
+        def load(**kwargs):
+            return kwargs
+
+        with self.recorder.expect(
+            kind=ParameterType(
+                callable=load,
+                parameter=inspect.Parameter(
+                    name="path",
+                    kind=inspect.Parameter.KEYWORD_ONLY,
+                ),
+                type=str,
+            ),
+        ):
+            self.assertEqual(load(path="foo"), dict(path="foo"))
+
+    def test_verdicts_are_cached(self):
+        checked = []
+
+        class Meta(type):
+            def __subclasscheck__(cls, subclass):
+                checked.append(subclass)
+                return subclass is str
+
+        class Deprecated(metaclass=Meta):
+            pass
+
+        @self.regret.parameter_type(
+            version="1.2.3",
+            name="path",
+            types=Deprecated,
+        )
+        def load(path):
+            return path
+
+        for _ in range(3):
+            load("foo")
+            load(Path("foo"))
+
+        self.assertEqual(checked, [str, type(Path("foo"))])
+
+    def test_with_deprecated_values(self):
+        @self.regret.parameter_type(version="1.2.3", name="mode", types=int)
+        @self.regret.parameter_value(
+            version="1.2.3",
+            name="mode",
+            values={"legacy"},
+        )
+        def load(mode):
+            return mode
+
+        parameter = inspect.Parameter(
+            name="mode",
+            kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+        with self.recorder.expect_deprecations(
+            Deprecation(
+                kind=ParameterValue(
+                    callable=load,
+                    parameter=parameter,
+                    value="legacy",
+                ),
+            ),
+            Deprecation(
+                kind=ParameterType(
+                    callable=load,
+                    parameter=parameter,
+                    type=int,
+                ),
+            ),
+        ):
+            load("legacy")
+            load(12)
+
+    def test_cannot_be_deprecated_twice(self):
+        deprecate = self.regret.parameter_type(
+            version="1.2.3",
+            name="path",
+            types=str,
+        )
+
+        @deprecate
+        def load(path):  # pragma: no cover
+            return path
+
+        with self.assertRaises(AlreadyDeprecated):
+            deprecate(load)
+
+    def test_non_existent_parameter(self):
+        with self.assertRaises(NoSuchParameter):
+            self.regret.parameter_type(
+                version="1.2.3",
+                name="path",
+                types=str,
+            )(add)
+
+
+class TestRenamedParameter(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+
+    def test_old_name(self):
+        @self.regret.renamed_parameter(
+            version="1.2.3",
+            old="timeout_ms",
+            new="timeout",
+        )
+        def fetch(url, timeout=None):
+            return url, timeout
+
+        with self.recorder.expect(
+            kind=RenamedParameter(
+                callable=fetch,
+                old="timeout_ms",
+                parameter=inspect.Parameter(
+                    name="timeout",
+                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    default=None,
+                ),
+            ),
+        ):
+            self.assertEqual(fetch("foo", timeout_ms=3), ("foo", 3))
+
+    def test_new_name(self):
+        @self.regret.renamed_parameter(
+            version="1.2.3",
+            old="timeout_ms",
+            new="timeout",
+        )
+        def fetch(url, timeout=None):
+            return url, timeout
+
+        with self.recorder.expect_clean():
+            self.assertEqual(fetch("foo", timeout=3), ("foo", 3))
+            self.assertEqual(fetch("foo", 3), ("foo", 3))
+            self.assertEqual(fetch("foo"), ("foo", None))
+
+    def test_both_names(self):
+        @self.regret.renamed_parameter(
+            version="1.2.3",
+            old="timeout_ms",
+            new="timeout",
+        )
+        def fetch(url, timeout=None):
+            return url, timeout
+
+        with self.assertRaises(TypeError):
+            fetch("foo", timeout_ms=3, timeout=3)
+
+    def test_both_names_new_positionally(self):
+        @self.regret.renamed_parameter(
+            version="1.2.3",
+            old="timeout_ms",
+            new="timeout",
+        )
+        def fetch(url, timeout=None):
+            return url, timeout
+
+        with self.assertRaises(TypeError):
+            fetch("foo", 3, timeout_ms=3)
+
+    def test_via_kwargs(self):
+        @self.regret.renamed_parameter(
+            version="1.2.3",
+            old="timeout_ms",
+            new="timeout",
+        )
+        def fetch(**kwargs):
+            return kwargs
+
+        with self.recorder.expect(
+            kind=RenamedParameter(
+                callable=fetch,
+                old="timeout_ms",
+                parameter=inspect.Parameter(
+                    name="timeout",
+                    kind=inspect.Parameter.KEYWORD_ONLY,
+                ),
+            ),
+        ):
+            self.assertEqual(fetch(timeout_ms=3), dict(timeout=3))
+
+    def test_with_deprecated_values(self):
+        @self.regret.renamed_parameter(
+            version="1.2.3",
+            old="timeout_ms",
+            new="timeout",
+        )
+        @self.regret.parameter_value(
+            version="1.2.3",
+            name="timeout",
+            values={0},
+        )
+        def fetch(timeout=None):
+            return timeout
+
+        parameter = inspect.Parameter(
+            name="timeout",
+            kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            default=None,
+        )
+        with self.recorder.expect_deprecations(
+            Deprecation(
+                kind=RenamedParameter(
+                    callable=fetch,
+                    old="timeout_ms",
+                    parameter=parameter,
+                ),
+            ),
+            Deprecation(
+                kind=ParameterValue(
+                    callable=fetch,
+                    parameter=parameter,
+                    value=0,
+                ),
+            ),
+        ):
+            self.assertEqual(fetch(timeout_ms=0), 0)
+
+    def test_message(self):
+        def fetch(timeout=None):
+            pass
+
+        kind = RenamedParameter(
+            callable=fetch,
+            old="timeout_ms",
+            parameter=inspect.signature(fetch).parameters["timeout"],
+        )
+        self.assertEqual(
+            Deprecation(kind=kind).message(),
+            f"The 'timeout_ms' parameter of {fetch.__qualname__} "
+            "is deprecated. Please use 'timeout' instead.",
+        )
+
+    def test_nonexistent_parameter(self):
+        def fetch(timeout=None):
+            pass
+
+        with self.assertRaises(NoSuchParameter):
+            self.regret.renamed_parameter(
+                version="1.2.3",
+                old="timeout_ms",
+                new="time",
+            )(fetch)
+
+    def test_old_name_still_a_parameter(self):
+        def fetch(timeout_ms=None, timeout=None):
+            pass
+
+        with self.assertRaises(ValueError):
+            self.regret.renamed_parameter(
+                version="1.2.3",
+                old="timeout_ms",
+                new="timeout",
+            )(fetch)
+
+    def test_already_deprecated(self):
+        def fetch(timeout=None):
+            pass
+
+        deprecated = self.regret.renamed_parameter(
+            version="1.2.3",
+            old="timeout_ms",
+            new="timeout",
+        )(fetch)
+        with self.assertRaises(AlreadyDeprecated):
+            self.regret.renamed_parameter(
+                version="1.2.3",
+                old="timeout_ms",
+                new="timeout",
+            )(deprecated)
+
+
+class TestChangedDefault(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+
+    def test_omitted(self):
+        @self.regret.changed_default(
+            version="1.2.3",
+            name="strict",
+            new_default=True,
+        )
+        def parse(text, strict=False):
+            return text, strict
+
+        with self.recorder.expect(
+            kind=ChangedDefault(
+                callable=parse,
+                parameter=inspect.Parameter(
+                    name="strict",
+                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    default=False,
+                ),
+                new_default=True,
+            ),
+        ):
+            self.assertEqual(parse("foo"), ("foo", False))
+
+    def test_provided(self):
+        @self.regret.changed_default(
+            version="1.2.3",
+            name="strict",
+            new_default=True,
+        )
+        def parse(text, strict=False):
+            return text, strict
+
+        with self.recorder.expect_clean():
+            self.assertEqual(parse("foo", strict=False), ("foo", False))
+            self.assertEqual(parse("foo", True), ("foo", True))
+
+    def test_keyword_only(self):
+        @self.regret.changed_default(
+            version="1.2.3",
+            name="strict",
+            new_default=True,
+        )
+        def parse(text, *, strict=False):
+            return text, strict
+
+        with self.recorder.expect_clean():
+            self.assertEqual(parse("foo", strict=True), ("foo", True))
+        with self.recorder.expect(
+            kind=ChangedDefault(
+                callable=parse,
+                parameter=inspect.Parameter(
+                    name="strict",
+                    kind=inspect.Parameter.KEYWORD_ONLY,
+                    default=False,
+                ),
+                new_default=True,
+            ),
+        ):
+            self.assertEqual(parse("foo"), ("foo", False))
+
+    def test_provided_does_not_bind(self):
+        @self.regret.changed_default(
+            version="1.2.3",
+            name="strict",
+            new_default=True,
+        )
+        def parse(text, strict=False):
+            return text, strict
+
+        with mock.patch.object(
+            SignatureWithRegret,
+            "bind",
+            side_effect=AssertionError("Should not bind."),
+        ):
+            self.assertEqual(parse("foo", strict=True), ("foo", True))
+            self.assertEqual(parse("foo", True), ("foo", True))
+
+    def test_message(self):
+        def parse(text, strict=False):
+            pass
+
+        kind = ChangedDefault(
+            callable=parse,
+            parameter=inspect.signature(parse).parameters["strict"],
+            new_default=True,
+        )
+        self.assertEqual(
+            Deprecation(kind=kind).message(),
+            "Relying on the default value of the 'strict' parameter of "
+            f"{parse.__qualname__} is deprecated. It will change from "
+            "False to True.",
+        )
+
+    def test_no_default(self):
+        def parse(text):
+            pass
+
+        with self.assertRaises(ValueError):
+            self.regret.changed_default(
+                version="1.2.3",
+                name="text",
+                new_default="",
+            )(parse)
+
+    def test_nonexistent_parameter(self):
+        def parse(text):
+            pass
+
+        with self.assertRaises(NoSuchParameter):
+            self.regret.changed_default(
+                version="1.2.3",
+                name="strict",
+                new_default=True,
+            )(parse)
+
+    def test_already_deprecated(self):
+        def parse(text, strict=False):
+            pass
+
+        deprecated = self.regret.changed_default(
+            version="1.2.3",
+            name="strict",
+            new_default=True,
+        )(parse)
+        with self.assertRaises(AlreadyDeprecated):
+            self.regret.changed_default(
+                version="1.2.3",
+                name="strict",
+                new_default=None,
+            )(deprecated)
+
+
+class TestKeywordOnlyParameter(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+
+    def test_passed_positionally(self):
+        @self.regret.keyword_only_parameter(version="1.2.3", name="strict")
+        def parse(text, strict=False):
+            return text, strict
+
+        with self.recorder.expect(
+            kind=PositionalParameter(
+                callable=parse,
+                parameter=inspect.Parameter(
+                    name="strict",
+                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    default=False,
+                ),
+            ),
+        ):
+            self.assertEqual(parse("foo", True), ("foo", True))
+
+    def test_passed_by_keyword(self):
+        @self.regret.keyword_only_parameter(version="1.2.3", name="strict")
+        def parse(text, strict=False):
+            return text, strict
+
+        with self.recorder.expect_clean():
+            self.assertEqual(parse("foo", strict=True), ("foo", True))
+            self.assertEqual(parse("foo"), ("foo", False))
+            self.assertEqual(parse(text="foo"), ("foo", False))
+
+    def test_multiple(self):
+        @self.regret.keyword_only_parameter(version="1.2.3", name="c")
+        @self.regret.keyword_only_parameter(version="1.2.3", name="b")
+        def f(a, b=None, c=None):
+            return a, b, c
+
+        b, c = (
+            inspect.Parameter(
+                name=name,
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=None,
+            )
+            for name in "bc"
+        )
+        with self.recorder.expect_deprecations(
+            Deprecation(kind=PositionalParameter(callable=f, parameter=b)),
+        ):
+            self.assertEqual(f(1, 2), (1, 2, None))
+        with self.recorder.expect_deprecations(
+            Deprecation(kind=PositionalParameter(callable=f, parameter=b)),
+            Deprecation(kind=PositionalParameter(callable=f, parameter=c)),
+        ):
+            self.assertEqual(f(1, 2, 3), (1, 2, 3))
+
+    def test_does_not_bind(self):
+        @self.regret.keyword_only_parameter(version="1.2.3", name="strict")
+        def parse(text, strict=False):
+            return text, strict
+
+        with mock.patch.object(
+            SignatureWithRegret,
+            "bind",
+            side_effect=AssertionError("Should not bind."),
+        ):
+            parse("foo", strict=True)
+            with self.recorder.expect(
+                kind=PositionalParameter(
+                    callable=parse,
+                    parameter=inspect.Parameter(
+                        name="strict",
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=False,
+                    ),
+                ),
+            ):
+                parse("foo", True)
+
+    def test_message(self):
+        def parse(text, strict=False):
+            pass
+
+        kind = PositionalParameter(
+            callable=parse,
+            parameter=inspect.signature(parse).parameters["strict"],
+        )
+        self.assertEqual(
+            Deprecation(kind=kind).message(),
+            f"Passing the 'strict' parameter of {parse.__qualname__} "
+            "positionally is deprecated. It will become keyword-only.",
+        )
+
+    def test_already_keyword_only(self):
+        def parse(text, *, strict=False):
+            pass
+
+        with self.assertRaises(ValueError):
+            self.regret.keyword_only_parameter(
+                version="1.2.3",
+                name="strict",
+            )(parse)
+
+    def test_nonexistent_parameter(self):
+        def parse(text):
+            pass
+
+        with self.assertRaises(NoSuchParameter):
+            self.regret.keyword_only_parameter(
+                version="1.2.3",
+                name="strict",
+            )(parse)
+
+    def test_already_deprecated(self):
+        def parse(text, strict=False):
+            pass
+
+        deprecated = self.regret.keyword_only_parameter(
+            version="1.2.3",
+            name="strict",
+        )(parse)
+        with self.assertRaises(AlreadyDeprecated):
+            self.regret.keyword_only_parameter(
+                version="1.2.3",
+                name="strict",
+            )(deprecated)
+
+
+class TestMutuallyExclusive(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+
+    def test_passed_together(self):
+        @self.regret.mutually_exclusive(version="1.2.3", names=["x", "y"])
+        def move(x=0, y=0):
+            return x, y
+
+        with self.recorder.expect(
+            kind=MutuallyExclusiveParameters(
+                callable=move,
+                parameters=(
+                    inspect.Parameter(
+                        name="x",
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=0,
+                    ),
+                    inspect.Parameter(
+                        name="y",
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=0,
+                    ),
+                ),
+                group=("x", "y"),
+            ),
+        ):
+            self.assertEqual(move(x=1, y=2), (1, 2))
+
+    def test_positionally(self):
+        @self.regret.mutually_exclusive(version="1.2.3", names=["x", "y"])
+        def move(x=0, y=0):
+            return x, y
+
+        with self.recorder.expect(
+            kind=MutuallyExclusiveParameters(
+                callable=move,
+                parameters=(
+                    inspect.Parameter(
+                        name="x",
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=0,
+                    ),
+                    inspect.Parameter(
+                        name="y",
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=0,
+                    ),
+                ),
+                group=("x", "y"),
+            ),
+        ):
+            self.assertEqual(move(1, y=2), (1, 2))
+
+    def test_passed_alone(self):
+        @self.regret.mutually_exclusive(version="1.2.3", names=["x", "y"])
+        def move(x=0, y=0):
+            return x, y
+
+        with self.recorder.expect_clean():
+            self.assertEqual(move(), (0, 0))
+            self.assertEqual(move(1), (1, 0))
+            self.assertEqual(move(y=2), (0, 2))
+
+    def test_only_those_passed_are_included(self):
+        @self.regret.mutually_exclusive(
+            version="1.2.3",
+            names=["z", "x", "y"],
+        )
+        def move(x=0, y=0, *, z=0):
+            return x, y, z
+
+        with self.recorder.expect(
+            kind=MutuallyExclusiveParameters(
+                callable=move,
+                parameters=(
+                    inspect.Parameter(
+                        name="x",
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=0,
+                    ),
+                    inspect.Parameter(
+                        name="z",
+                        kind=inspect.Parameter.KEYWORD_ONLY,
+                        default=0,
+                    ),
+                ),
+                group=("x", "y", "z"),
+            ),
+        ):
+            self.assertEqual(move(1, z=3), (1, 0, 3))
+
+    def test_multiple_groups(self):
+        @self.regret.mutually_exclusive(version="1.2.3", names=["c", "d"])
+        @self.regret.mutually_exclusive(version="1.2.3", names=["a", "b"])
+        def f(a=None, b=None, c=None, d=None):
+            return a, b, c, d
+
+        with self.recorder.expect_deprecations(
+            Deprecation(
+                kind=MutuallyExclusiveParameters(
+                    callable=f,
+                    parameters=(
+                        inspect.Parameter(
+                            name="a",
+                            kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                            default=None,
+                        ),
+                        inspect.Parameter(
+                            name="b",
+                            kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                            default=None,
+                        ),
+                    ),
+                    group=("a", "b"),
+                ),
+            ),
+        ):
+            self.assertEqual(f(1, 2, 3), (1, 2, 3, None))
+
+    def test_via_kwargs(self):
+        @self.regret.mutually_exclusive(version="1.2.3", names=["x", "y"])
+        def move(**kwargs):
+            return kwargs
+
+        with self.recorder.expect(
+            kind=MutuallyExclusiveParameters(
+                callable=move,
+                parameters=(
+                    inspect.Parameter(
+                        name="x",
+                        kind=inspect.Parameter.KEYWORD_ONLY,
+                    ),
+                    inspect.Parameter(
+                        name="y",
+                        kind=inspect.Parameter.KEYWORD_ONLY,
+                    ),
+                ),
+                group=("x", "y"),
+            ),
+        ):
+            self.assertEqual(move(x=1, y=2), dict(x=1, y=2))
+
+    def test_with_deprecated_parameter(self):
+        @self.regret.mutually_exclusive(version="1.2.3", names=["x", "y"])
+        @self.regret.parameter(version="1.2.3", name="y")
+        def move(x=0, y=0):
+            return x, y
+
+        x, y = (
+            inspect.Parameter(
+                name=name,
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=0,
+            )
+            for name in "xy"
+        )
+        with self.recorder.expect_deprecations(
+            Deprecation(
+                kind=MutuallyExclusiveParameters(
+                    callable=move,
+                    parameters=(x, y),
+                    group=("x", "y"),
+                ),
+            ),
+            Deprecation(kind=Parameter(callable=move, parameter=y)),
+        ):
+            self.assertEqual(move(1, 2), (1, 2))
+
+    def test_message(self):
+        def move(x=0, y=0, z=0):
+            pass
+
+        parameters = inspect.signature(move).parameters.values()
+        kind = MutuallyExclusiveParameters(
+            callable=move,
+            parameters=tuple(parameters),
+        )
+        self.assertEqual(
+            Deprecation(kind=kind).message(),
+            "Passing the 'x', 'y' and 'z' parameters of "
+            f"{move.__qualname__} together is deprecated.",
+        )
+
+    def test_nonexistent_parameter(self):
+        def move(x=0, y=0):
+            pass
+
+        with self.assertRaises(NoSuchParameter):
+            self.regret.mutually_exclusive(
+                version="1.2.3",
+                names=["x", "z"],
+            )(move)
+
+    def test_too_few_parameters(self):
+        def move(x=0, y=0):
+            pass
+
+        with self.assertRaises(ValueError):
+            self.regret.mutually_exclusive(
+                version="1.2.3",
+                names=["x", "x"],
+            )(move)
+
+    def test_too_few_parameters_when_not_in_effect(self):
+        deprecator = regret.Deprecator(current_version="1.0.0")
+        with self.assertRaises(ValueError):
+            deprecator.mutually_exclusive(version="1.2.3", names=["x"])
+
+    def test_already_deprecated(self):
+        def move(x=0, y=0):
+            pass
+
+        deprecated = self.regret.mutually_exclusive(
+            version="1.2.3",
+            names=["x", "y"],
+        )(move)
+        with self.assertRaises(AlreadyDeprecated):
+            self.regret.mutually_exclusive(
+                version="1.2.3",
+                names=["y", "x"],
+            )(deprecated)
+
+
+class TestAttribute(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+
+    def test_class_attribute(self):
+        @self.regret.attribute(version="1.2.3", name="TIMEOUT")
+        class Config:
+            TIMEOUT = 30
+
+        kind = Attribute(type=Config, name="TIMEOUT")
+        with self.recorder.expect_deprecations(
+            Deprecation(kind=kind),
+            Deprecation(kind=kind),
+        ):
+            self.assertEqual((Config.TIMEOUT, Config().TIMEOUT), (30, 30))
+
+    def test_class_attribute_with_replacement_and_removal_date(self):
+        removal_date = date(year=2012, month=12, day=12)
+
+        @self.regret.attribute(
+            version="1.2.3",
+            name="TIMEOUT",
+            replacement=add,
+            removal_date=removal_date,
+            addendum="Seriously.",
+        )
+        class Config:
+            TIMEOUT = 30
+
+        with self.recorder.expect(
+            kind=Attribute(type=Config, name="TIMEOUT"),
+            replacement=add,
+            removal_date=removal_date,
+            addendum="Seriously.",
+        ):
+            self.assertEqual(Config.TIMEOUT, 30)
+
+    def test_class_attribute_shadowed_by_instance(self):
+        @self.regret.attribute(version="1.2.3", name="TIMEOUT")
+        class Config:
+            TIMEOUT = 30
+
+        config = Config()
+        config.TIMEOUT = 12
+        with self.recorder.expect_clean():
+            self.assertEqual(config.TIMEOUT, 12)
+
+    def test_method(self):
+        @self.regret.attribute(version="1.2.3", name="value")
+        class Calculator:
+            def value(self):
+                return 12
+
+        kind = Attribute(type=Calculator, name="value")
+        with self.recorder.expect(kind=kind):
+            self.assertEqual(Calculator().value(), 12)
+
+    def test_inherited_method(self):
+        class Parent:
+            def value(self):
+                return 12
+
+        @self.regret.attribute(version="1.2.3", name="value")
+        class Child(Parent):
+            pass
+
+        with self.recorder.expect(kind=Attribute(type=Child, name="value")):
+            self.assertEqual(Child().value(), 12)
+        with self.recorder.expect_clean():
+            self.assertEqual(Parent().value(), 12)
+
+    def test_classmethod(self):
+        @self.regret.attribute(version="1.2.3", name="create")
+        class Thing:
+            @classmethod
+            def create(cls):
+                return cls
+
+        with self.recorder.expect(kind=Attribute(type=Thing, name="create")):
+            self.assertIs(Thing.create(), Thing)
+
+    def test_staticmethod(self):
+        @self.regret.attribute(version="1.2.3", name="value")
+        class Thing:
+            @staticmethod
+            def value():
+                return 12
+
+        with self.recorder.expect(kind=Attribute(type=Thing, name="value")):
+            self.assertEqual(Thing().value(), 12)
+
+    def test_instance_attribute(self):
+        @self.regret.attribute(version="1.2.3", name="timeout")
+        class Config:
+            def __init__(self, timeout):
+                self.timeout = timeout
+
+        with self.recorder.expect_clean():
+            config = Config(timeout=30)
+        with self.recorder.expect(kind=Attribute(type=Config, name="timeout")):
+            self.assertEqual(config.timeout, 30)
+        self.assertEqual(vars(config), dict(timeout=30))
+
+    def test_instance_attribute_missing(self):
+        @self.regret.attribute(version="1.2.3", name="timeout")
+        class Config:
+            pass
+
+        with (
+            self.recorder.expect_clean(),
+            self.assertRaises(AttributeError),
+        ):
+            Config().timeout  # noqa: B018
+
+    def test_instance_attribute_delete(self):
+        @self.regret.attribute(version="1.2.3", name="timeout")
+        class Config:
+            def __init__(self):
+                self.timeout = 30
+
+        config = Config()
+        del config.timeout
+        self.assertEqual(vars(config), {})
+        with self.assertRaises(AttributeError):
+            del config.timeout
+
+    def test_instance_attribute_via_class_does_not_emit(self):
+        @self.regret.attribute(version="1.2.3", name="timeout")
+        class Config:
+            pass
+
+        with self.recorder.expect_clean():
+            Config.timeout  # noqa: B018
+
+    def test_slots(self):
+        @self.regret.attribute(version="1.2.3", name="timeout")
+        class Config:
+            __slots__ = ("host", "timeout")
+
+            def __init__(self, host, timeout):
+                self.host = host
+                self.timeout = timeout
+
+        with self.recorder.expect_clean():
+            config = Config(host="example.com", timeout=30)
+            self.assertEqual(config.host, "example.com")
+        with self.recorder.expect(kind=Attribute(type=Config, name="timeout")):
+            self.assertEqual(config.timeout, 30)
+        self.assertFalse(hasattr(config, "__dict__"))
+
+        del config.timeout
+        with (
+            self.recorder.expect_clean(),
+            self.assertRaises(AttributeError),
+        ):
+            config.timeout  # noqa: B018
+
+    def test_property(self):
+        @self.regret.attribute(version="1.2.3", name="value")
+        class Calculator:
+            @property
+            def value(self):
+                return 12
+
+        kind = Attribute(type=Calculator, name="value")
+        with self.recorder.expect(kind=kind):
+            self.assertEqual(Calculator().value, 12)
+
+    def test_other_attributes_are_unaffected(self):
+        @self.regret.attribute(version="1.2.3", name="timeout")
+        class Config:
+            def __init__(self):
+                self.timeout = 30
+                self.host = "example.com"
+
+        with self.recorder.expect_clean():
+            self.assertEqual(Config().host, "example.com")
+
+
+class TestEnumMember(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+
+        class Color(enum.Enum):
+            RED = "red"
+            GREEN = "green"
+            SCARLET = "red"  # noqa: PIE796
+
+        self.Color = Color
+
+    def test_attribute(self):
+        Color = self.regret.enum_member(version="1.2.3", name="RED")(
+            self.Color,
+        )
+        with self.recorder.expect(kind=EnumMember(type=Color, name="RED")):
+            self.assertIs(Color.RED, Color._member_map_["RED"])
+
+    def test_by_name(self):
+        Color = self.regret.enum_member(version="1.2.3", name="RED")(
+            self.Color,
+        )
+        with self.recorder.expect(kind=EnumMember(type=Color, name="RED")):
+            self.assertIs(Color["RED"], Color._member_map_["RED"])
+
+    def test_by_value(self):
+        Color = self.regret.enum_member(version="1.2.3", name="RED")(
+            self.Color,
+        )
+        with self.recorder.expect(kind=EnumMember(type=Color, name="RED")):
+            self.assertIs(Color("red"), Color._member_map_["RED"])
+
+    def test_other_members(self):
+        Color = self.regret.enum_member(version="1.2.3", name="RED")(
+            self.Color,
+        )
+        with self.recorder.expect_clean():
+            green = Color.GREEN
+            self.assertIs(Color["GREEN"], green)
+            self.assertIs(Color("green"), green)
+            self.assertIs(Color.GREEN.value, "green")
+
+    def test_iteration(self):
+        Color = self.regret.enum_member(version="1.2.3", name="RED")(
+            self.Color,
+        )
+        with self.recorder.expect_clean():
+            members = list(Color)
+            self.assertEqual(
+                [each.name for each in members],
+                ["RED", "GREEN"],
+            )
+            self.assertEqual(len(Color), 2)
+            self.assertIn("RED", Color.__members__)
+
+    def test_alias(self):
+        Color = self.regret.enum_member(version="1.2.3", name="SCARLET")(
+            self.Color,
+        )
+        red = Color._member_map_["RED"]
+        with self.recorder.expect(
+            kind=EnumMember(type=Color, name="SCARLET"),
+        ):
+            self.assertIs(Color.SCARLET, red)
+        with self.recorder.expect(
+            kind=EnumMember(type=Color, name="SCARLET"),
+        ):
+            self.assertIs(Color["SCARLET"], red)
+        with self.recorder.expect_clean():
+            self.assertIs(Color.RED, red)
+            self.assertIs(Color("red"), red)
+
+    def test_multiple_members(self):
+        Color = self.regret.enum_member(version="1.2.3", name="GREEN")(
+            self.regret.enum_member(version="1.2.3", name="RED")(self.Color),
+        )
+        red, green = Color._member_map_["RED"], Color._member_map_["GREEN"]
+        with self.recorder.expect(kind=EnumMember(type=Color, name="RED")):
+            self.assertIs(Color.RED, red)
+        with self.recorder.expect(
+            kind=EnumMember(type=Color, name="GREEN"),
+        ):
+            self.assertIs(Color["GREEN"], green)
+
+    def test_type_is_preserved(self):
+        metaclass = type(self.Color)
+        Color = self.regret.enum_member(version="1.2.3", name="RED")(
+            self.Color,
+        )
+        self.assertIsInstance(Color, metaclass)
+        self.assertTrue(issubclass(Color, enum.Enum))
+
+    def test_metaclass_can_be_pickled(self):
+        Color = self.regret.enum_member(version="1.2.3", name="RED")(
+            self.Color,
+        )
+        metaclass = type(Color)
+        self.assertIs(pickle.loads(pickle.dumps(metaclass)), metaclass)
+
+    def test_flag(self):
+        class Permission(enum.Flag):
+            READ = 1
+            WRITE = 2
+
+        Permission = self.regret.enum_member(version="1.2.3", name="WRITE")(
+            Permission,
+        )
+        with self.recorder.expect_clean():
+            read, write = Permission._member_map_.values()
+            self.assertEqual(Permission(3), read | write)
+        with self.recorder.expect(
+            kind=EnumMember(type=Permission, name="WRITE"),
+        ):
+            Permission(2)
+
+    def test_replacement(self):
+        Color = self.regret.enum_member(
+            version="1.2.3",
+            name="RED",
+            replacement=self.Color.GREEN,
+        )(self.Color)
+        with self.recorder.expect(
+            kind=EnumMember(
+                type=Color,
+                name="RED",
+                replacement=Color.GREEN,
+            ),
+        ):
+            self.assertIs(Color.RED, Color._member_map_["RED"])
+
+    def test_message(self):
+        self.assertEqual(
+            Deprecation(
+                kind=EnumMember(type=self.Color, name="RED"),
+            ).message(),
+            f"{self.Color.__qualname__}.RED is deprecated.",
+        )
+
+    def test_replacement_message(self):
+        self.assertEqual(
+            Deprecation(
+                kind=EnumMember(
+                    type=self.Color,
+                    name="RED",
+                    replacement=self.Color.GREEN,
+                ),
+            ).message(),
+            f"{self.Color.__qualname__}.RED is deprecated. "
+            f"Please use {self.Color.__qualname__}.GREEN instead.",
+        )
+
+    def test_nonexistent_member(self):
+        with self.assertRaises(AttributeError):
+            self.regret.enum_member(version="1.2.3", name="BLUE")(self.Color)
+
+    def test_already_deprecated(self):
+        Color = self.regret.enum_member(version="1.2.3", name="RED")(
+            self.Color,
+        )
+        with self.assertRaises(ValueError):
+            self.regret.enum_member(version="1.2.3", name="RED")(Color)
+
+
+class TestMappingKeys(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+
+    def test_ordinary_keys(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping=dict(timeout=3, retries=2),
+            renamed=dict(timeout_ms="timeout"),
+        )
+        with self.recorder.expect_clean():
+            self.assertEqual(config["retries"], 2)
+            self.assertEqual(config.get("retries"), 2)
+            self.assertIn("retries", config)
+            config["retries"] = 4
+            self.assertEqual(config, dict(timeout=3, retries=4))
+
+    def test_missing_keys(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping={},
+            renamed=dict(timeout_ms="timeout"),
+            removed={"verbose"},
+        )
+        with self.recorder.expect_clean(), self.assertRaises(KeyError):
+            config["retries"]
+        with self.recorder.expect_clean():
+            self.assertIsNone(config.get("retries"))
+            self.assertNotIn("retries", config)
+
+    def test_read_renamed(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping=dict(timeout=3),
+            renamed=dict(timeout_ms="timeout"),
+        )
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ):
+            self.assertEqual(config["timeout_ms"], 3)
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ):
+            self.assertEqual(config.get("timeout_ms"), 3)
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ):
+            self.assertIn("timeout_ms", config)
+
+    def test_read_renamed_missing(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping={},
+            renamed=dict(timeout_ms="timeout"),
+        )
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ), self.assertRaises(KeyError):
+            config["timeout_ms"]
+
+    def test_write_renamed(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping={},
+            renamed=dict(timeout_ms="timeout"),
+        )
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ):
+            config["timeout_ms"] = 3
+        self.assertEqual(config, dict(timeout=3))
+
+    def test_delete_renamed(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping=dict(timeout=3),
+            renamed=dict(timeout_ms="timeout"),
+        )
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ):
+            del config["timeout_ms"]
+        self.assertEqual(config, {})
+
+    def test_renamed_in_initial_mapping(self):
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ):
+            config = self.regret.mapping_keys(
+                version="1.2.3",
+                mapping=dict(timeout_ms=3),
+                renamed=dict(timeout_ms="timeout"),
+            )
+        with self.recorder.expect_clean():
+            self.assertEqual(config["timeout"], 3)
+        self.assertEqual(config, dict(timeout=3))
+
+    def test_removed(self):
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            config = self.regret.mapping_keys(
+                version="1.2.3",
+                mapping=dict(verbose=True, retries=2),
+                removed={"verbose"},
+            )
+        self.assertEqual(config, dict(retries=2))
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            self.assertTrue(config["verbose"])
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            config["verbose"] = False
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            self.assertFalse(config.get("verbose", True))
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            del config["verbose"]
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            self.assertNotIn("verbose", config)
+
+    def test_removed_from_a_generator(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping={},
+            removed=(key for key in ["verbose"]),
+        )
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            config["verbose"] = True
+        self.assertEqual(config, {})
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            self.assertTrue(config["verbose"])
+
+    def test_update_renamed(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping={},
+            renamed=dict(timeout_ms="timeout", retry="retries"),
+        )
+        with self.recorder.expect_deprecations(
+            Deprecation(kind=MappingKey(key="timeout_ms", new="timeout")),
+            Deprecation(kind=MappingKey(key="retry", new="retries")),
+        ):
+            config.update(dict(timeout_ms=9), retry=2)
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ):
+            config.update([("timeout_ms", 10)])
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ):
+            config |= dict(timeout_ms=11)
+        self.assertEqual(config, dict(timeout=11, retries=2))
+
+    def test_setdefault_renamed(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping={},
+            renamed=dict(timeout_ms="timeout"),
+        )
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ):
+            self.assertEqual(config.setdefault("timeout_ms", 3), 3)
+        self.assertEqual(config, dict(timeout=3))
+
+    def test_pop_renamed(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping=dict(timeout=3),
+            renamed=dict(timeout_ms="timeout"),
+        )
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ):
+            self.assertEqual(config.pop("timeout_ms"), 3)
+        self.assertEqual(config, {})
+        with self.recorder.expect(
+            kind=MappingKey(key="timeout_ms", new="timeout"),
+        ), self.assertRaises(KeyError):
+            config.pop("timeout_ms")
+
+    def test_removed_methods(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping={},
+            removed={"verbose"},
+        )
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            self.assertTrue(config.setdefault("verbose", True))
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            config.update(verbose=False)
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            self.assertFalse(config.pop("verbose"))
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            self.assertIsNone(config.pop("verbose", None))
+        self.assertEqual(config, {})
+
+    def test_copy(self):
+        config = self.regret.mapping_keys(
+            version="1.2.3",
+            mapping={},
+            renamed=dict(timeout_ms="timeout"),
+            removed={"verbose"},
+        )
+        config["timeout"] = 3
+        with self.recorder.expect(kind=MappingKey(key="verbose")):
+            config["verbose"] = True
+
+        for copied in config.copy(), copy.copy(config):
+            with self.recorder.expect_clean():
+                self.assertEqual(copied, dict(timeout=3))
+            with self.recorder.expect(kind=MappingKey(key="verbose")):
+                self.assertTrue(copied["verbose"])
+            with self.recorder.expect(
+                kind=MappingKey(key="timeout_ms", new="timeout"),
+            ):
+                copied["timeout_ms"] = 4
+            self.assertEqual(config, dict(timeout=3))
+
+    def test_is_a_dict(self):
+        config = self.regret.mapping_keys(version="1.2.3", mapping=dict(a=1))
+        self.assertIsInstance(config, dict)
+
+    def test_message(self):
+        self.assertEqual(
+            Deprecation(kind=MappingKey(key="verbose")).message(),
+            "The 'verbose' key is deprecated.",
+        )
+
+    def test_renamed_message(self):
+        self.assertEqual(
+            Deprecation(
+                kind=MappingKey(key="timeout_ms", new="timeout"),
+            ).message(),
+            "The 'timeout_ms' key is deprecated. "
+            "Please use 'timeout' instead.",
+        )
+
+
+class TestModule(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name)
+        sys.path.insert(0, tmpdir.name)
+        self.addCleanup(sys.path.remove, tmpdir.name)
+
+        meta_path = list(sys.meta_path)
+        self.addCleanup(sys.meta_path.__setitem__, slice(None), meta_path)
+
+        self.package = f"_regret_test_{self.id().rpartition('.')[2]}"
+        package = self.path / self.package
+        package.mkdir()
+        (package / "__init__.py").touch()
+        (package / "legacy.py").write_text("VALUE = 12\n")
+        (package / "modern.py").write_text("VALUE = 13\n")
+        self.addCleanup(self.unimport)
+
+    def unimport(self):
+        for name in list(sys.modules):
+            if name.partition(".")[0] == self.package:
+                del sys.modules[name]
+
+    def test_module(self):
+        name = f"{self.package}.legacy"
+        self.regret.module(version="1.2.3", name=name)
+        with self.recorder.expect(kind=Module(name=name)):
+            module = importlib.import_module(name)
+        self.assertEqual(module.VALUE, 12)
+
+    def test_module_emits_once(self):
+        name = f"{self.package}.legacy"
+        self.regret.module(version="1.2.3", name=name)
+        with self.recorder.expect(kind=Module(name=name)):
+            importlib.import_module(name)
+        with self.recorder.expect_clean():
+            importlib.import_module(name)
+
+    def test_module_with_removal_date_and_addendum(self):
+        name = f"{self.package}.legacy"
+        removal_date = date(year=2012, month=12, day=12)
+        self.regret.module(
+            version="1.2.3",
+            name=name,
+            removal_date=removal_date,
+            addendum="Use modern.",
+        )
+        with self.recorder.expect(
+            kind=Module(name=name),
+            removal_date=removal_date,
+            addendum="Use modern.",
+        ):
+            importlib.import_module(name)
+
+    def test_finding_does_not_emit(self):
+        name = f"{self.package}.legacy"
+        self.regret.module(version="1.2.3", name=name)
+        with self.recorder.expect_clean():
+            spec = importlib.util.find_spec(name)
+        self.assertIsNotNone(spec)
+        self.assertNotIn(name, sys.modules)
+
+    def test_missing_module_does_not_emit(self):
+        name = f"{self.package}.missing"
+        self.regret.module(version="1.2.3", name=name)
+        with self.recorder.expect_clean(), self.assertRaises(ImportError):
+            importlib.import_module(name)
+
+    def test_other_modules_do_not_emit(self):
+        self.regret.module(version="1.2.3", name=f"{self.package}.legacy")
+        with self.recorder.expect_clean():
+            module = importlib.import_module(f"{self.package}.modern")
+        self.assertEqual(module.VALUE, 13)
+
+    def test_deprecated_package(self):
+        self.regret.module(version="1.2.3", name=self.package)
+        with self.recorder.expect(kind=Module(name=self.package)):
+            importlib.import_module(f"{self.package}.modern")
+
+    def test_finder_is_installed_once(self):
+        self.regret.module(version="1.2.3", name=f"{self.package}.legacy")
+        self.regret.module(version="1.2.3", name=f"{self.package}.modern")
+        finders = [
+            each
+            for each in sys.meta_path
+            if type(each).__module__ == "regret._modules"
+        ]
+        self.assertEqual(len(finders), 1)
+
+
+class TestModuleAttribute(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+        self.module = ModuleType("regret.tests._deprecated_attributes")
+        self.module.undeprecated = 37
+        sys.modules[self.module.__name__] = self.module
+        self.addCleanup(sys.modules.pop, self.module.__name__)
+
+    def deprecate(self, **kwargs):
+        self.regret.module_attribute(
+            version="1.2.3",
+            module=self.module.__name__,
+            **kwargs,
+        )
+
+    def test_module_attribute(self):
+        self.deprecate(name="FOO", value=12)
+        kind = ModuleAttribute(module=self.module, name="FOO")
+        with self.recorder.expect_deprecations(
+            Deprecation(kind=kind),
+            Deprecation(kind=kind),
+        ):
+            self.assertEqual((self.module.FOO, self.module.FOO), (12, 12))
+
+    def test_module_attribute_from_import(self):
+        self.deprecate(name="FOO", value=12)
+        with self.recorder.expect(
+            kind=ModuleAttribute(module=self.module, name="FOO"),
+        ):
+            exec(f"from {self.module.__name__} import FOO", {})
+
+    def test_module_attribute_with_replacement_and_removal_date(self):
+        removal_date = date(year=2012, month=12, day=12)
+        self.deprecate(
+            name="FOO",
+            value=12,
+            replacement=add,
+            removal_date=removal_date,
+            addendum="Seriously.",
+        )
+        with self.recorder.expect(
+            kind=ModuleAttribute(module=self.module, name="FOO"),
+            replacement=add,
+            removal_date=removal_date,
+            addendum="Seriously.",
+        ):
+            self.assertEqual(self.module.FOO, 12)
+
+    def test_module_attribute_promoted(self):
+        self.deprecate(name="FOO", value=12, promote=True)
+        with self.recorder.expect(
+            kind=ModuleAttribute(module=self.module, name="FOO"),
+        ):
+            self.assertEqual(self.module.FOO, 12)
+        with self.recorder.expect_clean():
+            self.assertEqual(self.module.FOO, 12)
+        self.assertEqual(vars(self.module)["FOO"], 12)
+
+    def test_module_attribute_replaces_existing_value(self):
+        self.module.FOO = 37
+        self.deprecate(name="FOO", value=12)
+        with self.recorder.expect(
+            kind=ModuleAttribute(module=self.module, name="FOO"),
+        ):
+            self.assertEqual(self.module.FOO, 12)
+
+    def test_multiple_module_attributes(self):
+        self.deprecate(name="FOO", value=12)
+        self.deprecate(name="BAR", value=13)
+        with self.recorder.expect_deprecations(
+            Deprecation(kind=ModuleAttribute(module=self.module, name="BAR")),
+            Deprecation(kind=ModuleAttribute(module=self.module, name="FOO")),
+        ):
+            self.assertEqual((self.module.BAR, self.module.FOO), (13, 12))
+
+    def test_other_attributes_are_unaffected(self):
+        self.deprecate(name="FOO", value=12)
+        with self.recorder.expect_clean():
+            self.assertEqual(self.module.undeprecated, 37)
+
+    def test_missing_attributes(self):
+        self.deprecate(name="FOO", value=12)
+        with self.recorder.expect_clean(), self.assertRaises(AttributeError):
+            self.module.BAR  # noqa: B018
+
+    def test_existing_module_getattr_is_used_for_other_attributes(self):
+        self.module.__getattr__ = lambda name: name * 2
+        self.deprecate(name="FOO", value=12)
+        with self.recorder.expect_clean():
+            self.assertEqual(self.module.BAR, "BARBAR")
+
+    def test_unknown_module(self):
+        with self.assertRaises(KeyError):
+            self.regret.module_attribute(
+                version="1.2.3",
+                module="regret.tests._does_not_exist",
+                name="FOO",
+                value=12,
+            )
+
+
+class TestModuleAlias(TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.regret = regret.Deprecator(emit=self.recorder.emit)
+        self.module = ModuleType("regret.tests._deprecated_aliases")
+        sys.modules[self.module.__name__] = self.module
+        self.addCleanup(sys.modules.pop, self.module.__name__)
+
+    def deprecate(self, **kwargs):
+        self.regret.module_alias(
+            version="1.2.3",
+            module=self.module.__name__,
+            **kwargs,
+        )
+
+    def test_module_alias(self):
+        self.deprecate(target="regret.tests.test_api:add")
+        kind = ModuleAttribute(module=self.module, name="add")
+        with self.recorder.expect_deprecations(
+            Deprecation(kind=kind, replacement=add),
+            Deprecation(kind=kind, replacement=add),
+        ):
+            self.assertEqual((self.module.add, self.module.add), (add, add))
+
+    def test_module_alias_with_name(self):
+        self.deprecate(target="regret.tests.test_api:add", name="plus")
+        with self.recorder.expect(
+            kind=ModuleAttribute(module=self.module, name="plus"),
+            replacement=add,
+        ):
+            self.assertIs(self.module.plus, add)
+
+    def test_module_alias_nested_attribute(self):
+        self.deprecate(target="regret.tests.test_api:Calculator.better")
+        with self.recorder.expect(
+            kind=ModuleAttribute(module=self.module, name="better"),
+            replacement=Calculator.better,
+        ):
+            self.assertIs(self.module.better, Calculator.better)
+
+    def test_module_alias_is_lazy(self):
+        self.deprecate(target="regret.tests._nonexistent:Thing")
+        with self.recorder.expect_clean(), self.assertRaises(ImportError):
+            self.module.Thing  # noqa: B018
+
+    def test_module_alias_with_removal_date_and_addendum(self):
+        removal_date = date(year=2012, month=12, day=12)
+        self.deprecate(
+            target="regret.tests.test_api:add",
+            removal_date=removal_date,
+            addendum="Seriously.",
+        )
+        with self.recorder.expect(
+            kind=ModuleAttribute(module=self.module, name="add"),
+            replacement=add,
+            removal_date=removal_date,
+            addendum="Seriously.",
+        ):
+            self.assertIs(self.module.add, add)
+
+    def test_module_alias_promoted(self):
+        self.deprecate(target="regret.tests.test_api:add", promote=True)
+        with self.recorder.expect(
+            kind=ModuleAttribute(module=self.module, name="add"),
+            replacement=add,
+        ):
+            self.assertIs(self.module.add, add)
+        with self.recorder.expect_clean():
+            self.assertIs(self.module.add, add)
+
+
 def public_members(thing):
     return {
         name
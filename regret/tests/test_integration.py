@@ -1,9 +1,15 @@
 from datetime import date
+from types import ModuleType
 import collections
+import enum
+import pickle
 import sys
+import warnings
 
 from twisted.trial.unittest import SynchronousTestCase
 
+from regret import emitted
+from regret.emitted import Deprecation
 import regret
 
 
@@ -16,12 +22,22 @@ class Calculator:
     def calculate(self):
         return 12
 
+    @regret.callable(version="1.2.3")
+    @property
+    def value(self):
+        return 12
+
 
 CalculatorWithDeprecatedInheritance = regret.inheritance(version="1.2.3")(
     Calculator,
 )
 
 
+@regret.Class(version="1.2.3")
+class DeprecatedCalculator(Calculator):
+    pass
+
+
 @regret.callable(version="1.2.3")
 def calculate():
     return 12
@@ -32,6 +48,11 @@ def add(x, y):
     return x + y
 
 
+@regret.callable(version="1.2.3")
+def count(n):
+    yield from range(n)
+
+
 @regret.parameter(version="1.2.3", name="z")
 def add3(x, y, z):
     return x + y + z
@@ -48,6 +69,16 @@ def add5(v, w, x, y, z):
     return v + w + x + y + z
 
 
+@regret.parameter_value(version="1.2.3", name="mode", values={"legacy"})
+def load(mode="modern"):
+    return mode
+
+
+@regret.parameter_type(version="1.2.3", name="path", types=bytes)
+def read(path):
+    return path
+
+
 @regret.callable(version="1.2.3", replacement=Calculator)
 def calculator_fn():
     return 9
@@ -63,6 +94,7 @@ class TestRegret(SynchronousTestCase):
         message,
         fn,
         *,
+        category=regret.category,
         filename=None,
         args=(),
         kwargs={},
@@ -74,7 +106,7 @@ class TestRegret(SynchronousTestCase):
         # Sigh... assertWarns takes positional args positionally,
         # instead of as a sequence.
         return self.assertWarns(
-            DeprecationWarning,
+            category,
             message,
             filename,
             fn,
@@ -123,6 +155,14 @@ class TestRegret(SynchronousTestCase):
         )
         self.assertEqual(result, "foo")
 
+    def test_generator_function(self):
+        result = self.assertDeprecated(
+            message="count is deprecated.",
+            filename=__file__,
+            fn=lambda: count(2),
+        )
+        self.assertEqual(list(result), [0, 1])
+
     def test_method(self):
         calculator = Calculator()
         result = self.assertDeprecated(
@@ -131,6 +171,22 @@ class TestRegret(SynchronousTestCase):
         )
         self.assertEqual(result, 12)
 
+    def test_class(self):
+        result = self.assertDeprecated(
+            message="DeprecatedCalculator is deprecated.",
+            fn=DeprecatedCalculator,
+        )
+        self.assertIsInstance(result, DeprecatedCalculator)
+
+    def test_property(self):
+        calculator = Calculator()
+        result = self.assertDeprecated(
+            message="Calculator.value is deprecated.",
+            filename=__file__,
+            fn=lambda: calculator.value,
+        )
+        self.assertEqual(result, 12)
+
     def test_dunder_call(self):
         calculator = Calculator()
         result = self.assertDeprecated(
@@ -148,6 +204,7 @@ class TestRegret(SynchronousTestCase):
 
         self.assertDeprecated(
             message="etaluclac is deprecated.",
+            category=etacerped.category,
             fn=calculate,
         )
 
@@ -299,6 +356,28 @@ class TestRegret(SynchronousTestCase):
             kwargs=dict(w=0, x=1, y=2),
         )
 
+    def test_parameter_value(self):
+        result = self.assertDeprecated(
+            message=(
+                "Passing 'legacy' for the 'mode' parameter of load "
+                "is deprecated."
+            ),
+            fn=load,
+            kwargs=dict(mode="legacy"),
+        )
+        self.assertEqual(result, "legacy")
+
+    def test_parameter_type(self):
+        result = self.assertDeprecated(
+            message=(
+                "Passing bytes objects for the 'path' parameter of read "
+                "is deprecated."
+            ),
+            fn=read,
+            args=(b"foo",),
+        )
+        self.assertEqual(result, b"foo")
+
     def test_mixed_function_parameters(self):
         add5(v=0, w=0, x=1, y=2)
         self.assertEqual(
@@ -323,6 +402,173 @@ class TestRegret(SynchronousTestCase):
             fn=subclass,
         )
 
+    def test_module_attribute(self):
+        module = ModuleType("regret.tests._integration_attributes")
+        sys.modules[module.__name__] = module
+        self.addCleanup(sys.modules.pop, module.__name__)
+        regret.module_attribute(
+            version="1.2.3",
+            module=module.__name__,
+            name="FOO",
+            value=12,
+        )
+
+        result = self.assertDeprecated(
+            message="regret.tests._integration_attributes.FOO is deprecated.",
+            filename=__file__,
+            fn=lambda: module.FOO,
+        )
+        self.assertEqual(result, 12)
+
+    def test_mapping_keys(self):
+        config = regret.mapping_keys(
+            version="1.2.3",
+            mapping=dict(timeout=3),
+            renamed=dict(timeout_ms="timeout"),
+        )
+        result = self.assertDeprecated(
+            message=(
+                "The 'timeout_ms' key is deprecated. "
+                "Please use 'timeout' instead."
+            ),
+            filename=__file__,
+            fn=lambda: config["timeout_ms"],
+        )
+        self.assertEqual(result, 3)
+
+    def test_mapping_keys_initial_mapping(self):
+        result = self.assertDeprecated(
+            message=(
+                "The 'timeout_ms' key is deprecated. "
+                "Please use 'timeout' instead."
+            ),
+            filename=__file__,
+            fn=lambda: regret.mapping_keys(
+                version="1.2.3",
+                mapping=dict(timeout_ms=3),
+                renamed=dict(timeout_ms="timeout"),
+            ),
+        )
+        self.assertEqual(result, dict(timeout=3))
+
+    def test_mapping_keys_can_be_pickled(self):
+        deprecator = regret.Deprecator(category=FutureWarning)
+        config = deprecator.mapping_keys(
+            version="1.2.3",
+            mapping=dict(timeout=3),
+            renamed=dict(timeout_ms="timeout"),
+            removed={"verbose"},
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            config["verbose"] = True
+        unpickled = pickle.loads(pickle.dumps(config))
+        self.assertEqual(unpickled, dict(timeout=3))
+
+        result = self.assertDeprecated(
+            message="The 'verbose' key is deprecated.",
+            category=FutureWarning,
+            filename=__file__,
+            fn=lambda: unpickled["verbose"],
+        )
+        self.assertTrue(result)
+        result = self.assertDeprecated(
+            message=(
+                "The 'timeout_ms' key is deprecated. "
+                "Please use 'timeout' instead."
+            ),
+            category=FutureWarning,
+            filename=__file__,
+            fn=lambda: unpickled["timeout_ms"],
+        )
+        self.assertEqual(result, 3)
+
+    def test_enum_member(self):
+        @regret.enum_member(version="1.2.3", name="RED")
+        class Color(enum.Enum):
+            RED = "red"
+
+        name = f"{Color.__qualname__}.RED"
+        lookups = lambda: Color.RED, lambda: Color["RED"], lambda: Color("red")
+        for fn in lookups:
+            result = self.assertDeprecated(
+                message=f"{name} is deprecated.",
+                filename=__file__,
+                fn=fn,
+            )
+            self.assertEqual(result.value, "red")
+
+    def test_categories_are_per_deprecator(self):
+        deprecator = regret.Deprecator()
+        self.assertTrue(issubclass(deprecator.category, regret.RegretWarning))
+        self.assertTrue(issubclass(deprecator.category, DeprecationWarning))
+        self.assertIsNot(deprecator.category, regret.category)
+
+    def test_deprecators_can_be_pickled(self):
+        deprecator = regret.Deprecator(current_version="1.2.3")
+        unpickled = pickle.loads(pickle.dumps(deprecator))
+        self.assertEqual(unpickled, deprecator)
+        self.assertTrue(issubclass(unpickled.category, regret.RegretWarning))
+
+    def test_deprecators_with_categories_can_be_pickled(self):
+        deprecator = regret.Deprecator(category=FutureWarning)
+        unpickled = pickle.loads(pickle.dumps(deprecator))
+        self.assertIs(unpickled.category, FutureWarning)
+
+    def test_warnings_can_be_pickled(self):
+        @regret.callable(version="1.2.3")
+        def calculate():
+            return 12
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with self.assertRaises(regret.RegretWarning) as e:
+                calculate()
+        unpickled = pickle.loads(pickle.dumps(e.exception))
+        self.assertIsInstance(unpickled, regret.RegretWarning)
+        self.assertEqual(unpickled.args, e.exception.args)
+
+    def test_warning_carries_deprecation(self):
+        @regret.callable(version="1.2.3")
+        def calculate():
+            return 12
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            calculate()
+        [warning] = caught
+        self.assertEqual(
+            warning.message.deprecation,
+            Deprecation(kind=emitted.Callable(object=calculate)),
+        )
+
+    def test_filtering_by_category(self):
+        noisy = regret.Deprecator()
+
+        @noisy.callable(version="1.2.3")
+        def calculate():
+            return 12
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=noisy.category)
+            self.assertEqual(calculate(), 12)
+        self.assertEqual(self.flushWarnings(), [])
+
+    def test_with_category(self):
+        class CalculationWarning(regret.RegretWarning):
+            pass
+
+        @regret.with_category(CalculationWarning).callable(version="1.2.3")
+        def calculate():
+            return 12
+
+        result = self.assertDeprecated(
+            message=f"{calculate.__qualname__} is deprecated.",
+            category=CalculationWarning,
+            fn=calculate,
+        )
+        self.assertEqual(result, 12)
+
     def test_nested_callable(self):
         """
         Ensure we do something sensible with things that are deprecated as
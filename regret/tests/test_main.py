@@ -0,0 +1,146 @@
+"""
+Tests for the command line interface.
+"""
+
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from unittest import TestCase
+import sys
+
+from regret.__main__ import main
+
+
+class TestOverdue(TestCase):
+    def setUp(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name)
+        sys.path.insert(0, tmpdir.name)
+        self.addCleanup(sys.path.remove, tmpdir.name)
+
+        self.package = f"_regret_test_{self.id().rpartition('.')[2]}"
+        self.addCleanup(self.unimport)
+
+        package = self.path / self.package
+        package.mkdir()
+        (package / "__init__.py").touch()
+        (package / "sub").mkdir()
+        (package / "sub" / "__init__.py").touch()
+
+    def unimport(self):
+        for name in list(sys.modules):
+            if name.partition(".")[0] == self.package:
+                del sys.modules[name]
+
+    def write(self, relative, source):
+        path = self.path / self.package / relative
+        path.write_text(dedent(source))
+        return path
+
+    def run_main(self, *argv):
+        stdout, stderr = StringIO(), StringIO()
+        status = main(
+            ["overdue", self.package, "--today", "2012-12-12", *argv],
+            stdout=stdout,
+            stderr=stderr,
+        )
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_overdue(self):
+        path = self.write(
+            "sub/legacy.py",
+            """\
+            from datetime import date
+            import regret
+
+            @regret.callable(version="1.2.3", removal_date=date(2012, 12, 1))
+            def calculate():
+                return 12
+            """,
+        )
+        self.write(
+            "modern.py",
+            """\
+            from datetime import date
+            import regret
+
+            @regret.callable(version="1.2.3", removal_date=date(2013, 1, 1))
+            def calculate():
+                return 12
+            """,
+        )
+        status, stdout, stderr = self.run_main("--jobs", "2")
+        self.assertEqual(
+            (status, stdout, stderr),
+            (
+                1,
+                (
+                    f"{path}:4: {self.package}.sub.legacy.calculate "
+                    "(callable) was deprecated in 1.2.3 and was due for "
+                    "removal on 2012-12-01.\n"
+                ),
+                "",
+            ),
+        )
+
+    def test_policy(self):
+        path = self.write(
+            "legacy.py",
+            """\
+            from datetime import date
+            from regret import Deprecator
+            from regret.policies import DaysAfterRelease
+
+            regret = Deprecator(
+                policy=DaysAfterRelease(
+                    days=30,
+                    released={"1.2.3": date(2012, 11, 1)},
+                ),
+            )
+
+            @regret.callable(version="1.2.3", replacement="add")
+            def calculate():
+                return 12
+            """,
+        )
+        status, stdout, _ = self.run_main()
+        self.assertEqual(
+            (status, stdout),
+            (
+                1,
+                (
+                    f"{path}:12: {self.package}.legacy.calculate (callable) "
+                    "was deprecated in 1.2.3 and was due for removal on "
+                    "2012-12-01. Use add instead.\n"
+                ),
+            ),
+        )
+
+    def test_nothing_overdue(self):
+        self.write(
+            "modern.py",
+            """\
+            import regret
+
+            @regret.callable(version="1.2.3")
+            def calculate():
+                return 12
+            """,
+        )
+        self.assertEqual(self.run_main(), (0, "", ""))
+
+    def test_import_errors(self):
+        self.write("broken.py", "raise RuntimeError('Boom!')\n")
+        self.assertEqual(
+            self.run_main(),
+            (
+                0,
+                "",
+                (
+                    f"Could not import {self.package}.broken: "
+                    "RuntimeError: Boom!\n"
+                ),
+            ),
+        )
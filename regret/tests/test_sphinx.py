@@ -0,0 +1,207 @@
+"""
+Tests for the Sphinx extension.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from unittest import TestCase, skipIf
+import sys
+
+from regret.inventory import Entry, Inventory
+
+try:
+    from sphinx.cmd.build import build_main
+
+    from regret.sphinx import _Index
+except ImportError:  # pragma: no cover
+    build_main = None
+
+
+@skipIf(build_main is None, "Sphinx is not installed.")
+class TestDeprecationIndex(TestCase):
+    def setUp(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name)
+        sys.path.insert(0, tmpdir.name)
+        self.addCleanup(sys.path.remove, tmpdir.name)
+
+        # Module names are unique per test, as the inventory is global.
+        self.package = f"_regret_test_{self.id().rpartition('.')[2]}"
+        self.addCleanup(self.unimport)
+        (self.path / f"{self.package}.py").write_text(
+            dedent(
+                """\
+                from datetime import date
+                import regret
+
+                def better():
+                    '''
+                    Better.
+                    '''
+
+                @regret.callable(
+                    version="1.2.0",
+                    replacement=better,
+                    removal_date=date(2025, 1, 1),
+                )
+                def calculate():
+                    '''
+                    Calculate.
+                    '''
+
+                @regret.parameter(version="1.10.0", name="y")
+                def add(x, y=0):
+                    '''
+                    Add.
+                    '''
+
+                class Point:
+                    '''
+                    A point.
+                    '''
+
+                    x = 1
+
+                regret.attribute(version="1.2.0", name="x")(Point)
+
+                def undeprecated():
+                    '''
+                    Fine.
+                    '''
+                """,
+            ),
+        )
+
+        self.docs = self.path / "docs"
+        self.docs.mkdir()
+        (self.docs / "conf.py").write_text(
+            'extensions = ["regret.sphinx"]\n',
+        )
+        self.write(
+            "index",
+            """\
+            Index
+            =====
+
+            .. toctree::
+
+               api
+               deprecations
+            """,
+        )
+        self.write(
+            "api",
+            f"""\
+            API
+            ===
+
+            .. automodule:: {self.package}
+               :members:
+            """,
+        )
+        self.write(
+            "deprecations",
+            """\
+            Deprecations
+            ============
+
+            .. regret-deprecations::
+            """,
+        )
+
+    def unimport(self):
+        sys.modules.pop(self.package, None)
+
+    def write(self, docname, contents):
+        (self.docs / f"{docname}.rst").write_text(dedent(contents))
+
+    def build(self, *argv):
+        output = self.path / "build"
+        argv = ["-b", "text", "-q", "-n", "-W", *argv]
+        status = build_main([*argv, str(self.docs), str(output)])
+        self.assertEqual(status, 0)
+        return (output / "deprecations.txt").read_text()
+
+    def test_index(self):
+        self.assertEqual(
+            self.build(),
+            dedent(
+                """\
+                Deprecations
+                ************
+
+                -[ Deprecated in 1.2.0 ]-
+
+                To be removed on or after 2025-01-01
+                   * "calculate" (callable), replaced by better
+
+                With no removal date
+                   * "Point.x" (attribute)
+
+                -[ Deprecated in 1.10.0 ]-
+
+                With no removal date
+                   * "add(y)" (parameter)
+                """,
+            ),
+        )
+
+    def test_incremental(self):
+        full = self.build()
+        self.write("other", ":orphan:\n\nOther\n=====\n")
+        self.assertEqual(self.build(), full)
+
+    def test_removed_documents(self):
+        self.build()
+        self.write(
+            "index",
+            """\
+            Index
+            =====
+
+            .. toctree::
+
+               deprecations
+            """,
+        )
+        (self.docs / "api.rst").unlink()
+        self.assertEqual(self.build(), "Deprecations\n************\n")
+
+    def test_parallel(self):
+        for i in range(6):
+            self.write(f"other{i}", f"Other {i}\n=======\n")
+        self.write(
+            "index",
+            """\
+            Index
+            =====
+
+            .. toctree::
+               :glob:
+
+               *
+            """,
+        )
+        serial = self.build("-E")
+        self.assertEqual(self.build("-E", "-j", "2"), serial)
+
+
+@skipIf(build_main is None, "Sphinx is not installed.")
+class TestIndex(TestCase):
+    def test_replaced_entries(self):
+        inventory = Inventory()
+        index = _Index(inventory=inventory)
+        entry, replacement = (
+            Entry(name="calc", module="foo", kind="callable", version=version)
+            for version in ["1", "2"]
+        )
+
+        inventory.add(entry)
+        found = index.entries_for(what="function", name="foo.calc", object=0)
+        self.assertEqual(found, [entry])
+
+        inventory.add(replacement)
+        found = index.entries_for(what="function", name="foo.calc", object=0)
+        self.assertEqual(found, [replacement])
@@ -2,7 +2,11 @@
 Integration tests for the testing helper(s).
 """
 
+from collections import deque
 from unittest import TestCase
+import asyncio
+import inspect
+import threading
 
 from regret import Deprecator, emitted, testing
 
@@ -109,3 +113,325 @@ class TestRecorder(TestCase):
         with self.assertRaises(testing.ExpectedDifferentDeprecations):
             with recorder.expect_clean():
                 deprecated()
+
+    def test_it_only_compares_deprecations_from_within_the_block(self):
+        recorder = testing.Recorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+        deprecated()
+
+        with recorder.expect(kind=emitted.Callable(object=deprecated)):
+            deprecated()
+
+
+class TestRingBufferRecorder(TestCase):
+    def test_it_can_expect_a_deprecation(self):
+        recorder = testing.Recorder.ring_buffer(size=2)
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+
+        for _ in range(5):
+            deprecated()
+
+        with recorder.expect(kind=emitted.Callable(object=deprecated)):
+            deprecated()
+
+    def test_it_only_retains_the_most_recent_deprecations(self):
+        saw = deque(maxlen=2)
+        recorder = testing.Recorder(saw=saw)
+        regret = Deprecator(emit=recorder.emit)
+
+        first = regret.callable(version="1.2.3")(calculate)
+        second = regret.callable(version="1.2.3")(calculate)
+
+        first()
+        second()
+        second()
+
+        self.assertEqual(
+            list(saw),
+            [
+                emitted.Deprecation(kind=emitted.Callable(object=second)),
+                emitted.Deprecation(kind=emitted.Callable(object=second)),
+            ],
+        )
+
+    def test_it_errors_when_seeing_extra_deprecations(self):
+        recorder = testing.Recorder.ring_buffer(size=1)
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+
+        with self.assertRaises(testing.ExpectedDifferentDeprecations):
+            with recorder.expect(kind=emitted.Callable(object=deprecated)):
+                deprecated()
+                deprecated()
+
+    def test_it_compares_the_retained_deprecations_after_overflowing(self):
+        recorder = testing.Recorder.ring_buffer(size=1)
+        regret = Deprecator(emit=recorder.emit)
+
+        first = regret.callable(version="1.2.3")(calculate)
+        second = regret.callable(version="1.2.3")(calculate)
+
+        with recorder.expect_deprecations(
+            emitted.Deprecation(kind=emitted.Callable(object=first)),
+            emitted.Deprecation(kind=emitted.Callable(object=second)),
+        ):
+            first()
+            second()
+
+        with self.assertRaises(testing.ExpectedDifferentDeprecations):
+            with recorder.expect_deprecations(
+                emitted.Deprecation(kind=emitted.Callable(object=second)),
+                emitted.Deprecation(kind=emitted.Callable(object=second)),
+            ):
+                second()
+                first()
+
+
+class TestCountingRecorder(TestCase):
+    def test_it_counts_deprecations(self):
+        recorder = testing.CountingRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+
+        for _ in range(3):
+            deprecated()
+
+        self.assertEqual(
+            recorder.count(kind=emitted.Callable(object=deprecated)),
+            3,
+        )
+
+    def test_counts(self):
+        recorder = testing.CountingRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+        deprecated()
+        deprecated()
+
+        deprecation = emitted.Deprecation(
+            kind=emitted.Callable(object=deprecated),
+        )
+        self.assertEqual(recorder.counts, [(deprecation, 2)])
+
+    def test_unhashable_deprecations(self):
+        recorder = testing.CountingRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        @regret.parameter_value(version="1.2.3", name="mode", values=[[1]])
+        def configure(mode):
+            return mode
+
+        with recorder.expect(
+            kind=emitted.ParameterValue(
+                callable=configure,
+                parameter=inspect.signature(configure).parameters["mode"],
+                value=[1],
+            ),
+        ):
+            self.assertEqual(configure(mode=[1]), [1])
+
+    def test_nested_expectations(self):
+        recorder = testing.CountingRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        first = regret.callable(version="1.2.3")(calculate)
+        second = regret.callable(version="1.2.3")(calculate)
+
+        with recorder.expect_deprecations(
+            emitted.Deprecation(kind=emitted.Callable(object=first)),
+            emitted.Deprecation(kind=emitted.Callable(object=second)),
+        ):
+            first()
+            with recorder.expect(kind=emitted.Callable(object=second)):
+                second()
+
+    def test_it_can_expect_a_deprecation(self):
+        recorder = testing.CountingRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+        deprecated()
+
+        with recorder.expect(kind=emitted.Callable(object=deprecated)):
+            deprecated()
+
+    def test_it_ignores_order(self):
+        recorder = testing.CountingRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        first = regret.callable(version="1.2.3")(calculate)
+        second = regret.callable(version="1.2.3")(calculate)
+
+        with recorder.expect_deprecations(
+            emitted.Deprecation(kind=emitted.Callable(object=first)),
+            emitted.Deprecation(kind=emitted.Callable(object=second)),
+            emitted.Deprecation(kind=emitted.Callable(object=second)),
+        ):
+            second()
+            first()
+            second()
+
+    def test_it_errors_for_missing_deprecations(self):
+        recorder = testing.CountingRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+
+        with self.assertRaises(testing.ExpectedDifferentDeprecations):
+            with recorder.expect_deprecations(
+                emitted.Deprecation(kind=emitted.Callable(object=deprecated)),
+                emitted.Deprecation(kind=emitted.Callable(object=deprecated)),
+            ):
+                deprecated()
+
+    def test_it_errors_for_extra_deprecations(self):
+        recorder = testing.CountingRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+
+        with self.assertRaises(testing.ExpectedDifferentDeprecations):
+            with recorder.expect(kind=emitted.Callable(object=deprecated)):
+                deprecated()
+                deprecated()
+
+    def test_it_can_expect_no_deprecations(self):
+        recorder = testing.CountingRecorder()
+        with recorder.expect_clean():
+            pass
+
+    def test_it_fails_for_unexpected_deprecations(self):
+        recorder = testing.CountingRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+
+        with self.assertRaises(testing.ExpectedDifferentDeprecations):
+            with recorder.expect_clean():
+                deprecated()
+
+
+class TestContextRecorder(TestCase):
+    def test_it_can_expect_a_deprecation(self):
+        recorder = testing.ContextRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+
+        with recorder.expect(kind=emitted.Callable(object=deprecated)):
+            deprecated()
+
+    def test_it_errors_for_missing_deprecations(self):
+        recorder = testing.ContextRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+
+        with self.assertRaises(testing.ExpectedDifferentDeprecations):
+            with recorder.expect(kind=emitted.Callable(object=deprecated)):
+                pass
+
+    def test_it_fails_for_unexpected_deprecations(self):
+        recorder = testing.ContextRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+
+        with self.assertRaises(testing.ExpectedDifferentDeprecations):
+            with recorder.expect_clean():
+                deprecated()
+
+    def test_it_ignores_deprecations_outside_of_expectations(self):
+        recorder = testing.ContextRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+        deprecated()
+
+        with recorder.expect_clean():
+            pass
+
+    def test_nested_expectations(self):
+        recorder = testing.ContextRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        first = regret.callable(version="1.2.3")(calculate)
+        second = regret.callable(version="1.2.3")(calculate)
+
+        with recorder.expect_deprecations(
+            emitted.Deprecation(kind=emitted.Callable(object=first)),
+            emitted.Deprecation(kind=emitted.Callable(object=second)),
+        ):
+            first()
+            with recorder.expect(kind=emitted.Callable(object=second)):
+                second()
+
+    def test_threads_do_not_see_each_others_deprecations(self):
+        recorder = testing.ContextRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        first = regret.callable(version="1.2.3")(calculate)
+        second = regret.callable(version="1.2.3")(calculate)
+
+        barrier = threading.Barrier(2)
+        errors = []
+
+        def expect(deprecated):
+            expectation = recorder.expect(
+                kind=emitted.Callable(object=deprecated),
+            )
+            try:
+                with expectation:
+                    barrier.wait()
+                    deprecated()
+                    barrier.wait()
+            except testing.ExpectedDifferentDeprecations as e:
+                errors.append(e)  # pragma: no cover
+
+        threads = [
+            threading.Thread(target=expect, args=(each,))
+            for each in [first, second]
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+    def test_tasks_do_not_see_each_others_deprecations(self):
+        recorder = testing.ContextRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        first = regret.callable(version="1.2.3")(calculate)
+        second = regret.callable(version="1.2.3")(calculate)
+
+        async def expect(deprecated):
+            with recorder.expect(kind=emitted.Callable(object=deprecated)):
+                await asyncio.sleep(0)
+                deprecated()
+                await asyncio.sleep(0)
+
+        async def main():
+            await asyncio.gather(expect(first), expect(second))
+
+        asyncio.run(main())
+
+    def test_child_tasks_record_into_their_parent(self):
+        recorder = testing.ContextRecorder()
+        regret = Deprecator(emit=recorder.emit)
+
+        deprecated = regret.callable(version="1.2.3")(calculate)
+
+        async def main():
+            with recorder.expect(kind=emitted.Callable(object=deprecated)):
+                await asyncio.create_task(asyncio.to_thread(deprecated))
+
+        asyncio.run(main())